@@ -1,6 +1,6 @@
 from typing import AsyncGenerator
 
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from db.sessions import async_session
 
@@ -14,3 +14,13 @@ async def get_session() -> AsyncGenerator[AsyncSession, None]:
     """
     async with async_session() as session:
         yield session
+
+
+def get_session_maker() -> async_sessionmaker[AsyncSession]:
+    """Get the session maker, for sessions outliving the request handler.
+
+    Returns:
+        The session maker.
+
+    """
+    return async_session
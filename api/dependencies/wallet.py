@@ -1,9 +1,9 @@
 from typing import Annotated
 
-from fastapi import Depends, Query
+from fastapi import Query
 
 from enums.network import NetworkEnum
-from explorers.utils import get_explorer
+from explorers.registry import explorer_registry
 from usecases.wallet import WalletUsecase
 
 
@@ -24,16 +24,11 @@ def get_network(
     return network
 
 
-def get_wallet_usecase(
-    network: Annotated[NetworkEnum, Depends(get_network)],
-) -> WalletUsecase:
+def get_wallet_usecase() -> WalletUsecase:
     """Get the wallet usecase.
 
-    Args:
-        network: The network to use.
-
     Returns:
-        The wallet usecase.
+        The wallet usecase backed by the shared explorer registry.
 
     """
-    return WalletUsecase(explorer=get_explorer(network=network))
+    return WalletUsecase(explorers=explorer_registry)
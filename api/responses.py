@@ -0,0 +1,21 @@
+from typing import Any
+
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+
+class ModelJSONResponse(JSONResponse):
+    """JSON response rendering Pydantic models in one pass with pydantic-core.
+
+    Models are serialized straight to JSON bytes, which are the same as those
+    of FastAPI's default path of dumping, validating and serializing the model
+    again into a dict encoded by the json module. Other content is rendered by
+    the json module as before.
+
+    """
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, BaseModel):
+            return content.model_dump_json(by_alias=True).encode()
+
+        return super().render(content)
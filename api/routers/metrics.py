@@ -0,0 +1,11 @@
+from fastapi import APIRouter, Response
+
+import metrics
+
+router = APIRouter(tags=["Metrics"])
+
+
+@router.get(path="/metrics", summary="Get Prometheus metrics", include_in_schema=False)
+async def get_metrics() -> Response:
+    content, media_type = metrics.render()
+    return Response(content=content, media_type=media_type)
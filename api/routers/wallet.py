@@ -1,20 +1,34 @@
 from typing import Annotated
 
 from fastapi import APIRouter, Body, Depends
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from api.dependencies import db, wallet
+from api.routing import ModelResponseRoute
+from enums.export import ExportFormatEnum
 from enums.network import NetworkEnum
 from schemas import (
-    SortingAndPaginationParams,
+    WalletBatchRequest,
+    WalletBatchResponse,
+    WalletExportParams,
+    WalletHistoryParams,
     WalletInfo,
+    WalletLatestParams,
+    WalletLatestResponse,
     WalletRequest,
     WalletResponse,
 )
 from schemas.common import PaginatedResponse
-from tasks.wallet import save_wallet_info
+from settings import api_settings
+from tasks.wallet import wallets_info_buffer
 
-router = APIRouter(prefix="/wallet", tags=["Wallet"])
+router = APIRouter(prefix="/wallet", tags=["Wallet"], route_class=ModelResponseRoute)
+
+EXPORT_MEDIA_TYPES = {
+    ExportFormatEnum.NDJSON: "application/x-ndjson",
+    ExportFormatEnum.CSV: "text/csv",
+}
 
 
 @router.post(path="", summary="Get wallet info")
@@ -23,17 +37,77 @@ async def get_wallet_info(
     data: Annotated[WalletRequest, Body(description="Wallet request data")],
     usecase: Annotated[wallet.WalletUsecase, Depends(wallet.get_wallet_usecase)],
 ) -> WalletInfo:
-    wallet_info = await usecase.get_wallet_info(address=data.address)
-    await save_wallet_info.kiq(
-        network=network, wallet_info=wallet_info.model_dump(mode="json")
-    )
+    wallet_info = await usecase.get_wallet_info(network=network, address=data.address)
+    await wallets_info_buffer.add(item=wallet_info.model_dump(mode="json"))
     return wallet_info
 
 
+@router.post(path="/batch", summary="Get wallets info")
+async def get_wallets_info(
+    network: Annotated[NetworkEnum, Depends(wallet.get_network)],
+    data: Annotated[WalletBatchRequest, Body(description="Wallet batch request data")],
+    usecase: Annotated[wallet.WalletUsecase, Depends(wallet.get_wallet_usecase)],
+) -> WalletBatchResponse:
+    wallets_info = await usecase.get_wallets_info(
+        network=network, addresses=data.addresses
+    )
+    for item in wallets_info.results:
+        if item.result is not None:
+            await wallets_info_buffer.add(item=item.result.model_dump(mode="json"))
+    return wallets_info
+
+
 @router.get(path="/history", summary="Get wallet history")
 async def get_wallet_history(
-    data: Annotated[SortingAndPaginationParams, Depends(SortingAndPaginationParams)],
+    data: Annotated[WalletHistoryParams, Depends(WalletHistoryParams)],
     session: Annotated[AsyncSession, Depends(db.get_session)],
     usecase: Annotated[wallet.WalletUsecase, Depends(wallet.get_wallet_usecase)],
 ) -> PaginatedResponse[WalletResponse]:
-    return await usecase.get_history(session=session, data=data)
+    return await usecase.get_history(
+        session=session,
+        data=data,
+        count_strategy=api_settings.history_count_strategy,
+    )
+
+
+@router.get(
+    path="/history/export",
+    summary="Export wallet history",
+    response_class=StreamingResponse,
+)
+async def export_wallet_history(
+    data: Annotated[WalletExportParams, Depends(WalletExportParams)],
+    session_maker: Annotated[
+        async_sessionmaker[AsyncSession], Depends(db.get_session_maker)
+    ],
+    usecase: Annotated[wallet.WalletUsecase, Depends(wallet.get_wallet_usecase)],
+) -> StreamingResponse:
+    return StreamingResponse(
+        content=usecase.export_history(session_maker=session_maker, data=data),
+        media_type=EXPORT_MEDIA_TYPES[data.format],
+        headers={
+            "Content-Disposition": f'attachment; filename="wallets.{data.format}"'
+        },
+    )
+
+
+@router.get(path="/{network}/{address}/latest", summary="Get latest wallet info")
+async def get_latest_wallet_info(
+    network: NetworkEnum,
+    address: str,
+    data: Annotated[WalletLatestParams, Depends(WalletLatestParams)],
+    session: Annotated[AsyncSession, Depends(db.get_session)],
+    usecase: Annotated[wallet.WalletUsecase, Depends(wallet.get_wallet_usecase)],
+) -> WalletLatestResponse:
+    latest = await usecase.get_latest_wallet_info(
+        session=session, network=network, address=address, max_age=data.max_age
+    )
+    if latest is not None:
+        return latest
+
+    wallet_info = await usecase.get_wallet_info(network=network, address=address)
+    await wallets_info_buffer.add(item=wallet_info.model_dump(mode="json"))
+    return WalletLatestResponse(
+        **wallet_info.model_dump(exclude={"missing_fields", "fetched_at"}),
+        updated_at=wallet_info.fetched_at,
+    )
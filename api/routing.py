@@ -0,0 +1,61 @@
+import dataclasses
+import functools
+import inspect
+from typing import Any, Callable, Coroutine
+
+from fastapi import Request, Response
+from fastapi.routing import APIRoute
+
+from api.responses import ModelJSONResponse
+
+
+class ModelResponseRoute(APIRoute):
+    """Route returning its response model without serializing it twice.
+
+    When the endpoint returns an instance of the response model, FastAPI would
+    dump it to a dict, validate the dict against the model and serialize the
+    result again. The model is trusted instead and rendered directly by
+    `ModelJSONResponse`. Endpoints filtering the model fields, using the
+    `Response` parameter or returning anything else keep the default path.
+
+    """
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        if not self._is_direct():
+            return super().get_route_handler()
+
+        dependant = self.dependant
+        self.dependant = dataclasses.replace(
+            dependant, call=self._wrap(call=dependant.call)
+        )
+        try:
+            return super().get_route_handler()
+        finally:
+            self.dependant = dependant
+
+    def _is_direct(self) -> bool:
+        return (
+            inspect.isclass(self.response_model)
+            and inspect.iscoroutinefunction(self.dependant.call)
+            and self.dependant.response_param_name is None
+            and self.response_model_include is None
+            and self.response_model_exclude is None
+            and self.response_model_by_alias
+            and not self.response_model_exclude_unset
+            and not self.response_model_exclude_defaults
+            and not self.response_model_exclude_none
+        )
+
+    def _wrap(self, call: Any) -> Callable[..., Coroutine[Any, Any, Any]]:
+        response_model = self.response_model
+        status_code = self.status_code or 200
+
+        @functools.wraps(call)
+        async def endpoint(**values: Any) -> Any:
+            content = await call(**values)
+            if type(content) is not response_model:
+                return content
+
+            return ModelJSONResponse(content=content, status_code=status_code)
+
+        return endpoint
@@ -0,0 +1,4 @@
+from benchmarks import explorer, history, serialization  # noqa: F401
+from benchmarks.runner import main
+
+main()
@@ -0,0 +1,74 @@
+from contextlib import asynccontextmanager
+from functools import partial
+from typing import AsyncIterator
+from unittest.mock import patch
+
+import httpx
+
+from benchmarks import fake_tron
+from benchmarks.runner import Call, Options, register
+from enums.network import NetworkEnum
+from explorers.coalescing import CoalescingExplorer
+from explorers.metered import MeteredExplorer
+from explorers.registry import ExplorerRegistry
+from explorers.tron import TronExplorer
+from settings.explorer import explorer_settings
+from usecases import WalletUsecase
+
+ADDRESS = "TR7NHqjeKQxGTCi8q8ZY4pL8otSzgjLj6t"
+
+
+def create_explorer(network: NetworkEnum) -> CoalescingExplorer:
+    """Create the uncached explorer chain over the in-process fake TronGrid.
+
+    Args:
+        network: The network of the explorer.
+
+    Returns:
+        The explorer.
+
+    """
+    with patch(
+        "explorers.tron.httpx.AsyncClient",
+        partial(httpx.AsyncClient, transport=httpx.MockTransport(fake_tron.handle)),
+    ):
+        explorer = TronExplorer()
+
+    return CoalescingExplorer(
+        explorer=MeteredExplorer(explorer=explorer, network=network)
+    )
+
+
+@asynccontextmanager
+async def create_registry() -> AsyncIterator[ExplorerRegistry]:
+    """Create a registry of explorers over the in-process fake TronGrid.
+
+    Explorers are created on first use, so the API key is patched for as long
+    as the registry lives, and the global settings are left untouched.
+
+    Yields:
+        The registry.
+
+    """
+    registry = ExplorerRegistry(factory=create_explorer)
+
+    with patch.object(
+        explorer_settings,
+        "tron_api_key",
+        explorer_settings.tron_api_key or "benchmark",
+    ):
+        try:
+            yield registry
+        finally:
+            await registry.close()
+
+
+@register(name="usecase.get_wallet_info")
+@asynccontextmanager
+async def get_wallet_info(options: Options) -> AsyncIterator[Call]:
+    async with create_registry() as registry:
+        yield partial(
+            WalletUsecase(explorers=registry).get_wallet_info,
+            network=NetworkEnum.TRON,
+            address=ADDRESS,
+        )
@@ -0,0 +1,50 @@
+import json
+
+import httpx
+
+ACCOUNT = {"balance": 1_500_000, "create_time": 1_600_000_000_000}
+ACCOUNT_RESOURCE = {
+    "freeNetLimit": 600,
+    "freeNetUsed": 100,
+    "EnergyLimit": 50,
+    "EnergyUsed": 0,
+}
+
+RESPONSES = {
+    "/wallet/getaccount": ACCOUNT,
+    "/wallet/getaccountresource": ACCOUNT_RESOURCE,
+}
+
+
+def get_response(path: str, params: dict) -> dict:
+    """Get the canned TronGrid answer of an API call.
+
+    Args:
+        path: The API path.
+        params: The API params.
+
+    Returns:
+        The answer, with the requested address for accounts.
+
+    """
+    response = RESPONSES.get(path, {})
+    if path == "/wallet/getaccount":
+        return {**response, "address": params.get("address")}
+
+    return response
+
+
+def handle(request: httpx.Request) -> httpx.Response:
+    """Answer a TronGrid request in process, for httpx.MockTransport.
+
+    Args:
+        request: The request.
+
+    Returns:
+        The response.
+
+    """
+    params = json.loads(request.content or b"{}")
+    return httpx.Response(
+        status_code=200, json=get_response(path=request.url.path, params=params)
+    )
@@ -0,0 +1,108 @@
+import tempfile
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+from functools import partial
+from pathlib import Path
+from typing import AsyncIterator
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    async_sessionmaker,
+    create_async_engine,
+)
+
+from benchmarks.explorer import create_registry
+from benchmarks.runner import Call, Options, register
+from db.models import Base, Wallet
+from enums.count import CountStrategyEnum
+from enums.network import NetworkEnum
+from explorers.tron_address import normalize_tron_address
+from schemas import WalletHistoryParams
+from usecases import WalletUsecase
+
+ADDRESSES_COUNT = 1000
+INSERT_BATCH_SIZE = 10_000
+PAGE_SIZE = 100
+# Rows of each size, and whether the size only runs with --large.
+SIZES = {"10k": (10_000, False), "1m": (1_000_000, True)}
+
+ADDRESSES = [
+    normalize_tron_address(address=f"41{index:040x}")
+    for index in range(ADDRESSES_COUNT)
+]
+
+
+async def populate(engine: AsyncEngine, rows: int) -> None:
+    """Recreate the tables and insert wallet snapshots of a set of addresses.
+
+    Args:
+        engine: The async engine.
+        rows: The number of snapshots.
+
+    """
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+
+    started_at = datetime.now(UTC) - timedelta(seconds=rows)
+    for start in range(0, rows, INSERT_BATCH_SIZE):
+        async with engine.begin() as conn:
+            await conn.execute(
+                insert(Wallet),
+                [
+                    {
+                        "network": NetworkEnum.TRON,
+                        "address": ADDRESSES[index % ADDRESSES_COUNT],
+                        "balance": Decimal(index) / 1000,
+                        "bandwidth": index % 600,
+                        "energy": index % 50,
+                        "created_at": started_at + timedelta(seconds=index),
+                    }
+                    for index in range(start, min(start + INSERT_BATCH_SIZE, rows))
+                ],
+            )
+
+
+@asynccontextmanager
+async def get_history(
+    options: Options, rows: int, params: WalletHistoryParams
+) -> AsyncIterator[Call]:
+    with tempfile.TemporaryDirectory() as directory:
+        engine = create_async_engine(
+            url=options.database_url
+            or f"sqlite+aiosqlite:///{Path(directory) / 'benchmark.db'}"
+        )
+        await populate(engine=engine, rows=rows)
+
+        async with (
+            async_sessionmaker(bind=engine, expire_on_commit=False)() as session,
+            create_registry() as registry,
+        ):
+            yield partial(
+                WalletUsecase(explorers=registry).get_history,
+                session=session,
+                data=params,
+                count_strategy=CountStrategyEnum.EXACT,
+            )
+
+        await engine.dispose()
+
+
+def _register_sizes() -> None:
+    queries = {
+        "page": WalletHistoryParams(limit=PAGE_SIZE),
+        "address": WalletHistoryParams(
+            limit=PAGE_SIZE, network=NetworkEnum.TRON, address=ADDRESSES[0]
+        ),
+    }
+
+    for size, (rows, large) in SIZES.items():
+        for query, params in queries.items():
+            register(name=f"usecase.get_history.{query}[{size}]", large=large)(
+                partial(get_history, rows=rows, params=params)
+            )
+
+
+_register_sizes()
@@ -0,0 +1,3 @@
+from benchmarks.load.harness import main
+
+main()
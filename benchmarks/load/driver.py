@@ -0,0 +1,204 @@
+import asyncio
+import random
+import secrets
+import time
+from collections import Counter
+from dataclasses import dataclass
+from typing import Awaitable, Callable
+
+import httpx
+
+from enums.network import NetworkEnum
+from explorers.tron_address import normalize_tron_address
+
+DROPPED = "dropped"
+PERCENTILES = (50, 90, 99)
+
+Send = Callable[[httpx.AsyncClient], Awaitable[httpx.Response]]
+
+
+@dataclass(frozen=True)
+class Scenario:
+    name: str
+    weight: float
+    send: Send
+
+
+@dataclass(frozen=True)
+class Sample:
+    scenario: str
+    outcome: str
+    latency: float
+
+
+def make_addresses(count: int) -> list[str]:
+    """Make random TRON addresses, in the hex form accepted by the API.
+
+    Args:
+        count: The number of addresses.
+
+    Returns:
+        The addresses.
+
+    """
+    return [f"41{secrets.token_hex(20)}" for _ in range(count)]
+
+
+def make_scenarios(addresses: list[str], history_ratio: float) -> list[Scenario]:
+    """Make the wallet lookup and history scenarios over a set of addresses.
+
+    Wallets are looked up with the addresses as given, while the history is
+    queried with their base58check form, as the snapshots are stored.
+
+    Args:
+        addresses: The addresses looked up, a small set means more cache hits.
+        history_ratio: The share of the history requests.
+
+    Returns:
+        The scenarios.
+
+    """
+    history_addresses = [
+        normalize_tron_address(address=address) for address in addresses
+    ]
+
+    async def post_wallet(client: httpx.AsyncClient) -> httpx.Response:
+        return await client.post(
+            url="/wallet",
+            params={"network": NetworkEnum.TRON.value},
+            json={"address": random.choice(addresses)},  # noqa: S311
+        )
+
+    async def get_history(client: httpx.AsyncClient) -> httpx.Response:
+        return await client.get(
+            url="/wallet/history",
+            params={
+                "address": random.choice(history_addresses),  # noqa: S311
+                "limit": 10,
+            },
+        )
+
+    return [
+        Scenario(name="POST /wallet", weight=1 - history_ratio, send=post_wallet),
+        Scenario(name="GET /wallet/history", weight=history_ratio, send=get_history),
+    ]
+
+
+async def drive(
+    client: httpx.AsyncClient,
+    scenarios: list[Scenario],
+    *,
+    rps: float,
+    duration: float,
+    max_in_flight: int,
+) -> list[Sample]:
+    """Send requests at a fixed rate, whatever the response times.
+
+    Latencies are measured from the time a request was due, so a server falling
+    behind shows up in the latencies instead of slowing the load down. Requests
+    due while `max_in_flight` are pending are not sent and count as dropped.
+
+    Args:
+        client: The client of the app.
+        scenarios: The scenarios, picked at random by weight.
+        rps: The target requests per second.
+        duration: The duration of the run in seconds.
+        max_in_flight: The maximum number of pending requests.
+
+    Returns:
+        The outcome of every due request.
+
+    """
+    samples: list[Sample] = []
+    tasks: set[asyncio.Task] = set()
+    weights = [scenario.weight for scenario in scenarios]
+    started_at = time.perf_counter()
+
+    async def request(scenario: Scenario, due_at: float) -> None:
+        try:
+            response = await scenario.send(client)
+            outcome = str(response.status_code)
+        except httpx.HTTPError as err:
+            outcome = type(err).__name__
+
+        samples.append(
+            Sample(
+                scenario=scenario.name,
+                outcome=outcome,
+                latency=time.perf_counter() - due_at,
+            )
+        )
+
+    for index in range(int(rps * duration)):
+        due_at = started_at + index / rps
+        await asyncio.sleep(max(due_at - time.perf_counter(), 0))
+
+        scenario = random.choices(scenarios, weights=weights)[0]  # noqa: S311
+        if len(tasks) >= max_in_flight:
+            samples.append(Sample(scenario=scenario.name, outcome=DROPPED, latency=0))
+            continue
+
+        task = asyncio.create_task(request(scenario=scenario, due_at=due_at))
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
+
+    await asyncio.gather(*tasks)
+    return samples
+
+
+def percentile(values: list[float], percent: float) -> float:
+    """Get a nearest-rank percentile.
+
+    Args:
+        values: The sorted values.
+        percent: The percentile, from 0 to 100.
+
+    Returns:
+        The percentile, 0 without values.
+
+    """
+    if not values:
+        return 0
+
+    index = max(int(round(percent / 100 * len(values))) - 1, 0)
+    return values[min(index, len(values) - 1)]
+
+
+def summarize(samples: list[Sample], duration: float) -> dict[str, dict]:
+    """Summarize the outcome of a run per scenario.
+
+    Args:
+        samples: The samples of the run.
+        duration: The duration of the run in seconds.
+
+    Returns:
+        The requests, throughput, error rate, outcomes and latency percentiles in
+        milliseconds of each scenario.
+
+    """
+    summary = {}
+    for name in sorted({sample.scenario for sample in samples}):
+        scenario_samples = [sample for sample in samples if sample.scenario == name]
+        outcomes = Counter(sample.outcome for sample in scenario_samples)
+        succeeded = [
+            sample.latency
+            for sample in scenario_samples
+            if sample.outcome.startswith("2")
+        ]
+        latencies = sorted(
+            sample.latency for sample in scenario_samples if sample.outcome != DROPPED
+        )
+
+        summary[name] = {
+            "requests": len(scenario_samples),
+            "throughput": len(succeeded) / duration,
+            "error_rate": 1 - len(succeeded) / len(scenario_samples),
+            "outcomes": dict(outcomes),
+            **{
+                f"p{percent}_ms": percentile(values=latencies, percent=percent) * 1000
+                for percent in PERCENTILES
+            },
+            "max_ms": (latencies[-1] if latencies else 0) * 1000,
+        }
+
+    return summary
@@ -0,0 +1,69 @@
+import asyncio
+import random
+
+from pydantic import Field
+from pydantic_settings import SettingsConfigDict
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+from benchmarks import fake_tron
+from settings.base import BaseSettings
+
+
+class FakeTronSettings(BaseSettings):
+    model_config = SettingsConfigDict(env_prefix="fake_tron_")
+
+    latency_median_ms: float = Field(
+        default=50, title="Median latency of the answers in milliseconds", ge=0
+    )
+    latency_sigma: float = Field(
+        default=0.5, title="Shape of the log-normal latency, 0 for constant", ge=0
+    )
+    error_rate: float = Field(
+        default=0, title="Share of the requests answered with 503", ge=0, le=1
+    )
+    rate_limit_rate: float = Field(
+        default=0, title="Share of the requests answered with 429", ge=0, le=1
+    )
+
+
+fake_tron_settings = FakeTronSettings()
+
+
+def get_latency() -> float:
+    """Draw the latency of an answer from a log-normal distribution.
+
+    Returns:
+        The latency in seconds.
+
+    """
+    median = fake_tron_settings.latency_median_ms / 1000
+    if not median or not fake_tron_settings.latency_sigma:
+        return median
+
+    return median * random.lognormvariate(  # noqa: S311
+        0, fake_tron_settings.latency_sigma
+    )
+
+
+async def call(request: Request) -> JSONResponse:
+    await asyncio.sleep(get_latency())
+
+    roll = random.random()  # noqa: S311
+    if roll < fake_tron_settings.error_rate:
+        return JSONResponse(content={"Error": "unavailable"}, status_code=503)
+    if roll < fake_tron_settings.error_rate + fake_tron_settings.rate_limit_rate:
+        return JSONResponse(content={"Error": "rate limited"}, status_code=429)
+
+    return JSONResponse(
+        content=fake_tron.get_response(
+            path=request.url.path, params=await request.json()
+        )
+    )
+
+
+app = Starlette(
+    routes=[Route(path="/wallet/{method}", endpoint=call, methods=["POST"])]
+)
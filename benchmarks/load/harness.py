@@ -0,0 +1,233 @@
+import argparse
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import time
+from contextlib import asynccontextmanager, suppress
+from pathlib import Path
+from typing import AsyncIterator
+
+import httpx
+
+from benchmarks.load.driver import (
+    PERCENTILES,
+    drive,
+    make_addresses,
+    make_scenarios,
+    summarize,
+)
+
+BASE_PATH = Path(__file__).parent.parent.parent
+READY_POLL_INTERVAL = 0.2
+
+
+async def wait_ready(url: str, timeout: float) -> None:
+    """Wait until a server answers HTTP requests.
+
+    Args:
+        url: The URL polled.
+        timeout: The maximum wait in seconds.
+
+    Raises:
+        TimeoutError: If the server does not answer in time.
+
+    """
+    deadline = time.monotonic() + timeout
+    async with httpx.AsyncClient() as client:
+        while True:
+            with suppress(httpx.TransportError):
+                await client.get(url=url)
+                return
+
+            if time.monotonic() >= deadline:
+                message = f"{url} is not ready after {timeout}s"
+                raise TimeoutError(message)
+
+            await asyncio.sleep(READY_POLL_INTERVAL)
+
+
+@asynccontextmanager
+async def serve(
+    command: list[str], env: dict[str, str], ready_url: str, timeout: float
+) -> AsyncIterator[None]:
+    """Run a server process for the duration of the context.
+
+    Args:
+        command: The command of the server.
+        env: The environment of the server.
+        ready_url: The URL answering once the server is ready.
+        timeout: The maximum start time in seconds.
+
+    """
+    process = await asyncio.create_subprocess_exec(*command, env=env, cwd=BASE_PATH)
+    try:
+        await wait_ready(url=ready_url, timeout=timeout)
+        yield
+    finally:
+        if process.returncode is None:
+            process.terminate()
+            try:
+                await asyncio.wait_for(process.wait(), timeout=timeout)
+            except TimeoutError:
+                process.kill()
+
+
+def get_fake_tron_command(port: int) -> list[str]:
+    return [
+        sys.executable,
+        "-m",
+        "uvicorn",
+        "benchmarks.load.fake_tron_server:app",
+        "--host=127.0.0.1",
+        f"--port={port}",
+        "--log-level=warning",
+    ]
+
+
+def get_app_command(port: int, workers: int) -> list[str]:
+    return [
+        sys.executable,
+        "-m",
+        "gunicorn",
+        "main:app",
+        "--config=gunicorn.conf.py",
+        f"--bind=127.0.0.1:{port}",
+        f"--workers={workers}",
+    ]
+
+
+def report(summary: dict[str, dict]) -> None:
+    percentiles = "".join(f"{f'p{percent}':>9}" for percent in PERCENTILES)
+    sys.stdout.write(
+        f"{'scenario':<22}{'requests':>9}{'ok/s':>9}{'errors':>8}"
+        f"{percentiles}{'max':>9}  outcomes\n"
+    )
+    for name, stats in summary.items():
+        latencies = "".join(
+            f"{stats[f'p{percent}_ms']:9.1f}" for percent in PERCENTILES
+        )
+        sys.stdout.write(
+            f"{name:<22}{stats['requests']:>9}{stats['throughput']:9.1f}"
+            f"{stats['error_rate']:8.1%}{latencies}{stats['max_ms']:9.1f}  "
+            f"{stats['outcomes']}\n"
+        )
+
+
+async def run(arguments: argparse.Namespace) -> int:
+    addresses = make_addresses(count=arguments.addresses)
+    scenarios = make_scenarios(
+        addresses=addresses, history_ratio=arguments.history_ratio
+    )
+
+    with tempfile.TemporaryDirectory() as directory:
+        fake_tron_env = {
+            **os.environ,
+            "FAKE_TRON_LATENCY_MEDIAN_MS": str(arguments.latency_median_ms),
+            "FAKE_TRON_LATENCY_SIGMA": str(arguments.latency_sigma),
+            "FAKE_TRON_ERROR_RATE": str(arguments.error_rate),
+            "FAKE_TRON_RATE_LIMIT_RATE": str(arguments.rate_limit_rate),
+        }
+        app_env = {
+            "TRON_API_KEY": "load-test",
+            **os.environ,
+            "TRON_ENDPOINTS": json.dumps(
+                [f"http://127.0.0.1:{arguments.fake_tron_port}/"]
+            ),
+            # The stand-in takes the place of TronGrid, keys included.
+            "TRON_KEY_HOSTS": json.dumps(["127.0.0.1"]),
+            "PROMETHEUS_MULTIPROC_DIR": str(Path(directory) / "prometheus"),
+        }
+        app_url = f"http://127.0.0.1:{arguments.app_port}"
+
+        async with (
+            serve(
+                command=get_fake_tron_command(port=arguments.fake_tron_port),
+                env=fake_tron_env,
+                ready_url=f"http://127.0.0.1:{arguments.fake_tron_port}/",
+                timeout=arguments.start_timeout,
+            ),
+            serve(
+                command=get_app_command(
+                    port=arguments.app_port, workers=arguments.workers
+                ),
+                env=app_env,
+                ready_url=f"{app_url}/docs",
+                timeout=arguments.start_timeout,
+            ),
+            httpx.AsyncClient(
+                base_url=app_url,
+                timeout=arguments.request_timeout,
+                limits=httpx.Limits(max_connections=arguments.max_in_flight),
+            ) as client,
+        ):
+            samples = await drive(
+                client=client,
+                scenarios=scenarios,
+                rps=arguments.rps,
+                duration=arguments.duration,
+                max_in_flight=arguments.max_in_flight,
+            )
+
+    summary = summarize(samples=samples, duration=arguments.duration)
+    report(summary=summary)
+
+    if arguments.json:
+        arguments.json.write_text(json.dumps(summary, indent=2) + "\n")
+
+    if any(
+        stats["error_rate"] > arguments.max_error_rate for stats in summary.values()
+    ):
+        return 1
+
+    return 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.load",
+        description=(
+            "Load the app served by gunicorn, with TronGrid replaced by a local "
+            "fake. The database, broker and Redis of the environment are used."
+        ),
+    )
+    parser.add_argument("--rps", type=float, default=50, help="Target requests/s")
+    parser.add_argument("--duration", type=float, default=30, help="Seconds of load")
+    parser.add_argument(
+        "--history-ratio", type=float, default=0.5, help="Share of history requests"
+    )
+    parser.add_argument(
+        "--addresses", type=int, default=1000, help="Distinct addresses looked up"
+    )
+    parser.add_argument(
+        "--max-in-flight", type=int, default=500, help="Pending requests cap"
+    )
+    parser.add_argument(
+        "--request-timeout", type=float, default=30, help="Seconds per request"
+    )
+    parser.add_argument("--workers", type=int, default=1, help="Gunicorn workers")
+    parser.add_argument("--app-port", type=int, default=8100)
+    parser.add_argument("--fake-tron-port", type=int, default=8190)
+    parser.add_argument("--start-timeout", type=float, default=30)
+    parser.add_argument(
+        "--latency-median-ms", type=float, default=50, help="Fake TronGrid latency"
+    )
+    parser.add_argument(
+        "--latency-sigma", type=float, default=0.5, help="Fake TronGrid latency shape"
+    )
+    parser.add_argument(
+        "--error-rate", type=float, default=0, help="Fake TronGrid 503 share"
+    )
+    parser.add_argument(
+        "--rate-limit-rate", type=float, default=0, help="Fake TronGrid 429 share"
+    )
+    parser.add_argument(
+        "--max-error-rate",
+        type=float,
+        default=1,
+        help="Fail when a scenario has more errors",
+    )
+    parser.add_argument("--json", type=Path, help="Write the summary to a file")
+
+    sys.exit(asyncio.run(run(arguments=parser.parse_args())))
@@ -0,0 +1,213 @@
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+from contextlib import AbstractAsyncContextManager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Awaitable, Callable
+
+BASELINES_PATH = Path(__file__).parent / "baselines.json"
+
+Call = Callable[[], Awaitable[Any]]
+
+
+@dataclass(frozen=True)
+class Options:
+    large: bool = False
+    database_url: str | None = None
+
+
+Setup = Callable[[Options], AbstractAsyncContextManager[Call]]
+
+
+@dataclass(frozen=True)
+class Benchmark:
+    name: str
+    setup: Setup
+    large: bool = False
+
+
+@dataclass(frozen=True)
+class Result:
+    name: str
+    median: float
+    best: float
+    number: int
+
+
+BENCHMARKS: dict[str, Benchmark] = {}
+
+
+def register(name: str, large: bool = False) -> Callable[[Setup], Setup]:
+    """Register a benchmark.
+
+    The decorated function sets up the benchmark and yields the measured call,
+    which must be repeatable.
+
+    Args:
+        name: The unique name of the benchmark, the key of its baseline.
+        large: Whether the benchmark only runs with `--large`.
+
+    Returns:
+        The decorator.
+
+    """
+
+    def decorator(setup: Setup) -> Setup:
+        BENCHMARKS[name] = Benchmark(name=name, setup=setup, large=large)
+        return setup
+
+    return decorator
+
+
+async def _time(call: Call, number: int) -> float:
+    started_at = time.perf_counter()
+    for _ in range(number):
+        await call()
+
+    return time.perf_counter() - started_at
+
+
+async def measure(name: str, call: Call, rounds: int, min_time: float) -> Result:
+    """Time a call like timeit, calibrating the calls per round.
+
+    Args:
+        name: The benchmark name.
+        call: The measured call.
+        rounds: The number of timed rounds.
+        min_time: The minimum duration of a round in seconds.
+
+    Returns:
+        The median and best seconds per call over the rounds.
+
+    """
+    number = 1
+    while (elapsed := await _time(call=call, number=number)) < min_time:
+        number = max(number * 2, int(number * min_time / max(elapsed, 1e-9)))
+
+    timings = [await _time(call=call, number=number) / number for _ in range(rounds)]
+
+    return Result(
+        name=name,
+        median=statistics.median(timings),
+        best=min(timings),
+        number=number,
+    )
+
+
+def compare(
+    results: list[Result], baselines: dict[str, float], threshold: float
+) -> list[str]:
+    """Find the benchmarks slower than their baseline beyond the threshold.
+
+    Args:
+        results: The benchmark results.
+        baselines: The baseline median seconds per call by benchmark.
+        threshold: The tolerated slowdown, 0.25 for 25%.
+
+    Returns:
+        The names of the regressed benchmarks.
+
+    """
+    return [
+        result.name
+        for result in results
+        if result.name in baselines
+        and result.median > baselines[result.name] * (1 + threshold)
+    ]
+
+
+def load_baselines(path: Path) -> dict[str, float]:
+    return json.loads(path.read_text()) if path.exists() else {}
+
+
+def save_baselines(path: Path, baselines: dict[str, float]) -> None:
+    path.write_text(json.dumps(baselines, indent=2, sort_keys=True) + "\n")
+
+
+def _format(seconds: float) -> str:
+    return f"{seconds * 1_000_000:12.1f}us"
+
+
+def report(results: list[Result], baselines: dict[str, float]) -> None:
+    sys.stdout.write(f"{'benchmark':<40}{'median':>14}{'baseline':>14}{'change':>9}\n")
+    for result in results:
+        baseline = baselines.get(result.name)
+        change = (
+            f"{(result.median / baseline - 1) * 100:+8.1f}%" if baseline else " " * 9
+        )
+        sys.stdout.write(
+            f"{result.name:<40}{_format(result.median):>14}"
+            f"{_format(baseline) if baseline else '':>14}{change}\n"
+        )
+
+
+async def run(arguments: argparse.Namespace) -> int:
+    options = Options(large=arguments.large, database_url=arguments.database_url)
+    benchmarks = [
+        benchmark
+        for name, benchmark in BENCHMARKS.items()
+        if (arguments.large or not benchmark.large)
+        and (not arguments.filter or arguments.filter in name)
+    ]
+
+    results = []
+    for benchmark in benchmarks:
+        async with benchmark.setup(options) as call:
+            results.append(
+                await measure(
+                    name=benchmark.name,
+                    call=call,
+                    rounds=arguments.rounds,
+                    min_time=arguments.min_time,
+                )
+            )
+
+    baselines = load_baselines(path=arguments.baselines)
+    report(results=results, baselines=baselines)
+
+    if arguments.save:
+        baselines.update({result.name: result.median for result in results})
+        save_baselines(path=arguments.baselines, baselines=baselines)
+        return 0
+
+    regressions = compare(
+        results=results, baselines=baselines, threshold=arguments.threshold
+    )
+    if regressions:
+        sys.stdout.write(
+            f"Regressions above {arguments.threshold:.0%}: {', '.join(regressions)}\n"
+        )
+        return 1
+
+    return 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks", description="Benchmark the hot paths offline."
+    )
+    parser.add_argument("--filter", help="Run the benchmarks whose name contains it")
+    parser.add_argument("--large", action="store_true", help="Include 1M row runs")
+    parser.add_argument(
+        "--database-url",
+        help="Scratch database for the history benchmarks, its tables are dropped",
+    )
+    parser.add_argument("--rounds", type=int, default=5, help="Timed rounds")
+    parser.add_argument(
+        "--min-time", type=float, default=0.1, help="Minimum seconds per round"
+    )
+    parser.add_argument(
+        "--threshold", type=float, default=0.25, help="Tolerated slowdown"
+    )
+    parser.add_argument(
+        "--baselines", type=Path, default=BASELINES_PATH, help="Baselines file"
+    )
+    parser.add_argument(
+        "--save", action="store_true", help="Store the results as baselines"
+    )
+
+    sys.exit(asyncio.run(run(arguments=parser.parse_args())))
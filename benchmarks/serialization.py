@@ -0,0 +1,129 @@
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime
+from decimal import Decimal
+from typing import AsyncIterator, Sequence
+
+from sqlalchemy import Row, inspect
+from sqlalchemy.engine.result import IteratorResult, SimpleResultMetaData
+from taskiq import TaskiqMessage
+from taskiq.formatters.json_formatter import JSONFormatter
+
+from api.responses import ModelJSONResponse
+from benchmarks.runner import Call, Options, register
+from db.models import Wallet
+from enums.network import NetworkEnum
+from schemas import PaginatedResponse, WalletInfo, WalletResponse
+from settings import api_settings
+from usecases.wallet import WALLET_RESPONSES_ADAPTER
+
+PAGE_SIZE = 100
+
+formatter = JSONFormatter()
+
+
+def make_wallets(count: int) -> list[Wallet]:
+    return [
+        Wallet(
+            id=index,
+            network=NetworkEnum.TRON,
+            address=f"T{index:033d}",
+            balance=Decimal(index) / 1000,
+            bandwidth=index % 600,
+            energy=index % 50,
+            created_at=datetime.now(UTC),
+        )
+        for index in range(count)
+    ]
+
+
+def make_rows(wallets: list[Wallet]) -> Sequence[Row]:
+    """Make the plain rows a column select returns for the wallets.
+
+    Args:
+        wallets: The wallets.
+
+    Returns:
+        The rows.
+
+    """
+    keys = [column.key for column in inspect(Wallet).columns]
+    return IteratorResult(
+        SimpleResultMetaData(keys),
+        iter([tuple(getattr(wallet, key) for key in keys) for wallet in wallets]),
+    ).all()
+
+
+@register(name="serialize.history_page")
+@asynccontextmanager
+async def serialize_history_page(options: Options) -> AsyncIterator[Call]:
+    rows = make_rows(wallets=make_wallets(count=PAGE_SIZE))
+
+    async def call() -> bytes:
+        # As the history use case and route do, see ModelResponseRoute.
+        page = PaginatedResponse[WalletResponse](
+            results=WALLET_RESPONSES_ADAPTER.validate_python(
+                [row._asdict() for row in rows]
+            ),
+            count=len(rows),
+            page=1,
+            limit=PAGE_SIZE,
+        )
+        return ModelJSONResponse(content=page).body
+
+    yield call
+
+
+@register(name="serialize.history_page_orm")
+@asynccontextmanager
+async def serialize_history_page_orm(options: Options) -> AsyncIterator[Call]:
+    wallets = make_wallets(count=PAGE_SIZE)
+
+    async def call() -> bytes:
+        # The former path validating ORM instances, kept as a baseline.
+        page = PaginatedResponse[WalletResponse](
+            results=[WalletResponse.model_validate(wallet) for wallet in wallets],
+            count=len(wallets),
+            page=1,
+            limit=PAGE_SIZE,
+        )
+        return ModelJSONResponse(content=page).body
+
+    yield call
+
+
+@register(name="serialize.task_payload")
+@asynccontextmanager
+async def serialize_task_payload(options: Options) -> AsyncIterator[Call]:
+    wallets_info = [
+        WalletInfo(
+            network=NetworkEnum.TRON,
+            address=f"T{index:033d}",
+            balance=Decimal(index) / 1000,
+            bandwidth=index % 600,
+            energy=index % 50,
+        )
+        for index in range(api_settings.write_batch_size)
+    ]
+
+    async def call() -> list[WalletInfo]:
+        # The save_wallets_info round trip, from the API to the worker.
+        message = formatter.dumps(
+            TaskiqMessage(
+                task_id="task_id",
+                task_name="save_wallets_info",
+                labels={},
+                args=[],
+                kwargs={
+                    "wallets_info": [
+                        wallet_info.model_dump(mode="json")
+                        for wallet_info in wallets_info
+                    ]
+                },
+            )
+        )
+        return [
+            WalletInfo.model_validate(wallet_info)
+            for wallet_info in formatter.loads(message.message).kwargs["wallets_info"]
+        ]
+
+    yield call
@@ -0,0 +1,132 @@
+"""Partition wallets by month
+
+Revision ID: 340f71549380
+Revises: 559ba86a5dd2
+Create Date: 2026-10-18 14:05:27.913604
+
+"""
+
+from datetime import UTC, date, datetime, time
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "340f71549380"
+down_revision: Union[str, None] = "559ba86a5dd2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+MONTHS_AHEAD = 3
+
+COLUMNS = "id, network, address, balance, bandwidth, energy, created_at"
+
+
+def _add_months(month: date, months: int) -> date:
+    index = month.year * 12 + month.month - 1 + months
+    return date(year=index // 12, month=index % 12 + 1, day=1)
+
+
+def _create_table(name: str, partitioned: bool) -> None:
+    op.create_table(
+        name,
+        sa.Column(
+            "id",
+            sa.Integer(),
+            server_default=sa.text("nextval('wallets_id_seq'::regclass)"),
+            nullable=False,
+            comment="Wallet ID",
+        ),
+        sa.Column(
+            "network",
+            postgresql.ENUM("TRON", name="networkenum", create_type=False),
+            nullable=False,
+            comment="Network",
+        ),
+        sa.Column(
+            "address", sa.String(length=255), nullable=False, comment="Wallet address"
+        ),
+        sa.Column(
+            "balance",
+            sa.DECIMAL(precision=18, scale=6),
+            nullable=True,
+            comment="Wallet balance",
+        ),
+        sa.Column("bandwidth", sa.Integer(), nullable=True, comment="Wallet bandwidth"),
+        sa.Column("energy", sa.Integer(), nullable=True, comment="Wallet energy"),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+            comment="Created at",
+        ),
+        sa.CheckConstraint("balance >= 0", name="check_balance_positive"),
+        sa.CheckConstraint("bandwidth >= 0", name="check_bandwidth_positive"),
+        sa.CheckConstraint("energy >= 0", name="check_energy_positive"),
+        postgresql_partition_by="RANGE (created_at)" if partitioned else None,
+    )
+
+
+def _create_indexes() -> None:
+    op.create_index(op.f("ix_wallets_address"), "wallets", ["address"], unique=False)
+    op.create_index(op.f("ix_wallets_network"), "wallets", ["network"], unique=False)
+    op.create_index(
+        "ix_wallets_created_at_id", "wallets", ["created_at", "id"], unique=False
+    )
+    op.create_index(
+        "ix_wallets_network_created_at_id",
+        "wallets",
+        ["network", "created_at", "id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_wallets_network_address_created_at_id",
+        "wallets",
+        ["network", "address", "created_at", "id"],
+        unique=False,
+    )
+
+
+def _swap_tables(old: str, new: str) -> None:
+    op.execute(f"INSERT INTO {new} ({COLUMNS}) SELECT {COLUMNS} FROM {old}")
+    op.execute("ALTER SEQUENCE wallets_id_seq OWNED BY NONE")
+    op.drop_table(old)
+    op.rename_table(new, "wallets")
+    op.execute("ALTER SEQUENCE wallets_id_seq OWNED BY wallets.id")
+
+
+def upgrade() -> None:
+    # The partition key must be part of the primary key, and monthly partitions
+    # cover the existing rows up to a few months ahead. Later months are created
+    # by the maintain_wallet_partitions task.
+    first = op.get_bind().scalar(
+        sa.text("SELECT min(created_at) AT TIME ZONE 'UTC' FROM wallets")
+    )
+    current = datetime.now(UTC).date().replace(day=1)
+    month = first.date().replace(day=1) if first else current
+
+    _create_table(name="wallets_partitioned", partitioned=True)
+
+    while month <= _add_months(month=current, months=MONTHS_AHEAD):
+        start = datetime.combine(month, time.min, UTC)
+        end = datetime.combine(_add_months(month=month, months=1), time.min, UTC)
+        op.execute(
+            f"CREATE TABLE wallets_p{month:%Y%m} PARTITION OF wallets_partitioned "
+            f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+        )
+        month = _add_months(month=month, months=1)
+
+    _swap_tables(old="wallets", new="wallets_partitioned")
+    op.create_primary_key("wallets_pkey", "wallets", ["id", "created_at"])
+    _create_indexes()
+
+
+def downgrade() -> None:
+    _create_table(name="wallets_unpartitioned", partitioned=False)
+    _swap_tables(old="wallets", new="wallets_unpartitioned")
+    op.create_primary_key("wallets_pkey", "wallets", ["id"])
+    op.create_unique_constraint("wallets_id_key", "wallets", ["id"])
+    _create_indexes()
@@ -0,0 +1,28 @@
+"""Add wallets default partition
+
+Revision ID: 8c3e5a1d7b42
+Revises: 1f4f09cf5ad2
+Create Date: 2026-10-18 19:42:08.514237
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8c3e5a1d7b42"
+down_revision: Union[str, None] = "1f4f09cf5ad2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Rows of months without a partition land here instead of failing, and are
+    # moved to their partition once the maintain_wallet_partitions task creates
+    # it.
+    op.execute("CREATE TABLE wallets_default PARTITION OF wallets DEFAULT")
+
+
+def downgrade() -> None:
+    op.drop_table("wallets_default")
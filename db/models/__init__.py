@@ -1,4 +1,6 @@
 from db.models.base import Base
 from db.models.wallet import Wallet
+from db.models.wallet_counter import WalletCounter
+from db.models.wallet_latest import WalletLatest
 
-__all__ = ["Base", "Wallet"]
+__all__ = ["Base", "Wallet", "WalletCounter", "WalletLatest"]
@@ -6,6 +6,7 @@ from sqlalchemy import (
     CheckConstraint,
     DateTime,
     Enum,
+    Index,
     Integer,
     String,
     func,
@@ -18,15 +19,26 @@ from enums.network import NetworkEnum
 
 
 class Wallet(Base):
+    # On PostgreSQL the table is range partitioned by month of `created_at`, with
+    # the primary key (id, created_at), see the partitioning migration.
     __tablename__ = "wallets"
     __table_args__ = (
         CheckConstraint("balance >= 0", name="check_balance_positive"),
         CheckConstraint("bandwidth >= 0", name="check_bandwidth_positive"),
         CheckConstraint("energy >= 0", name="check_energy_positive"),
+        Index("ix_wallets_created_at_id", "created_at", "id"),
+        Index("ix_wallets_network_created_at_id", "network", "created_at", "id"),
+        Index(
+            "ix_wallets_network_address_created_at_id",
+            "network",
+            "address",
+            "created_at",
+            "id",
+        ),
     )
 
     id: Mapped[int] = mapped_column(
-        primary_key=True, autoincrement=True, unique=True, comment="Wallet ID"
+        primary_key=True, autoincrement=True, comment="Wallet ID"
     )
 
     network: Mapped[NetworkEnum] = mapped_column(
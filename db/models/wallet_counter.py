@@ -0,0 +1,19 @@
+from sqlalchemy import BigInteger, Enum
+from sqlalchemy.orm import Mapped, mapped_column
+
+from db.models.base import Base
+from enums.network import NetworkEnum
+
+
+class WalletCounter(Base):
+    __tablename__ = "wallet_counters"
+
+    network: Mapped[NetworkEnum] = mapped_column(
+        Enum(NetworkEnum), primary_key=True, comment="Network"
+    )
+    count: Mapped[int] = mapped_column(
+        BigInteger, nullable=False, default=0, comment="Number of wallet snapshots"
+    )
+
+    def __repr__(self) -> str:
+        return f"<WalletCounter(network='{self.network}', count={self.count})>"
@@ -0,0 +1,46 @@
+from datetime import datetime
+from decimal import Decimal
+
+from sqlalchemy import DECIMAL, CheckConstraint, DateTime, Enum, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from constants.db import TEXT_LENGTH
+from db.models.base import Base
+from enums.network import NetworkEnum
+
+
+class WalletLatest(Base):
+    __tablename__ = "wallet_latest"
+    __table_args__ = (
+        CheckConstraint("balance >= 0", name="check_latest_balance_positive"),
+        CheckConstraint("bandwidth >= 0", name="check_latest_bandwidth_positive"),
+        CheckConstraint("energy >= 0", name="check_latest_energy_positive"),
+    )
+
+    network: Mapped[NetworkEnum] = mapped_column(
+        Enum(NetworkEnum), primary_key=True, comment="Network"
+    )
+    address: Mapped[str] = mapped_column(
+        String(TEXT_LENGTH), primary_key=True, comment="Wallet address"
+    )
+
+    balance: Mapped[Decimal | None] = mapped_column(
+        DECIMAL(18, 6), nullable=True, comment="Wallet balance"
+    )
+    bandwidth: Mapped[int | None] = mapped_column(
+        Integer, nullable=True, comment="Wallet bandwidth"
+    )
+    energy: Mapped[int | None] = mapped_column(
+        Integer, nullable=True, comment="Wallet energy"
+    )
+
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, comment="Updated at"
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<WalletLatest(network='{self.network}', "
+            f"address='{self.address}', "
+            f"updated_at='{self.updated_at}')>"
+        )
@@ -0,0 +1,178 @@
+import re
+from datetime import UTC, date, datetime, time
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+def add_months(month: date, months: int) -> date:
+    """Get the first day of the month a number of months away.
+
+    Args:
+        month: The month.
+        months: The number of months, negative to go back.
+
+    Returns:
+        The first day of the month.
+
+    """
+    index = month.year * 12 + month.month - 1 + months
+    return date(year=index // 12, month=index % 12 + 1, day=1)
+
+
+class MonthlyPartitions:
+    """Manage the monthly range partitions of a PostgreSQL table.
+
+    Partitions are named `<table>_pYYYYMM` and cover a calendar month in UTC.
+    Rows of months without a partition are kept in the `<table>_default`
+    partition until the partition of their month is created.
+
+    """
+
+    def __init__(self, table: str, key: str):
+        self.table = table
+        self.key = key
+        self.default = f"{table}_default"
+        self._pattern = re.compile(rf"^{re.escape(table)}_p(\d{{4}})(\d{{2}})$")
+
+    def get_name(self, month: date) -> str:
+        return f"{self.table}_p{month:%Y%m}"
+
+    async def create(self, session: AsyncSession, month: date) -> str:
+        """Create the partition of a month if it does not exist.
+
+        Rows of the month in the default partition would prevent the creation,
+        so they are moved to the new partition while the default partition is
+        detached.
+
+        Args:
+            session: The async session.
+            month: The month of the partition.
+
+        Returns:
+            The partition name.
+
+        """
+        name = self.get_name(month=month)
+        start = datetime.combine(month.replace(day=1), time.min, UTC)
+        end = datetime.combine(add_months(month=month, months=1), time.min, UTC)
+        create = text(
+            f'CREATE TABLE IF NOT EXISTS "{name}" PARTITION OF "{self.table}" '
+            f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+        )
+        in_month = f'"{self.key}" >= :start AND "{self.key}" < :end'
+        params = {"start": start, "end": end}
+
+        # The identifiers are not user input and the values are bound.
+        result = await session.execute(
+            statement=text(
+                f'SELECT EXISTS (SELECT 1 FROM "{self.default}" WHERE {in_month})'  # noqa: S608
+            ),
+            params=params,
+        )
+        if not result.scalar():
+            await session.execute(statement=create)
+            return name
+
+        await session.execute(
+            statement=text(
+                f'ALTER TABLE "{self.table}" DETACH PARTITION "{self.default}"'
+            )
+        )
+        await session.execute(statement=create)
+        await session.execute(
+            statement=text(
+                f'WITH moved AS (DELETE FROM "{self.default}" WHERE {in_month} '  # noqa: S608
+                f'RETURNING *) INSERT INTO "{self.table}" SELECT * FROM moved'
+            ),
+            params=params,
+        )
+        await session.execute(
+            statement=text(
+                f'ALTER TABLE "{self.table}" ATTACH PARTITION "{self.default}" DEFAULT'
+            )
+        )
+
+        return name
+
+    async def ensure(self, session: AsyncSession, months_ahead: int) -> list[str]:
+        """Create the partitions of the current month and the next ones.
+
+        Args:
+            session: The async session.
+            months_ahead: The number of future months to create.
+
+        Returns:
+            The partition names.
+
+        """
+        current = datetime.now(UTC).date().replace(day=1)
+
+        return [
+            await self.create(
+                session=session, month=add_months(month=current, months=months)
+            )
+            for months in range(months_ahead + 1)
+        ]
+
+    async def get_all(self, session: AsyncSession) -> dict[str, date]:
+        """Get the monthly partitions attached to the table.
+
+        Args:
+            session: The async session.
+
+        Returns:
+            The month of each partition by name, oldest first.
+
+        """
+        result = await session.execute(
+            statement=text(
+                "SELECT child.relname FROM pg_inherits "
+                "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+                "WHERE pg_inherits.inhparent = to_regclass(:table)"
+            ),
+            params={"table": self.table},
+        )
+
+        partitions = {}
+        for name in result.scalars():
+            if match := self._pattern.match(name):
+                partitions[name] = date(int(match[1]), int(match[2]), 1)
+
+        return dict(sorted(partitions.items(), key=lambda item: item[1]))
+
+    async def get_expired(self, session: AsyncSession, retention: int) -> list[str]:
+        """Get the partitions entirely older than the retention.
+
+        Args:
+            session: The async session.
+            retention: The number of months kept before the current one.
+
+        Returns:
+            The partition names.
+
+        """
+        cutoff = add_months(
+            month=datetime.now(UTC).date().replace(day=1), months=-retention
+        )
+        partitions = await self.get_all(session=session)
+
+        return [name for name, month in partitions.items() if month < cutoff]
+
+    async def remove(self, session: AsyncSession, name: str, detach: bool) -> None:
+        """Drop a partition, or only detach it from the table to archive it.
+
+        Both are metadata operations, so no row is deleted one by one.
+
+        Args:
+            session: The async session.
+            name: The partition name.
+            detach: Whether to keep the partition as a standalone table.
+
+        """
+        await session.execute(
+            statement=text(f'ALTER TABLE "{self.table}" DETACH PARTITION "{name}"')
+        )
+
+        if not detach:
+            await session.execute(statement=text(f'DROP TABLE "{name}"'))
@@ -0,0 +1,5 @@
+from redis.asyncio import Redis
+
+from settings import redis_settings
+
+redis_client = Redis.from_url(url=redis_settings.url)
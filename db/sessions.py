@@ -1,5 +1,6 @@
 from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 
+from metrics import instrument_engine
 from settings import db_settings
 
 async_engine = create_async_engine(
@@ -10,6 +11,7 @@ async_engine = create_async_engine(
     pool_timeout=30,
     pool_recycle=1800,
 )
+instrument_engine(engine=async_engine)
 
 async_session = async_sessionmaker(
     bind=async_engine,
@@ -183,6 +183,17 @@ run_tests() {
     fi
 }
 
+run_benchmarks() {
+    print_header "RUNNING BENCHMARKS"
+
+    if poetry run python -m benchmarks "$@"; then
+        print_success "No benchmark regressed"
+    else
+        print_error "Some benchmarks regressed"
+        return 1
+    fi
+}
+
 build_docker() {
     print_header "DOCKER COMPOSE BUILD"
 
@@ -284,6 +295,7 @@ show_help() {
     echo "  format              Format code using isort and black"
     echo "  check               Check code formatting and lint"
     echo "  test                Run tests"
+    echo "  bench [options]     Run benchmarks against the stored baselines"
     echo "  build               Build and run Docker Compose"
     echo "  all                 Execute all operations (format + test + build)"
     echo ""
@@ -297,6 +309,7 @@ show_help() {
     echo "Examples:"
     echo "  $0 format"
     echo "  $0 test"
+    echo "  $0 bench --filter history --large"
     echo "  $0 build"
     echo "  $0 all"
     echo "  $0 migrate generate \"Add user table\""
@@ -324,6 +337,10 @@ main() {
             check_poetry
             run_tests
             ;;
+        bench)
+            check_poetry
+            run_benchmarks "${@:2}"
+            ;;
         build)
             check_docker
             build_docker
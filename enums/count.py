@@ -0,0 +1,8 @@
+from enum import StrEnum
+
+
+class CountStrategyEnum(StrEnum):
+    EXACT = "exact"
+    CACHED = "cached"
+    ESTIMATED = "estimated"
+    COUNTER = "counter"
@@ -0,0 +1,6 @@
+from enum import StrEnum
+
+
+class ExportFormatEnum(StrEnum):
+    NDJSON = "ndjson"
+    CSV = "csv"
@@ -4,3 +4,8 @@ from enum import StrEnum
 class SortDirectionEnum(StrEnum):
     ASC = "asc"
     DESC = "desc"
+
+
+class WalletSortFieldEnum(StrEnum):
+    ID = "id"
+    CREATED_AT = "created_at"
@@ -19,3 +19,39 @@ class InvalidAddressError(ExplorerError):
         status_code: HTTPStatus = HTTPStatus.BAD_REQUEST,
     ):
         super().__init__(message=message, status_code=status_code)
+
+
+class ExplorerTimeoutError(ExplorerError):
+    def __init__(
+        self,
+        message: str = "Explorer did not respond in time",
+        status_code: HTTPStatus = HTTPStatus.GATEWAY_TIMEOUT,
+    ):
+        super().__init__(message=message, status_code=status_code)
+
+
+class AccountNotFoundError(ExplorerError):
+    def __init__(
+        self,
+        message: str = "Account not found",
+        status_code: HTTPStatus = HTTPStatus.NOT_FOUND,
+    ):
+        super().__init__(message=message, status_code=status_code)
+
+
+class ExplorerRateLimitedError(ExplorerError):
+    def __init__(
+        self,
+        message: str = "Explorer rate limit exceeded",
+        status_code: HTTPStatus = HTTPStatus.TOO_MANY_REQUESTS,
+    ):
+        super().__init__(message=message, status_code=status_code)
+
+
+class ExplorerUnavailableError(ExplorerError):
+    def __init__(
+        self,
+        message: str = "Explorer is unavailable",
+        status_code: HTTPStatus = HTTPStatus.SERVICE_UNAVAILABLE,
+    ):
+        super().__init__(message=message, status_code=status_code)
@@ -0,0 +1,21 @@
+from http import HTTPStatus
+
+
+class PaginationError(Exception):
+    def __init__(
+        self,
+        message: str = "Invalid pagination",
+        status_code: HTTPStatus = HTTPStatus.BAD_REQUEST,
+    ):
+        super().__init__(message)
+        self.message = message
+        self.status_code = status_code
+
+
+class InvalidCursorError(PaginationError):
+    def __init__(
+        self,
+        message: str = "Invalid cursor",
+        status_code: HTTPStatus = HTTPStatus.BAD_REQUEST,
+    ):
+        super().__init__(message=message, status_code=status_code)
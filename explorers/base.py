@@ -1,5 +1,8 @@
+import asyncio
 from abc import ABC, abstractmethod
+from typing import Any, Coroutine
 
+from exceptions.explorers import ExplorerTimeoutError, InvalidAddressError
 from schemas.wallet import WalletInfo
 
 
@@ -17,13 +20,95 @@ class BaseExplorer(ABC):
         """
 
     @abstractmethod
-    def check_is_valid_address(self, address: str) -> None:
-        """Check if the address is valid.
+    def normalize_address(self, address: str) -> str:
+        """Validate an address and get its canonical form.
+
+        The canonical form is the one looked up, cached and stored.
+
+        Args:
+            address: The address to validate.
+
+        Returns:
+            The canonical address.
+
+        Raises:
+            InvalidAddressError: If the address is invalid.
+
+        """
+
+    def normalize_addresses(self, addresses: list[str]) -> dict[str, str | None]:
+        """Validate addresses and get their canonical form.
+
+        Args:
+            addresses: The addresses to validate.
+
+        Returns:
+            The canonical form of each address, None for invalid ones.
+
+        """
+        normalized: dict[str, str | None] = {}
+        for address in addresses:
+            try:
+                normalized[address] = self.normalize_address(address=address)
+            except InvalidAddressError:
+                normalized[address] = None
+
+        return normalized
+
+    @abstractmethod
+    async def close(self) -> None:
+        """Release the connections held by the explorer."""
+
+    @staticmethod
+    async def _fetch_all(
+        calls: dict[str, Coroutine[Any, Any, Any]],
+        call_timeout: float,
+        deadline: float,
+    ) -> dict[str, Any]:
+        """Run independent upstream calls concurrently.
 
         Args:
-            address: The address to check.
+            calls: The upstream calls by name.
+            call_timeout: The timeout of each call in seconds.
+            deadline: The timeout of all the calls together in seconds.
+
+        Returns:
+            The results by name, without the calls that timed out.
 
         Raises:
-            InvalidAddressException: If the address is invalid.
+            ExplorerTimeoutError: If none of the calls finished in time.
 
         """
+        timed_out = object()
+
+        async def call_with_timeout(call: Coroutine[Any, Any, Any]) -> Any:
+            try:
+                return await asyncio.wait_for(call, timeout=call_timeout)
+            except TimeoutError:
+                return timed_out
+
+        tasks = {
+            name: asyncio.ensure_future(call_with_timeout(call))
+            for name, call in calls.items()
+        }
+        done, pending = await asyncio.wait(
+            tasks.values(), timeout=deadline, return_when=asyncio.FIRST_EXCEPTION
+        )
+
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+        for task in done:
+            if (error := task.exception()) is not None:
+                raise error
+
+        results = {
+            name: task.result()
+            for name, task in tasks.items()
+            if task in done and task.result() is not timed_out
+        }
+        if calls and not results:
+            raise ExplorerTimeoutError
+
+        return results
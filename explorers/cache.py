@@ -0,0 +1,230 @@
+import asyncio
+import json
+import logging
+import time
+from contextlib import suppress
+from typing import Any
+
+from redis.asyncio import Redis
+from redis.exceptions import LockError, RedisError
+
+from enums.network import NetworkEnum
+from exceptions.explorers import AccountNotFoundError
+from explorers.base import BaseExplorer
+from metrics.definitions import explorer_cache_events
+from schemas.wallet import WalletInfo
+from settings import cache_settings
+
+logger = logging.getLogger(__name__)
+
+LOCK_POLL_INTERVAL = 0.05
+
+
+class CachedExplorer(BaseExplorer):
+    def __init__(
+        self,
+        explorer: BaseExplorer,
+        network: NetworkEnum,
+        redis: Redis,
+    ):
+        self._explorer = explorer
+        self._network = network
+        self._redis = redis
+
+        self._refreshing: set[str] = set()
+        self._tasks: set[asyncio.Task] = set()
+
+    async def get_wallet_info(self, address: str) -> WalletInfo:
+        key = f"{cache_settings.key_prefix}:{self._network}:{address}"
+        entry = await self._read(key=key)
+
+        if entry is None:
+            self._count(outcome="miss")
+            return await self._load(key=key, address=address)
+
+        if entry.get("not_found"):
+            self._count(outcome="negative_hit")
+            raise AccountNotFoundError
+
+        if time.time() - entry["fetched_at"] > cache_settings.ttl:
+            self._count(outcome="stale_hit")
+            self._refresh(key=key, address=address)
+        else:
+            self._count(outcome="hit")
+
+        return self._get_wallet_info(entry=entry)
+
+    def normalize_address(self, address: str) -> str:
+        return self._explorer.normalize_address(address=address)
+
+    def normalize_addresses(self, addresses: list[str]) -> dict[str, str | None]:
+        return self._explorer.normalize_addresses(addresses=addresses)
+
+    async def close(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+        await self._explorer.close()
+
+    async def _load(self, key: str, address: str) -> WalletInfo:
+        """Load the wallet info into the cache.
+
+        With the distributed lock enabled, only the worker holding the lock of the
+        key calls the explorer while the others wait for its result in the cache.
+
+        Args:
+            key: The cache key.
+            address: The address of the wallet.
+
+        Returns:
+            The wallet info.
+
+        """
+        if not cache_settings.lock_enabled:
+            return await self._fetch(key=key, address=address)
+
+        started_at = time.time()
+        lock = self._redis.lock(
+            name=f"{key}:lock", timeout=cache_settings.lock_timeout, blocking=False
+        )
+
+        try:
+            acquired = await lock.acquire()
+        except RedisError:
+            logger.warning("Failed to lock cached wallet %s", key, exc_info=True)
+            acquired = False
+        else:
+            if not acquired:
+                entry = await self._wait(key=key, newer_than=started_at)
+                if entry is not None:
+                    self._count(outcome="coalesced")
+                    if entry.get("not_found"):
+                        raise AccountNotFoundError
+                    return self._get_wallet_info(entry=entry)
+
+        try:
+            return await self._fetch(key=key, address=address)
+        finally:
+            if acquired:
+                with suppress(LockError, RedisError):
+                    await lock.release()
+
+    async def _wait(self, key: str, newer_than: float) -> dict[str, Any] | None:
+        """Wait for another worker to put a fresh entry into the cache.
+
+        The entry and the lock are read together, so the wait ends as soon as
+        the lock is released without a cached entry, such as for a partial
+        result or a failed lookup.
+
+        Args:
+            key: The cache key.
+            newer_than: The timestamp the entry must be fetched after.
+
+        Returns:
+            The entry, or None if it did not appear in time.
+
+        """
+        deadline = time.monotonic() + cache_settings.lock_wait
+        while time.monotonic() < deadline:
+            await asyncio.sleep(LOCK_POLL_INTERVAL)
+            try:
+                raw, locked = await self._redis.mget(key, f"{key}:lock")
+            except RedisError:
+                self._count(outcome="error")
+                logger.warning("Failed to read cached wallet %s", key, exc_info=True)
+                return None
+
+            entry = None if raw is None else json.loads(raw)
+            if entry is not None and entry["fetched_at"] >= newer_than:
+                return entry
+            if locked is None:
+                return None
+
+        return None
+
+    async def _fetch(self, key: str, address: str) -> WalletInfo:
+        """Fetch the wallet info from the wrapped explorer and cache it.
+
+        Partial results are returned but not cached.
+
+        Args:
+            key: The cache key.
+            address: The address of the wallet.
+
+        Returns:
+            The wallet info.
+
+        """
+        try:
+            wallet_info = await self._explorer.get_wallet_info(address=address)
+        except AccountNotFoundError:
+            await self._write(
+                key=key,
+                entry={"fetched_at": time.time(), "not_found": True},
+                ttl=cache_settings.negative_ttl,
+            )
+            raise
+
+        if not wallet_info.missing_fields:
+            await self._write(
+                key=key,
+                entry={
+                    "fetched_at": wallet_info.fetched_at.timestamp(),
+                    "value": wallet_info.model_dump(mode="json"),
+                },
+                ttl=cache_settings.ttl + cache_settings.stale_ttl,
+            )
+
+        return wallet_info
+
+    def _refresh(self, key: str, address: str) -> None:
+        """Refresh a stale cache entry in the background.
+
+        Args:
+            key: The cache key.
+            address: The address of the wallet.
+
+        """
+        if key in self._refreshing:
+            return
+
+        async def refresh() -> None:
+            try:
+                await self._load(key=key, address=address)
+            except Exception:
+                logger.warning("Failed to refresh cached wallet %s", key, exc_info=True)
+            finally:
+                self._refreshing.discard(key)
+
+        self._refreshing.add(key)
+        task = asyncio.create_task(refresh())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    @staticmethod
+    def _get_wallet_info(entry: dict[str, Any]) -> WalletInfo:
+        # The state is as old as the entry, not as the read.
+        return WalletInfo.model_validate(
+            {**entry["value"], "fetched_at": entry["fetched_at"]}
+        )
+
+    async def _read(self, key: str) -> dict[str, Any] | None:
+        try:
+            raw = await self._redis.get(key)
+        except RedisError:
+            self._count(outcome="error")
+            logger.warning("Failed to read cached wallet %s", key, exc_info=True)
+            return None
+
+        return None if raw is None else json.loads(raw)
+
+    async def _write(self, key: str, entry: dict[str, Any], ttl: int) -> None:
+        try:
+            await self._redis.set(key, json.dumps(entry), ex=ttl)
+        except RedisError:
+            self._count(outcome="error")
+            logger.warning("Failed to cache wallet %s", key, exc_info=True)
+
+    def _count(self, outcome: str) -> None:
+        explorer_cache_events.labels(network=self._network, outcome=outcome).inc()
@@ -0,0 +1,76 @@
+import time
+from typing import Callable
+
+
+class CircuitBreaker:
+    """Stop calling an upstream after consecutive failures.
+
+    Once open, the breaker lets a single probe call through after the recovery
+    time, and closes again when it succeeds. The optional `on_change` callback
+    is called with the new state whenever a call sees the state change.
+
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int,
+        recovery_time: float,
+        on_change: Callable[[str], None] | None = None,
+    ):
+        self._failure_threshold = failure_threshold
+        self._recovery_time = recovery_time
+        self._on_change = on_change
+
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._probing = False
+        self._reported_state: str | None = None
+        self._report()
+
+    @property
+    def state(self) -> str:
+        if self._opened_at is None:
+            return "closed"
+        if time.monotonic() - self._opened_at < self._recovery_time:
+            return "open"
+        return "half_open"
+
+    def allow(self) -> bool:
+        """Check whether a call may go through, taking the probe if half open.
+
+        Returns:
+            True if the call may go through.
+
+        """
+        state = self.state
+        self._report()
+        if state == "closed":
+            return True
+        if state == "open" or self._probing:
+            return False
+
+        self._probing = True
+        return True
+
+    def record_success(self) -> None:
+        self._failures = 0
+        self._opened_at = None
+        self._probing = False
+        self._report()
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        if self._opened_at is not None or self._failures >= self._failure_threshold:
+            self._opened_at = time.monotonic()
+        self._probing = False
+        self._report()
+
+    def abandon(self) -> None:
+        """Forget a call cancelled before it completed."""
+        self._probing = False
+
+    def _report(self) -> None:
+        state = self.state
+        if self._on_change is not None and state != self._reported_state:
+            self._on_change(state)
+        self._reported_state = state
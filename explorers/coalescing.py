@@ -0,0 +1,24 @@
+from explorers.base import BaseExplorer
+from explorers.singleflight import SingleFlight
+from schemas.wallet import WalletInfo
+
+
+class CoalescingExplorer(BaseExplorer):
+    def __init__(self, explorer: BaseExplorer):
+        self._explorer = explorer
+        self._flights: SingleFlight[WalletInfo] = SingleFlight()
+
+    async def get_wallet_info(self, address: str) -> WalletInfo:
+        return await self._flights.do(
+            key=address,
+            call=lambda: self._explorer.get_wallet_info(address=address),
+        )
+
+    def normalize_address(self, address: str) -> str:
+        return self._explorer.normalize_address(address=address)
+
+    def normalize_addresses(self, addresses: list[str]) -> dict[str, str | None]:
+        return self._explorer.normalize_addresses(addresses=addresses)
+
+    async def close(self) -> None:
+        await self._explorer.close()
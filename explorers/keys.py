@@ -0,0 +1,177 @@
+import asyncio
+import hashlib
+import logging
+import time
+from collections import Counter
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from exceptions.explorers import ExplorerRateLimitedError
+from metrics.definitions import (
+    explorer_key_rate_limits,
+    explorer_key_requests,
+    explorer_key_skips,
+)
+from settings.explorer import explorer_settings
+
+logger = logging.getLogger(__name__)
+
+KEY_POLL_INTERVAL = 0.02
+KEY_VISIBLE_LENGTH = 4
+
+# Refill the token bucket of a key and take a token, unless the key cools down.
+# Returns 1 when a token was taken, 0 when the bucket is empty and -1 when the
+# key cools down.
+BUCKET_SCRIPT = """
+if redis.call('EXISTS', KEYS[2]) == 1 then
+    return -1
+end
+
+local rate = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+
+local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'updated_at')
+local tokens = tonumber(bucket[1]) or burst
+local updated_at = tonumber(bucket[2]) or now
+tokens = math.min(burst, tokens + (now - updated_at) * rate)
+
+local taken = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+    taken = 1
+end
+
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'updated_at', now)
+redis.call('EXPIRE', KEYS[1], math.ceil(burst / rate) + 1)
+
+return taken
+"""
+
+
+def mask_key(key: str) -> str:
+    """Hide an API key but its last characters, to label its metrics.
+
+    Args:
+        key: The API key.
+
+    Returns:
+        The masked key.
+
+    """
+    return f"***{key[-KEY_VISIBLE_LENGTH:]}"
+
+
+class ApiKeyPool:
+    """Spread requests over API keys within the rate limit of each key.
+
+    The least loaded key with a token in its bucket is picked. With Redis the
+    buckets and cool-downs are shared by all the processes using the keys,
+    otherwise keys are only rotated and cooled down locally.
+
+    """
+
+    def __init__(self, keys: list[str], redis: Redis | None = None):
+        if not keys:
+            message = "At least one API key is required"
+            raise ValueError(message)
+
+        self._keys = keys
+        self._redis = redis
+        self._labels = {key: mask_key(key=key) for key in keys}
+        self._in_flight: Counter[str] = Counter()
+        self._cooldown_until: dict[str, float] = dict.fromkeys(keys, 0.0)
+        self._bucket_script = (
+            redis.register_script(BUCKET_SCRIPT) if redis is not None else None
+        )
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    async def acquire(self) -> str:
+        """Take the least loaded key with capacity, waiting a bit for one.
+
+        Returns:
+            The API key, to be released once the request is done.
+
+        Raises:
+            ExplorerRateLimitedError: If no key has capacity in time.
+
+        """
+        deadline = time.monotonic() + explorer_settings.tron_key_wait
+
+        while True:
+            now = time.monotonic()
+            keys = sorted(
+                (key for key in self._keys if self._cooldown_until[key] <= now),
+                key=lambda key: self._in_flight[key],
+            )
+
+            for key in keys:
+                if await self._take(key=key):
+                    self._in_flight[key] += 1
+                    explorer_key_requests.labels(key=self._labels[key]).inc()
+                    return key
+
+            if time.monotonic() >= deadline:
+                raise ExplorerRateLimitedError
+
+            await asyncio.sleep(KEY_POLL_INTERVAL)
+
+    def release(self, key: str) -> None:
+        self._in_flight[key] -= 1
+
+    async def cool_down(self, key: str) -> None:
+        """Skip a key rate limited by the API for a while.
+
+        Args:
+            key: The API key.
+
+        """
+        explorer_key_rate_limits.labels(key=self._labels[key]).inc()
+        self._cooldown_until[key] = (
+            time.monotonic() + explorer_settings.tron_key_cooldown
+        )
+
+        if self._redis is None or not explorer_settings.tron_key_cooldown:
+            return
+
+        try:
+            await self._redis.set(
+                f"{self._get_name(key=key)}:cooldown",
+                1,
+                px=int(explorer_settings.tron_key_cooldown * 1000),
+            )
+        except RedisError:
+            logger.warning("Failed to share the cool-down of an API key", exc_info=True)
+
+    async def _take(self, key: str) -> bool:
+        if self._bucket_script is None or not explorer_settings.tron_key_rate:
+            return True
+
+        name = self._get_name(key=key)
+        try:
+            taken = await self._bucket_script(
+                keys=[name, f"{name}:cooldown"],
+                args=[
+                    explorer_settings.tron_key_rate,
+                    explorer_settings.tron_key_burst,
+                ],
+            )
+        except RedisError:
+            logger.warning("Failed to take an API key token", exc_info=True)
+            return True
+
+        if taken != 1:
+            explorer_key_skips.labels(
+                key=self._labels[key], reason="throttled" if taken == 0 else "cooling"
+            ).inc()
+
+        return taken == 1
+
+    @staticmethod
+    def _get_name(key: str) -> str:
+        digest = hashlib.sha256(key.encode()).hexdigest()[:16]
+        return f"{explorer_settings.tron_key_prefix}:{digest}"
@@ -0,0 +1,35 @@
+import time
+
+from enums.network import NetworkEnum
+from explorers.base import BaseExplorer
+from metrics.definitions import explorer_call_duration, explorer_call_errors
+from schemas.wallet import WalletInfo
+
+
+class MeteredExplorer(BaseExplorer):
+    def __init__(self, explorer: BaseExplorer, network: NetworkEnum):
+        self._explorer = explorer
+        self._network = network
+
+    async def get_wallet_info(self, address: str) -> WalletInfo:
+        labels = {"network": self._network, "method": "get_wallet_info"}
+        started_at = time.perf_counter()
+
+        try:
+            return await self._explorer.get_wallet_info(address=address)
+        except Exception as err:
+            explorer_call_errors.labels(**labels, error=type(err).__name__).inc()
+            raise
+        finally:
+            explorer_call_duration.labels(**labels).observe(
+                time.perf_counter() - started_at
+            )
+
+    def normalize_address(self, address: str) -> str:
+        return self._explorer.normalize_address(address=address)
+
+    def normalize_addresses(self, addresses: list[str]) -> dict[str, str | None]:
+        return self._explorer.normalize_addresses(addresses=addresses)
+
+    async def close(self) -> None:
+        await self._explorer.close()
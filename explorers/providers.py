@@ -0,0 +1,292 @@
+import asyncio
+import time
+from collections import deque
+from http import HTTPStatus
+from typing import Any, Iterator
+from urllib.parse import urljoin, urlsplit
+
+import httpx
+from tronpy.providers import AsyncHTTPProvider
+
+from exceptions.explorers import ExplorerRateLimitedError, ExplorerUnavailableError
+from explorers.circuit_breaker import CircuitBreaker
+from explorers.keys import ApiKeyPool
+from metrics.definitions import (
+    explorer_upstream_breaker_state,
+    explorer_upstream_duration,
+    explorer_upstream_failures,
+    explorer_upstream_hedged,
+)
+from settings.explorer import explorer_settings
+
+MIN_HEDGE_SAMPLES = 10
+BREAKER_STATES = {"closed": 0, "half_open": 1, "open": 2}
+
+
+def uses_api_keys(endpoint_uri: str) -> bool:
+    """Check whether requests to an endpoint are sent with an API key.
+
+    Args:
+        endpoint_uri: The endpoint URI.
+
+    Returns:
+        True for the hosts of `tron_key_hosts` and their subdomains.
+
+    """
+    host = urlsplit(endpoint_uri).hostname or ""
+    return any(
+        host == key_host or host.endswith(f".{key_host}")
+        for key_host in explorer_settings.tron_key_hosts
+    )
+
+
+class KeyPoolHTTPProvider(AsyncHTTPProvider):
+    """Tron HTTP provider sending each request with a key of a pool.
+
+    A key answered with 429 is cooled down and the request is retried with
+    another key of the pool. Without a pool, or for an endpoint that takes no
+    key, the request is sent once without a key.
+
+    """
+
+    def __init__(
+        self, keys: ApiKeyPool | None, timeout: float, client: httpx.AsyncClient
+    ):
+        super().__init__(timeout=timeout, client=client)
+        self._keys = keys
+
+    async def make_request(self, method: str, params: Any = None) -> dict:
+        return await self._post(
+            endpoint_uri=self.endpoint_uri, method=method, params=params
+        )
+
+    async def _post(
+        self, endpoint_uri: str, method: str, params: Any, keyed: bool = True
+    ) -> dict:
+        url = urljoin(endpoint_uri, method)
+
+        if self._keys is None or not keyed:
+            response = await self.client.post(url, json=params or {})
+            if response.status_code == HTTPStatus.TOO_MANY_REQUESTS:
+                raise ExplorerRateLimitedError
+
+            response.raise_for_status()
+            return response.json()
+
+        for _ in range(len(self._keys)):
+            key = await self._keys.acquire()
+            try:
+                response = await self.client.post(
+                    url, json=params or {}, headers={"Tron-Pro-Api-Key": key}
+                )
+            finally:
+                self._keys.release(key=key)
+
+            if response.status_code != HTTPStatus.TOO_MANY_REQUESTS:
+                response.raise_for_status()
+                return response.json()
+
+            await self._keys.cool_down(key=key)
+
+        raise ExplorerRateLimitedError
+
+
+class Upstream:
+    def __init__(self, endpoint_uri: str):
+        self.endpoint_uri = endpoint_uri
+        self.keyed = uses_api_keys(endpoint_uri=endpoint_uri)
+        self.breaker = CircuitBreaker(
+            failure_threshold=explorer_settings.tron_breaker_failures,
+            recovery_time=explorer_settings.tron_breaker_recovery,
+            on_change=self._report_breaker_state,
+        )
+        self.latencies: deque[float] = deque(maxlen=explorer_settings.tron_hedge_window)
+
+    def get_hedge_delay(self) -> float | None:
+        """Get the latency after which a call should be hedged.
+
+        Returns:
+            The latency percentile in seconds, or None without enough samples.
+
+        """
+        if len(self.latencies) < MIN_HEDGE_SAMPLES:
+            return None
+
+        latencies = sorted(self.latencies)
+        index = round(explorer_settings.tron_hedge_percentile / 100 * len(latencies))
+        return max(
+            explorer_settings.tron_hedge_min_delay,
+            latencies[min(index, len(latencies) - 1)],
+        )
+
+    def _report_breaker_state(self, state: str) -> None:
+        explorer_upstream_breaker_state.labels(endpoint=self.endpoint_uri).set(
+            BREAKER_STATES[state]
+        )
+
+
+class FailoverHTTPProvider(KeyPoolHTTPProvider):
+    """Tron HTTP provider failing over between endpoints.
+
+    Endpoints are tried in order, skipping those with an open circuit breaker.
+    A rate limited endpoint is skipped too, without opening its breaker, and
+    the API keys of the pool are only sent to the hosts that take them. With
+    hedging, a call slower than the latency percentile of its endpoint is
+    also sent to the next endpoint and the first answer wins.
+
+    """
+
+    def __init__(
+        self,
+        keys: ApiKeyPool | None,
+        timeout: float,
+        client: httpx.AsyncClient,
+        endpoints: list[str],
+    ):
+        super().__init__(keys=keys, timeout=timeout, client=client)
+        self.upstreams = [Upstream(endpoint_uri=endpoint) for endpoint in endpoints]
+
+    async def make_request(self, method: str, params: Any = None) -> dict:
+        upstreams = iter(self.upstreams)
+        pending: dict[asyncio.Task, Upstream] = {}
+        error: BaseException | None = None
+        rate_limited = True
+
+        latest = self._launch(
+            upstreams=upstreams, pending=pending, method=method, params=params
+        )
+        try:
+            while pending:
+                done, _ = await asyncio.wait(
+                    pending,
+                    timeout=self._get_hedge_delay(upstream=latest),
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+
+                if not done:
+                    latest = self._launch(
+                        upstreams=upstreams,
+                        pending=pending,
+                        method=method,
+                        params=params,
+                    )
+                    if latest is not None:
+                        explorer_upstream_hedged.labels(
+                            endpoint=latest.endpoint_uri
+                        ).inc()
+                    continue
+
+                for task in done:
+                    pending.pop(task)
+                    if (task_error := task.exception()) is None:
+                        return task.result()
+                    if not isinstance(task_error, ExplorerRateLimitedError):
+                        if not self._is_failure(error=task_error):
+                            raise task_error
+                        rate_limited = False
+
+                    error = task_error
+                    latest = self._launch(
+                        upstreams=upstreams,
+                        pending=pending,
+                        method=method,
+                        params=params,
+                    )
+        finally:
+            for task in pending:
+                task.cancel()
+
+        if error is not None and rate_limited:
+            raise ExplorerRateLimitedError from error
+
+        raise ExplorerUnavailableError from error
+
+    def _launch(
+        self,
+        upstreams: Iterator[Upstream],
+        pending: dict[asyncio.Task, Upstream],
+        method: str,
+        params: Any,
+    ) -> Upstream | None:
+        """Send the request to the next endpoint whose breaker allows it.
+
+        Args:
+            upstreams: The endpoints not tried yet.
+            pending: The calls in flight, the new call is added to.
+            method: The API method.
+            params: The API params.
+
+        Returns:
+            The endpoint called, or None if no endpoint is left.
+
+        """
+        for upstream in upstreams:
+            if upstream.breaker.allow():
+                task = asyncio.create_task(
+                    self._call(upstream=upstream, method=method, params=params)
+                )
+                pending[task] = upstream
+                return upstream
+
+        return None
+
+    async def _call(self, upstream: Upstream, method: str, params: Any) -> dict:
+        started_at = time.monotonic()
+        outcome = "error"
+
+        try:
+            result = await self._post(
+                endpoint_uri=upstream.endpoint_uri,
+                method=method,
+                params=params,
+                keyed=upstream.keyed,
+            )
+        except asyncio.CancelledError:
+            outcome = "cancelled"
+            upstream.breaker.abandon()
+            raise
+        except ExplorerRateLimitedError:
+            outcome = "rate_limited"
+            upstream.breaker.abandon()
+            raise
+        except Exception as err:
+            if self._is_failure(error=err):
+                outcome = "failure"
+                explorer_upstream_failures.labels(endpoint=upstream.endpoint_uri).inc()
+                upstream.breaker.record_failure()
+            else:
+                upstream.breaker.abandon()
+            raise
+        else:
+            outcome = "ok"
+        finally:
+            explorer_upstream_duration.labels(
+                endpoint=upstream.endpoint_uri, method=method, outcome=outcome
+            ).observe(time.monotonic() - started_at)
+
+        upstream.breaker.record_success()
+        upstream.latencies.append(time.monotonic() - started_at)
+        return result
+
+    @staticmethod
+    def _get_hedge_delay(upstream: Upstream | None) -> float | None:
+        if not explorer_settings.tron_hedge_enabled or upstream is None:
+            return None
+
+        return upstream.get_hedge_delay()
+
+    @staticmethod
+    def _is_failure(error: BaseException | None) -> bool:
+        """Check whether an error means the endpoint is unhealthy.
+
+        Args:
+            error: The error of a call.
+
+        Returns:
+            True for transport errors and server errors.
+
+        """
+        if isinstance(error, httpx.HTTPStatusError):
+            return error.response.status_code >= HTTPStatus.INTERNAL_SERVER_ERROR
+
+        return isinstance(error, httpx.TransportError)
@@ -0,0 +1,40 @@
+import asyncio
+from typing import Callable
+
+from enums.network import NetworkEnum
+from explorers.base import BaseExplorer
+from explorers.utils import get_explorer
+
+
+class ExplorerRegistry:
+    def __init__(
+        self, factory: Callable[[NetworkEnum], BaseExplorer] = get_explorer
+    ) -> None:
+        self._factory = factory
+        self._explorers: dict[NetworkEnum, BaseExplorer] = {}
+
+    def get(self, network: NetworkEnum) -> BaseExplorer:
+        """Get the shared explorer of the network, creating it on first use.
+
+        Args:
+            network: The network to use.
+
+        Returns:
+            The explorer.
+
+        """
+        explorer = self._explorers.get(network)
+        if explorer is None:
+            explorer = self._explorers[network] = self._factory(network)
+
+        return explorer
+
+    async def close(self) -> None:
+        """Close all the explorers created by the registry."""
+        explorers = list(self._explorers.values())
+        self._explorers.clear()
+
+        await asyncio.gather(*(explorer.close() for explorer in explorers))
+
+
+explorer_registry = ExplorerRegistry()
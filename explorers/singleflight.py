@@ -0,0 +1,40 @@
+import asyncio
+from typing import Awaitable, Callable, Generic, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight(Generic[T]):
+    def __init__(self) -> None:
+        self._calls: dict[Hashable, asyncio.Future[T]] = {}
+
+    async def do(self, key: Hashable, call: Callable[[], Awaitable[T]]) -> T:
+        """Run the call once for all the concurrent callers of the same key.
+
+        The shared call is shielded, so a cancelled caller does not cancel it for
+        the others.
+
+        Args:
+            key: The key identifying the call.
+            call: The call to run if none is in flight for the key.
+
+        Returns:
+            The result of the in-flight call.
+
+        """
+        future = self._calls.get(key)
+
+        if future is None:
+            future = self._calls[key] = asyncio.ensure_future(call())
+
+            def forget(done: asyncio.Future[T]) -> None:
+                self._calls.pop(key, None)
+                if not done.cancelled():
+                    done.exception()
+
+            future.add_done_callback(forget)
+
+        return await asyncio.shield(future)
+
+    def __len__(self) -> int:
+        return len(self._calls)
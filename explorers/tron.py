@@ -1,47 +1,100 @@
 from decimal import Decimal
+from typing import Any
 
+import httpx
+from redis.asyncio import Redis
 from tronpy import AsyncTron
-from tronpy.providers import AsyncHTTPProvider
+from tronpy.exceptions import AddressNotFound
 
 from enums.network import NetworkEnum
-from exceptions.explorers import InvalidAddressError
+from exceptions.explorers import AccountNotFoundError
 from explorers.base import BaseExplorer
+from explorers.keys import ApiKeyPool
+from explorers.providers import FailoverHTTPProvider, uses_api_keys
+from explorers.tron_address import normalize_tron_address, normalize_tron_addresses
 from schemas.wallet import WalletInfo
 from settings.explorer import explorer_settings
 
 
 class TronExplorer(BaseExplorer):
-    def __init__(self):
-        api_key = explorer_settings.tron_api_key
-        if api_key is None:
+    def __init__(self, redis: Redis | None = None):
+        api_keys = explorer_settings.tron_keys
+        keyed = any(
+            uses_api_keys(endpoint_uri=endpoint)
+            for endpoint in explorer_settings.tron_endpoints
+        )
+        if keyed and not api_keys:
             message = "TRON API key is required but not configured"
             raise ValueError(message)
 
-        self._client = AsyncTron(provider=AsyncHTTPProvider(api_key=api_key))
+        self.keys = ApiKeyPool(keys=api_keys, redis=redis) if api_keys else None
+        self._client = AsyncTron(
+            provider=FailoverHTTPProvider(
+                keys=self.keys,
+                endpoints=explorer_settings.tron_endpoints,
+                timeout=explorer_settings.tron_timeout,
+                client=httpx.AsyncClient(
+                    timeout=httpx.Timeout(explorer_settings.tron_timeout),
+                    limits=httpx.Limits(
+                        max_connections=explorer_settings.http_max_connections,
+                        max_keepalive_connections=(
+                            explorer_settings.http_max_keepalive_connections
+                        ),
+                        keepalive_expiry=explorer_settings.http_keepalive_expiry,
+                    ),
+                ),
+            )
+        )
 
     async def get_wallet_info(self, address: str) -> WalletInfo:
-        account_info = await self._client.get_account(addr=address)
-        account_resource = await self._client.get_account_resource(addr=address)
+        try:
+            results = await self._fetch_all(
+                calls={
+                    "account": self._client.get_account(addr=address),
+                    "resource": self._client.get_account_resource(addr=address),
+                },
+                call_timeout=explorer_settings.tron_call_timeout,
+                deadline=explorer_settings.tron_deadline,
+            )
+        except AddressNotFound as err:
+            raise AccountNotFoundError from err
 
-        return WalletInfo(
-            network=NetworkEnum.TRON,
-            address=address,
-            balance=Decimal(account_info.get("balance", "0.0")) / Decimal(1_000_000),
-            bandwidth=max(
+        fields: dict[str, Any] = {}
+        missing_fields: list[str] = []
+
+        if (account_info := results.get("account")) is not None:
+            fields["balance"] = Decimal(account_info.get("balance", "0.0")) / Decimal(
+                1_000_000
+            )
+        else:
+            missing_fields.append("balance")
+
+        if (account_resource := results.get("resource")) is not None:
+            fields["bandwidth"] = max(
                 0,
                 account_resource.get("freeNetLimit", 0)
                 - account_resource.get("freeNetUsed", 0),
-            ),
-            energy=max(
+            )
+            fields["energy"] = max(
                 0,
                 account_resource.get("EnergyLimit", 0)
                 - account_resource.get("EnergyUsed", 0),
-            ),
+            )
+        else:
+            missing_fields.extend(["bandwidth", "energy"])
+
+        return WalletInfo(
+            network=NetworkEnum.TRON,
+            address=address,
+            missing_fields=missing_fields,
+            **fields,
         )
 
-    def check_is_valid_address(self, address: str) -> None:
-        try:
-            if not self._client.is_address(value=address):
-                raise InvalidAddressError
-        except ValueError as err:
-            raise InvalidAddressError from err
+    def normalize_address(self, address: str) -> str:
+        return normalize_tron_address(address=address)
+
+    def normalize_addresses(self, addresses: list[str]) -> dict[str, str | None]:
+        return normalize_tron_addresses(addresses=addresses)
+
+    async def close(self) -> None:
+        await self._client.close()
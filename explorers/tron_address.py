@@ -0,0 +1,114 @@
+from functools import lru_cache
+from hashlib import sha256
+
+from exceptions.explorers import InvalidAddressError
+
+ALPHABET = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
+ALPHABET_INDEX = {char: index for index, char in enumerate(ALPHABET)}
+HEX_DIGITS = frozenset("0123456789abcdefABCDEF")
+
+ADDRESS_PREFIX = 0x41
+ADDRESS_SIZE = 21
+CHECKSUM_SIZE = 4
+BASE58_LENGTH = 34
+HEX_LENGTH = ADDRESS_SIZE * 2
+CACHE_SIZE = 65536
+
+
+def _checksum(payload: bytes) -> bytes:
+    return sha256(sha256(payload).digest()).digest()[:CHECKSUM_SIZE]
+
+
+def _b58encode(data: bytes) -> str:
+    number = int.from_bytes(data, "big")
+    chars = []
+    while number:
+        number, remainder = divmod(number, 58)
+        chars.append(ALPHABET[remainder])
+
+    padding = len(data) - len(data.lstrip(b"\0"))
+    return ALPHABET[0] * padding + "".join(reversed(chars))
+
+
+def _b58decode(value: str) -> bytes | None:
+    number = 0
+    for char in value:
+        index = ALPHABET_INDEX.get(char)
+        if index is None:
+            return None
+        number = number * 58 + index
+
+    size = ADDRESS_SIZE + CHECKSUM_SIZE
+    if number.bit_length() > size * 8:
+        return None
+    return number.to_bytes(size, "big")
+
+
+def _decode(address: str) -> bytes | None:
+    """Decode a base58check or hex address to its 21 bytes.
+
+    Args:
+        address: The address.
+
+    Returns:
+        The address bytes, or None if the address is invalid.
+
+    """
+    if len(address) == BASE58_LENGTH:
+        data = _b58decode(address)
+        if data is None:
+            return None
+        payload, checksum = data[:ADDRESS_SIZE], data[ADDRESS_SIZE:]
+        if _checksum(payload) != checksum:
+            return None
+    else:
+        if address[:2].lower() == "0x":
+            address = address[2:]
+        # bytes.fromhex skips whitespace, so every char is checked first.
+        if len(address) != HEX_LENGTH or not HEX_DIGITS.issuperset(address):
+            return None
+        payload = bytes.fromhex(address)
+
+    return payload if payload[0] == ADDRESS_PREFIX else None
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _normalize(address: str) -> str | None:
+    payload = _decode(address=address.strip())
+    if payload is None:
+        return None
+
+    return _b58encode(payload + _checksum(payload))
+
+
+def normalize_tron_address(address: str) -> str:
+    """Validate a TRON address and get its canonical base58check form.
+
+    Args:
+        address: The address, in base58check or hex form.
+
+    Returns:
+        The base58check address.
+
+    Raises:
+        InvalidAddressError: If the address is invalid.
+
+    """
+    normalized = _normalize(address)
+    if normalized is None:
+        raise InvalidAddressError
+
+    return normalized
+
+
+def normalize_tron_addresses(addresses: list[str]) -> dict[str, str | None]:
+    """Validate TRON addresses and get their canonical base58check form.
+
+    Args:
+        addresses: The addresses, in base58check or hex form.
+
+    Returns:
+        The base58check address of each address, None for invalid ones.
+
+    """
+    return {address: _normalize(address) for address in addresses}
@@ -1,16 +1,34 @@
+from db.redis import redis_client
 from enums.network import NetworkEnum
 from explorers import BaseExplorer, TronExplorer
+from explorers.cache import CachedExplorer
+from explorers.coalescing import CoalescingExplorer
+from explorers.metered import MeteredExplorer
+from settings import cache_settings
 
 
 def get_explorer(network: NetworkEnum) -> BaseExplorer:
     """Get explorer by network.
 
+    The explorer calls are metered, the explorer is wrapped with the Redis
+    cache when it is enabled, and concurrent lookups of the same address share
+    a single call.
+
     Args:
         network: The network to use.
 
     """
     if network == NetworkEnum.TRON:
-        return TronExplorer()
+        explorer = TronExplorer(redis=redis_client)
+    else:
+        msg = f"Network {network} not supported"
+        raise ValueError(msg)
+
+    explorer = MeteredExplorer(explorer=explorer, network=network)
+
+    if cache_settings.enabled:
+        explorer = CachedExplorer(
+            explorer=explorer, network=network, redis=redis_client
+        )
 
-    msg = f"Network {network} not supported"
-    raise ValueError(msg)
+    return CoalescingExplorer(explorer=explorer)
@@ -1,6 +1,25 @@
+import os
+import shutil
+from pathlib import Path
+
+from prometheus_client import multiprocess
+
 bind = "0.0.0.0:8000"
 worker_class = "uvicorn.workers.UvicornWorker"
 worker_connections = 500
 max_requests = 2000
 max_requests_jitter = 400
 timeout = 300
+
+
+def on_starting(server):
+    # Metrics of the previous run must not be aggregated with the new workers.
+    directory = os.environ.get("PROMETHEUS_MULTIPROC_DIR")
+    if directory:
+        shutil.rmtree(directory, ignore_errors=True)
+        Path(directory).mkdir(parents=True)
+
+
+def child_exit(server, worker):
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        multiprocess.mark_process_dead(worker.pid)
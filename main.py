@@ -5,21 +5,37 @@ from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 
-from api.routers import wallet
+from api.responses import ModelJSONResponse
+from api.routers import metrics, wallet
 from broker import broker
+from db.redis import redis_client
 from exceptions.explorers import ExplorerError
+from exceptions.pagination import PaginationError
+from explorers.registry import explorer_registry
+from metrics import start_loop_lag_monitor, stop_loop_lag_monitor
+from middlewares import ProfilingMiddleware, PrometheusMiddleware
+from settings import api_settings, metrics_settings, profiling_settings
+from tasks.wallet import wallets_info_batcher, wallets_info_buffer
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     if not broker.is_worker_process:
         await broker.startup()
+        await start_loop_lag_monitor()
 
     yield
 
+    await wallets_info_buffer.close(timeout=api_settings.write_close_timeout)
+
     if not broker.is_worker_process:
+        await stop_loop_lag_monitor()
         await broker.shutdown()
 
+    await wallets_info_batcher.close()
+    await explorer_registry.close()
+    await redis_client.aclose()
+
 
 app = FastAPI(
     title="Wallet Explorer API",
@@ -27,6 +43,7 @@ app = FastAPI(
     description="API for getting information about wallets",
     redoc_url=None,
     lifespan=lifespan,
+    default_response_class=ModelJSONResponse,
 )
 
 app.add_middleware(
@@ -37,6 +54,12 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+if metrics_settings.enabled:
+    app.add_middleware(middleware_class=PrometheusMiddleware)
+
+if profiling_settings.enabled:
+    app.add_middleware(middleware_class=ProfilingMiddleware)
+
 
 @app.exception_handler(exc_class_or_status_code=ExplorerError)
 async def explorer_error_handler(request: Request, exc: ExplorerError) -> JSONResponse:
@@ -53,4 +76,24 @@ async def explorer_error_handler(request: Request, exc: ExplorerError) -> JSONRe
     return JSONResponse(content={"detail": exc.message}, status_code=exc.status_code)
 
 
+@app.exception_handler(exc_class_or_status_code=PaginationError)
+async def pagination_error_handler(
+    request: Request, exc: PaginationError
+) -> JSONResponse:
+    """Pagination error handler.
+
+    Args:
+        request: The request.
+        exc: The exception.
+
+    Returns:
+        The JSON response.
+
+    """
+    return JSONResponse(content={"detail": exc.message}, status_code=exc.status_code)
+
+
 app.include_router(router=wallet.router)
+
+if metrics_settings.enabled:
+    app.include_router(router=metrics.router)
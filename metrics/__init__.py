@@ -0,0 +1,25 @@
+from metrics.db import instrument_engine
+from metrics.exposition import (
+    get_registry,
+    mark_worker_dead,
+    render,
+    start_worker_metrics_server,
+)
+from metrics.loop import (
+    LoopLagMonitor,
+    loop_lag_monitor,
+    start_loop_lag_monitor,
+    stop_loop_lag_monitor,
+)
+
+__all__ = [
+    "LoopLagMonitor",
+    "get_registry",
+    "instrument_engine",
+    "loop_lag_monitor",
+    "mark_worker_dead",
+    "render",
+    "start_loop_lag_monitor",
+    "start_worker_metrics_server",
+    "stop_loop_lag_monitor",
+]
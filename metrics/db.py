@@ -0,0 +1,75 @@
+import time
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, ExceptionContext
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import QueuePool
+
+from metrics.definitions import db_pool_checked_out, db_pool_overflow, db_query_duration
+
+OPERATIONS = frozenset({"SELECT", "INSERT", "UPDATE", "DELETE", "WITH"})
+QUERY_STARTS_KEY = "metrics_query_starts"
+
+
+def get_operation(statement: str) -> str:
+    """Get the low cardinality operation label of a statement.
+
+    Args:
+        statement: The SQL statement.
+
+    Returns:
+        The leading keyword of the statement, or OTHER.
+
+    """
+    words = statement[:16].split(maxsplit=1)
+    keyword = words[0].upper() if words else ""
+    return keyword if keyword in OPERATIONS else "OTHER"
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    """Record the pool usage and the query durations of an engine.
+
+    The pool gauges are updated on every checkout and checkin, so they are
+    reported per process and summed over the live processes. Query start times
+    are stacked on the connection, as statements of a connection run in turn.
+
+    Args:
+        engine: The async engine.
+
+    """
+    pool = engine.sync_engine.pool
+
+    def update_overflow() -> None:
+        if isinstance(pool, QueuePool):
+            db_pool_overflow.set(max(pool.overflow(), 0))
+
+    @event.listens_for(engine.sync_engine, "checkout")
+    def on_checkout(*args: Any) -> None:
+        db_pool_checked_out.inc()
+        update_overflow()
+
+    @event.listens_for(engine.sync_engine, "checkin")
+    def on_checkin(*args: Any) -> None:
+        db_pool_checked_out.dec()
+        update_overflow()
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def before_cursor_execute(conn: Connection, *args: Any) -> None:
+        conn.info.setdefault(QUERY_STARTS_KEY, []).append(time.perf_counter())
+
+    @event.listens_for(engine.sync_engine, "after_cursor_execute")
+    def after_cursor_execute(
+        conn: Connection, cursor: Any, statement: str, *args: Any
+    ) -> None:
+        if starts := conn.info.get(QUERY_STARTS_KEY):
+            db_query_duration.labels(operation=get_operation(statement)).observe(
+                time.perf_counter() - starts.pop()
+            )
+
+    @event.listens_for(engine.sync_engine, "handle_error")
+    def handle_error(context: ExceptionContext) -> None:
+        if context.connection is not None and (
+            starts := context.connection.info.get(QUERY_STARTS_KEY)
+        ):
+            starts.pop()
@@ -0,0 +1,117 @@
+from prometheus_client import Counter, Gauge, Histogram
+
+QUERY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5)
+LAG_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+TASK_BUCKETS = (0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 300)
+
+http_request_duration = Histogram(
+    "http_request_duration_seconds",
+    "Duration of the HTTP requests by route",
+    ["method", "route", "status"],
+)
+
+explorer_call_duration = Histogram(
+    "explorer_call_duration_seconds",
+    "Duration of the explorer calls, without the cache",
+    ["network", "method"],
+)
+explorer_call_errors = Counter(
+    "explorer_call_errors_total",
+    "Failed explorer calls by error",
+    ["network", "method", "error"],
+)
+explorer_cache_events = Counter(
+    "explorer_cache_events_total",
+    "Explorer cache lookups, coalesced loads and errors by outcome",
+    ["network", "outcome"],
+)
+explorer_key_requests = Counter(
+    "explorer_api_key_requests_total",
+    "Requests sent with each API key, by masked key",
+    ["key"],
+)
+explorer_key_rate_limits = Counter(
+    "explorer_api_key_rate_limits_total",
+    "Rate limited answers cooling down each API key, by masked key",
+    ["key"],
+)
+explorer_key_skips = Counter(
+    "explorer_api_key_skips_total",
+    "API keys skipped for an empty bucket or a shared cool-down, by masked key",
+    ["key", "reason"],
+)
+explorer_upstream_duration = Histogram(
+    "explorer_upstream_request_duration_seconds",
+    "Duration of the requests sent to the explorer endpoints",
+    ["endpoint", "method", "outcome"],
+)
+explorer_upstream_breaker_state = Gauge(
+    "explorer_upstream_breaker_state",
+    "Circuit breaker state of the explorer endpoints: 0 closed, 1 half open, 2 open",
+    ["endpoint"],
+    multiprocess_mode="livemax",
+)
+explorer_upstream_hedged = Counter(
+    "explorer_upstream_hedged_total",
+    "Calls hedged to the explorer endpoints",
+    ["endpoint"],
+)
+explorer_upstream_failures = Counter(
+    "explorer_upstream_failures_total",
+    "Failures counted by the circuit breakers of the explorer endpoints",
+    ["endpoint"],
+)
+
+db_pool_checked_out = Gauge(
+    "db_pool_checked_out_connections",
+    "Connections checked out of the database pool",
+    multiprocess_mode="livesum",
+)
+db_pool_overflow = Gauge(
+    "db_pool_overflow_connections",
+    "Connections open beyond the database pool size",
+    multiprocess_mode="livesum",
+)
+db_query_duration = Histogram(
+    "db_query_duration_seconds",
+    "Duration of the database queries by operation",
+    ["operation"],
+    buckets=QUERY_BUCKETS,
+)
+
+task_queue_lag = Histogram(
+    "task_queue_lag_seconds",
+    "Time between sending a task and starting to execute it",
+    ["task_name"],
+    buckets=TASK_BUCKETS,
+)
+task_duration = Histogram(
+    "task_duration_seconds",
+    "Duration of the task executions",
+    ["task_name", "status"],
+    buckets=TASK_BUCKETS,
+)
+write_buffer_items = Counter(
+    "write_buffer_items_total",
+    "Items of the write-behind buffers published or dropped",
+    ["buffer", "outcome"],
+)
+write_buffer_backpressure = Counter(
+    "write_buffer_backpressure_total",
+    "Additions to a full write-behind buffer, waiting for room",
+    ["buffer"],
+)
+taskiq_admin_events = Counter(
+    "taskiq_admin_events_total",
+    "Task events for the taskiq admin by outcome",
+    ["outcome"],
+)
+
+event_loop_lag = Histogram(
+    "event_loop_lag_seconds",
+    "Delay of the event loop in running a scheduled callback",
+    buckets=LAG_BUCKETS,
+)
+event_loop_stalls = Counter(
+    "event_loop_stalls_total", "Event loop stalls longer than the threshold"
+)
@@ -0,0 +1,79 @@
+import logging
+import os
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    generate_latest,
+    multiprocess,
+    start_http_server,
+)
+from taskiq import TaskiqState
+
+from settings import metrics_settings
+
+logger = logging.getLogger(__name__)
+
+MULTIPROCESS_DIR_ENV = "PROMETHEUS_MULTIPROC_DIR"
+
+
+def get_registry() -> CollectorRegistry:
+    """Get the registry to expose.
+
+    With `PROMETHEUS_MULTIPROC_DIR` set, every process writes its metrics to
+    that directory and the registry aggregates all of them, so any gunicorn
+    worker answers the scrape for the whole server.
+
+    Returns:
+        The registry.
+
+    """
+    if MULTIPROCESS_DIR_ENV not in os.environ:
+        return REGISTRY
+
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    return registry
+
+
+def render() -> tuple[bytes, str]:
+    """Render the metrics in the Prometheus text format.
+
+    Returns:
+        The metrics and their content type.
+
+    """
+    return generate_latest(get_registry()), CONTENT_TYPE_LATEST
+
+
+async def start_worker_metrics_server(state: TaskiqState) -> None:
+    """Serve the metrics of a taskiq worker on its own port.
+
+    Workers sharing a multiprocess directory are all exposed by the first one
+    binding the port.
+
+    Args:
+        state: The worker state.
+
+    """
+    if not metrics_settings.enabled or not metrics_settings.worker_port:
+        return
+
+    try:
+        start_http_server(port=metrics_settings.worker_port, registry=get_registry())
+    except OSError:
+        logger.info(
+            "Metrics port %s is served by another worker", metrics_settings.worker_port
+        )
+
+
+async def mark_worker_dead(state: TaskiqState) -> None:
+    """Drop the live gauges of a stopping worker from the multiprocess directory.
+
+    Args:
+        state: The worker state.
+
+    """
+    if MULTIPROCESS_DIR_ENV in os.environ:
+        multiprocess.mark_process_dead(os.getpid())
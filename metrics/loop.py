@@ -0,0 +1,120 @@
+import asyncio
+import logging
+import sys
+import threading
+import time
+import traceback
+from contextlib import suppress
+
+from taskiq import TaskiqState
+
+from metrics.definitions import event_loop_lag, event_loop_stalls
+from settings import metrics_settings
+
+logger = logging.getLogger(__name__)
+
+
+class LoopLagMonitor:
+    """Measure the lag of an event loop and report what blocks it.
+
+    A task on the loop sleeps for the interval and records how late it wakes
+    up. A watchdog thread notices when that task is late by more than the
+    threshold, which means the loop is blocked, and logs the stack of the loop
+    thread while it is still blocked.
+
+    """
+
+    def __init__(self, interval: float, threshold: float):
+        self.interval = interval
+        self.threshold = threshold
+
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread_id = 0
+        self._heartbeat = 0.0
+        self._task: asyncio.Task | None = None
+        self._watchdog: threading.Thread | None = None
+        self._stopping = threading.Event()
+
+    async def start(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._thread_id = threading.get_ident()
+        self._heartbeat = time.monotonic()
+        self._stopping.clear()
+
+        self._task = asyncio.create_task(self._measure())
+        self._watchdog = threading.Thread(
+            target=self._watch, name="loop-lag-watchdog", daemon=True
+        )
+        self._watchdog.start()
+
+    async def stop(self) -> None:
+        self._stopping.set()
+
+        if self._task is not None:
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+        if self._watchdog is not None:
+            await asyncio.to_thread(self._watchdog.join)
+            self._watchdog = None
+
+    async def _measure(self) -> None:
+        while True:
+            started_at = time.monotonic()
+            await asyncio.sleep(self.interval)
+
+            now = time.monotonic()
+            event_loop_lag.observe(max(now - started_at - self.interval, 0))
+            self._heartbeat = now
+
+    def _watch(self) -> None:
+        reported_heartbeat = None
+
+        while not self._stopping.wait(min(self.interval, self.threshold) / 2):
+            heartbeat = self._heartbeat
+            lag = time.monotonic() - heartbeat - self.interval
+
+            if lag >= self.threshold and heartbeat != reported_heartbeat:
+                reported_heartbeat = heartbeat
+                self._report(lag=lag)
+
+    def _report(self, lag: float) -> None:
+        event_loop_stalls.inc()
+
+        frame = sys._current_frames().get(self._thread_id)
+        task = asyncio.current_task(loop=self._loop) if self._loop else None
+        logger.warning(
+            "Event loop blocked for %.3fs in %s, at:\n%s",
+            lag,
+            task.get_name() if task is not None else "a callback",
+            "".join(traceback.format_stack(f=frame)) if frame else "unknown",
+        )
+
+
+loop_lag_monitor = LoopLagMonitor(
+    interval=metrics_settings.loop_monitor_interval_ms / 1000,
+    threshold=metrics_settings.loop_stall_threshold_ms / 1000,
+)
+
+
+async def start_loop_lag_monitor(state: TaskiqState | None = None) -> None:
+    """Start monitoring the event loop of the process, if enabled.
+
+    Args:
+        state: The worker state, when started by a taskiq worker.
+
+    """
+    if metrics_settings.loop_monitor_enabled:
+        await loop_lag_monitor.start()
+
+
+async def stop_loop_lag_monitor(state: TaskiqState | None = None) -> None:
+    """Stop monitoring the event loop of the process.
+
+    Args:
+        state: The worker state, when stopped by a taskiq worker.
+
+    """
+    await loop_lag_monitor.stop()
@@ -0,0 +1,11 @@
+from middlewares.metrics import PrometheusMiddleware, TaskiqMetricsMiddleware
+from middlewares.profiling import ProfilingMiddleware, TaskiqProfilingMiddleware
+from middlewares.taskiq_admin import TaskiqAdminMiddleware
+
+__all__ = [
+    "ProfilingMiddleware",
+    "PrometheusMiddleware",
+    "TaskiqAdminMiddleware",
+    "TaskiqMetricsMiddleware",
+    "TaskiqProfilingMiddleware",
+]
@@ -0,0 +1,71 @@
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from taskiq import TaskiqMessage, TaskiqMiddleware, TaskiqResult
+
+from metrics.definitions import http_request_duration, task_duration, task_queue_lag
+
+ENQUEUED_AT_LABEL = "enqueued_at"
+
+
+class PrometheusMiddleware:
+    """Record the duration of the HTTP requests by route template.
+
+    Requests matching no route share one label, so unknown paths cannot blow
+    up the number of series.
+
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started_at = time.perf_counter()
+        status = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            route = scope.get("route")
+            http_request_duration.labels(
+                method=scope["method"],
+                route=getattr(route, "path", "unmatched"),
+                status=status,
+            ).observe(time.perf_counter() - started_at)
+
+
+class TaskiqMetricsMiddleware(TaskiqMiddleware):
+    """Record the queue lag and the duration of the tasks.
+
+    The send time is carried by a label of the message, so the lag includes
+    the clock skew between the sender and the worker.
+
+    """
+
+    def pre_send(self, message: TaskiqMessage) -> TaskiqMessage:
+        message.labels[ENQUEUED_AT_LABEL] = time.time()
+        return message
+
+    def pre_execute(self, message: TaskiqMessage) -> TaskiqMessage:
+        enqueued_at = message.labels.get(ENQUEUED_AT_LABEL)
+        if enqueued_at is not None:
+            task_queue_lag.labels(task_name=message.task_name).observe(
+                max(time.time() - float(enqueued_at), 0)
+            )
+
+        return message
+
+    def post_execute(self, message: TaskiqMessage, result: TaskiqResult) -> None:
+        task_duration.labels(
+            task_name=message.task_name, status="error" if result.is_err else "ok"
+        ).observe(result.execution_time)
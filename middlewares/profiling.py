@@ -0,0 +1,106 @@
+import asyncio
+import logging
+import random
+import sys
+import uuid
+
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Receive, Scope, Send
+from taskiq import TaskiqMessage, TaskiqMiddleware, TaskiqResult
+
+from profiling import Profile, SamplingProfiler, store_profile
+from settings import profiling_settings
+
+logger = logging.getLogger(__name__)
+
+PROFILE_LABEL = "profile"
+
+
+class ProfilingMiddleware:
+    """Profile the requests sent with the profiling header, or a sample of them.
+
+    The profile is stored as collapsed stacks once the response is sent.
+
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        self.profiler = SamplingProfiler(interval=profiling_settings.interval_ms / 1000)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not self._is_triggered(scope=scope):
+            await self.app(scope, receive, send)
+            return
+
+        profile = self.profiler.start(anchor=sys._getframe())
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.profiler.stop(profile=profile)
+            route = scope.get("route")
+            await _store(
+                profile=profile,
+                kind="request",
+                name=f"{scope['method']} {getattr(route, 'path', scope['path'])}",
+                key=uuid.uuid4().hex[:8],
+            )
+
+    @staticmethod
+    def _is_triggered(scope: Scope) -> bool:
+        value = Headers(scope=scope).get(profiling_settings.header)
+        if value is not None and (
+            profiling_settings.header_secret is None
+            or value == profiling_settings.header_secret
+        ):
+            return True
+
+        return random.random() < profiling_settings.sample_rate  # noqa: S311
+
+
+class TaskiqProfilingMiddleware(TaskiqMiddleware):
+    """Profile the executions of the profiled tasks.
+
+    A sample of the executions is profiled, and those sent with the profile
+    label.
+
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.profiler = SamplingProfiler(interval=profiling_settings.interval_ms / 1000)
+        self._profiles: dict[str, Profile] = {}
+
+    def pre_execute(self, message: TaskiqMessage) -> TaskiqMessage:
+        if message.task_name in profiling_settings.task_names and (
+            message.labels.get(PROFILE_LABEL)
+            or random.random() < profiling_settings.task_sample_rate  # noqa: S311
+        ):
+            # The caller runs the task once the middlewares are done.
+            self._profiles[message.task_id] = self.profiler.start(
+                anchor=sys._getframe(1)
+            )
+
+        return message
+
+    async def post_execute(self, message: TaskiqMessage, result: TaskiqResult) -> None:
+        profile = self._profiles.pop(message.task_id, None)
+        if profile is None:
+            return
+
+        self.profiler.stop(profile=profile)
+        await _store(
+            profile=profile, kind="task", name=message.task_name, key=message.task_id
+        )
+
+
+async def _store(profile: Profile, kind: str, name: str, key: str) -> None:
+    try:
+        path = await asyncio.to_thread(
+            store_profile, profile=profile, kind=kind, name=name, key=key
+        )
+    except OSError:
+        logger.warning("Failed to store the profile of %s", name, exc_info=True)
+        return
+
+    if path is not None:
+        logger.info("Stored the profile of %s in %s", name, path)
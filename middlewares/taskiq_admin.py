@@ -0,0 +1,171 @@
+import asyncio
+import logging
+import random
+from contextlib import suppress
+from datetime import UTC, datetime
+from typing import Any
+
+import httpx
+from taskiq import TaskiqMessage, TaskiqMiddleware, TaskiqResult
+
+from metrics.definitions import taskiq_admin_events
+from settings import broker_settings
+
+logger = logging.getLogger(__name__)
+
+
+class TaskiqAdminMiddleware(TaskiqMiddleware):
+    """Report task events to the taskiq admin UI without blocking the tasks.
+
+    Events are put into a bounded queue and shipped in batches by a background
+    task over one pooled client. Once the queue fills past the sampling
+    threshold only a sample of the events is kept, and events that do not fit
+    are dropped. The outcome of every event is counted in
+    `taskiq_admin_events_total`.
+
+    """
+
+    def __init__(
+        self,
+        url: str,
+        api_token: str,
+        taskiq_broker_name: str | None = None,
+    ):
+        super().__init__()
+        self.url = url
+        self.api_token = api_token
+        self.__ta_broker_name = taskiq_broker_name
+
+        self._queue: asyncio.Queue[tuple[str, dict[str, Any]]] = asyncio.Queue(
+            maxsize=broker_settings.admin_queue_size
+        )
+        self._client: httpx.AsyncClient | None = None
+        self._task: asyncio.Task | None = None
+
+    async def startup(self) -> None:
+        self._client = httpx.AsyncClient(
+            base_url=self.url,
+            headers={"access-token": self.api_token},
+            timeout=broker_settings.admin_timeout,
+            limits=httpx.Limits(
+                max_connections=broker_settings.admin_batch_size,
+                max_keepalive_connections=broker_settings.admin_batch_size,
+            ),
+        )
+        self._task = asyncio.create_task(self._drain())
+
+    async def shutdown(self) -> None:
+        if self._task is not None:
+            with suppress(TimeoutError):
+                await asyncio.wait_for(
+                    self._queue.join(), timeout=broker_settings.admin_timeout
+                )
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def post_send(self, message: TaskiqMessage) -> None:
+        self._emit(
+            path=f"/api/tasks/{message.task_id}/queued",
+            payload={
+                "args": message.args,
+                "kwargs": message.kwargs,
+                "taskName": message.task_name,
+                "worker": self.__ta_broker_name,
+                "queuedAt": self._now(),
+            },
+        )
+
+    async def pre_execute(self, message: TaskiqMessage) -> TaskiqMessage:
+        self._emit(
+            path=f"/api/tasks/{message.task_id}/started",
+            payload={
+                "startedAt": self._now(),
+                "args": message.args,
+                "kwargs": message.kwargs,
+                "taskName": message.task_name,
+                "worker": self.__ta_broker_name,
+            },
+        )
+        return message
+
+    async def post_execute(
+        self,
+        message: TaskiqMessage,
+        result: TaskiqResult[Any],
+    ) -> None:
+        self._emit(
+            path=f"/api/tasks/{message.task_id}/executed",
+            payload={
+                "finishedAt": self._now(),
+                "error": result.error if result.error is None else repr(result.error),
+                "executionTime": result.execution_time,
+                "returnValue": {"return_value": result.return_value},
+            },
+        )
+
+    def _emit(self, path: str, payload: dict[str, Any]) -> None:
+        """Queue an event, or drop it under pressure.
+
+        Args:
+            path: The admin API path of the event.
+            payload: The event payload.
+
+        """
+        fill = self._queue.qsize() / self._queue.maxsize
+        if (
+            fill >= broker_settings.admin_sample_threshold
+            and random.random() >= broker_settings.admin_sample_rate  # noqa: S311
+        ):
+            taskiq_admin_events.labels(outcome="sampled_out").inc()
+            return
+
+        try:
+            self._queue.put_nowait((path, payload))
+        except asyncio.QueueFull:
+            taskiq_admin_events.labels(outcome="dropped").inc()
+        else:
+            taskiq_admin_events.labels(outcome="queued").inc()
+
+    async def _drain(self) -> None:
+        """Send the queued events in batches until cancelled."""
+        while True:
+            batch = [await self._queue.get()]
+            while len(batch) < broker_settings.admin_batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+
+            try:
+                await asyncio.gather(
+                    *(self._send(*event) for event in batch), return_exceptions=True
+                )
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    async def _send(self, path: str, payload: dict[str, Any]) -> None:
+        if self._client is None:
+            return
+
+        try:
+            response = await self._client.post(url=path, json=payload)
+            response.raise_for_status()
+        except httpx.HTTPError as err:
+            taskiq_admin_events.labels(outcome="failed").inc()
+            logger.debug("Failed to send task event %s: %s", path, err)
+        except Exception:
+            taskiq_admin_events.labels(outcome="failed").inc()
+            logger.warning("Failed to send task event %s", path, exc_info=True)
+        else:
+            taskiq_admin_events.labels(outcome="sent").inc()
+
+    @staticmethod
+    def _now() -> str:
+        return datetime.now(UTC).replace(tzinfo=None).isoformat()
@@ -0,0 +1,4 @@
+from profiling.sampler import Profile, SamplingProfiler
+from profiling.storage import store_profile
+
+__all__ = ["Profile", "SamplingProfiler", "store_profile"]
@@ -0,0 +1,157 @@
+import asyncio
+import sys
+import threading
+import time
+from collections import Counter
+from types import FrameType
+from typing import Any
+
+WAITING_FRAME = "[waiting]"
+
+
+def get_label(frame: FrameType) -> str:
+    module = frame.f_globals.get("__name__", "?")
+    return f"{module}.{frame.f_code.co_qualname}"
+
+
+def get_stack(frame: FrameType | None) -> list[FrameType]:
+    """Get the frames of a thread stack, outermost first.
+
+    Args:
+        frame: The innermost frame.
+
+    Returns:
+        The frames.
+
+    """
+    frames = []
+    while frame is not None:
+        frames.append(frame)
+        frame = frame.f_back
+
+    frames.reverse()
+    return frames
+
+
+def get_awaiting_stack(coro: Any) -> list[FrameType]:
+    """Get the frames of a suspended coroutine chain, outermost first.
+
+    Args:
+        coro: The coroutine of the task.
+
+    Returns:
+        The frames, down to the awaited future.
+
+    """
+    frames = []
+    while coro is not None:
+        frame = getattr(coro, "cr_frame", None) or getattr(coro, "gi_frame", None)
+        if frame is not None:
+            frames.append(frame)
+        coro = getattr(coro, "cr_await", None) or getattr(coro, "gi_yieldfrom", None)
+
+    return frames
+
+
+class Profile:
+    """The stack samples of one request or task execution.
+
+    Samples are counted by collapsed stack, from the anchor frame of the
+    execution to the innermost frame, the format of flamegraph.pl and
+    speedscope.
+
+    """
+
+    def __init__(self, anchor: FrameType, task: asyncio.Task | None):
+        self.anchor = anchor
+        self.task = task
+        self.samples: Counter[str] = Counter()
+        self.started_at = time.perf_counter()
+        self.duration = 0.0
+
+    def add(self, frames: list[FrameType], waiting: bool) -> None:
+        if self.anchor in frames:
+            frames = frames[frames.index(self.anchor) :]
+
+        labels = [get_label(frame=frame) for frame in frames]
+        if waiting:
+            labels.append(WAITING_FRAME)
+
+        self.samples[";".join(labels)] += 1
+
+    def collapse(self) -> str:
+        return "".join(f"{stack} {count}\n" for stack, count in self.samples.items())
+
+
+class SamplingProfiler:
+    """Sample the stack of the event loop thread for the running profiles.
+
+    A profile gets the current stack when its execution runs on the loop, and
+    the stack of its suspended task otherwise, so the samples cover the wall
+    time of the execution. The sampling thread only runs while profiles do.
+
+    """
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._profiles: list[Profile] = []
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self._thread_id = threading.get_ident()
+
+    def start(self, anchor: FrameType) -> Profile:
+        """Start profiling the execution running a frame.
+
+        Args:
+            anchor: A frame living as long as the execution, on the loop thread.
+
+        Returns:
+            The profile.
+
+        """
+        try:
+            task = asyncio.current_task()
+        except RuntimeError:
+            task = None
+
+        profile = Profile(anchor=anchor, task=task)
+        with self._lock:
+            self._thread_id = threading.get_ident()
+            self._profiles.append(profile)
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="sampling-profiler", daemon=True
+                )
+                self._thread.start()
+
+        return profile
+
+    def stop(self, profile: Profile) -> Profile:
+        with self._lock:
+            self._profiles.remove(profile)
+
+        profile.duration = time.perf_counter() - profile.started_at
+        return profile
+
+    def _run(self) -> None:
+        while True:
+            time.sleep(self.interval)
+
+            with self._lock:
+                if not self._profiles:
+                    self._thread = None
+                    return
+
+                self._sample()
+
+    def _sample(self) -> None:
+        stack = get_stack(frame=sys._current_frames().get(self._thread_id))
+
+        for profile in self._profiles:
+            if profile.anchor in stack:
+                profile.add(frames=stack, waiting=False)
+            elif profile.task is not None:
+                profile.add(
+                    frames=get_awaiting_stack(coro=profile.task.get_coro()),
+                    waiting=True,
+                )
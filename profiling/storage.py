@@ -0,0 +1,32 @@
+import re
+from datetime import UTC, datetime
+from pathlib import Path
+
+from profiling.sampler import Profile
+from settings import profiling_settings
+
+
+def store_profile(profile: Profile, kind: str, name: str, key: str) -> Path | None:
+    """Write a profile as collapsed stacks, if it was slow enough.
+
+    Args:
+        profile: The stopped profile.
+        kind: The kind of execution, request or task.
+        name: The route or task name.
+        key: The identifier of the execution.
+
+    Returns:
+        The path of the profile, or None if it was not stored.
+
+    """
+    if profile.duration * 1000 < profiling_settings.min_duration_ms:
+        return None
+
+    slug = re.sub(r"[^A-Za-z0-9_-]+", "_", name).strip("_")
+    path = profiling_settings.directory / (
+        f"{kind}-{slug}-{datetime.now(UTC):%Y%m%dT%H%M%S}-{key}.folded"
+    )
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(profile.collapse())
+
+    return path
@@ -1,3 +1,5 @@
 from repositories.wallet import WalletRepository
+from repositories.wallet_counter import WalletCounterRepository
+from repositories.wallet_latest import WalletLatestRepository
 
-__all__ = ["WalletRepository"]
+__all__ = ["WalletRepository", "WalletCounterRepository", "WalletLatestRepository"]
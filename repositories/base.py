@@ -1,20 +1,67 @@
-from typing import Any, Generic, Type, TypeVar
-
-from sqlalchemy import asc, desc, func, select
+import json
+import operator
+import time
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from collections import OrderedDict
+from typing import Any, AsyncIterator, Callable, Generic, Sequence, Type, TypeVar
+
+from pydantic import TypeAdapter
+from pydantic_core import to_json
+from sqlalchemy import (
+    Column,
+    ColumnElement,
+    Row,
+    Select,
+    asc,
+    delete,
+    desc,
+    func,
+    insert,
+    inspect,
+    select,
+    text,
+    tuple_,
+    update,
+)
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import MultipleResultsFound
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from enums.count import CountStrategyEnum
 from enums.sort import SortDirectionEnum
+from exceptions.pagination import InvalidCursorError
+from settings import db_settings
 
 Model = TypeVar("Model", bound=object)
 
+FILTER_OPERATORS: dict[str, Callable[[Column, Any], ColumnElement[bool]]] = {
+    "eq": operator.eq,
+    "gt": operator.gt,
+    "gte": operator.ge,
+    "lt": operator.lt,
+    "lte": operator.le,
+    "in": lambda column, value: column.in_(value),
+}
+
+# Least recently used counts first, bounded by `db_settings.count_cache_size`.
+_count_cache: OrderedDict[tuple, tuple[float, int]] = OrderedDict()
+
 
 class BaseRepository(Generic[Model]):
+    # The column the table is range partitioned by, if any.
+    partition_by: str | None = None
+    # The columns of deleted rows passed to `_on_deleted`, none skips the hook.
+    deleted_columns: tuple[str, ...] = ()
+
     def __init__(self, model: Type[Model]):
         self.model = model
 
     async def create(self, session: AsyncSession, data: dict[str, Any]) -> Model:
         """Create a new model instance.
 
+        The instance is built from the inserted row returned by the insert, so
+        server defaults are set without reading the row again.
+
         Args:
             session: The async session.
             data: The data to create the model instance.
@@ -23,14 +70,80 @@ class BaseRepository(Generic[Model]):
             The created model instance.
 
         """
-        instance = self.model(**data)
+        result = await session.execute(
+            statement=insert(self.model).values(**data).returning(self.model)
+        )
+        instance = result.scalar_one()
 
-        session.add(instance=instance)
+        await self._on_created(session=session, data=[data])
         await session.commit()
-        await session.refresh(instance)
 
         return instance
 
+    async def bulk_create(
+        self, session: AsyncSession, data: list[dict[str, Any]]
+    ) -> None:
+        """Create many model instances with a single multi-row insert.
+
+        Args:
+            session: The async session.
+            data: The data of the model instances.
+
+        """
+        if not data:
+            return
+
+        await session.execute(statement=insert(self.model), params=data)
+        await self._on_created(session=session, data=data)
+        await session.commit()
+
+    async def bulk_upsert(
+        self,
+        session: AsyncSession,
+        data: list[dict[str, Any]],
+        index_elements: list[str],
+    ) -> list[Model]:
+        """Insert many model instances, updating those that already exist.
+
+        A conflict on the index elements updates the other given fields of the
+        stored row, all in a single statement. The creation hook does not run,
+        as inserted and updated rows cannot be told apart.
+
+        Args:
+            session: The async session.
+            data: The data of the model instances, later ones win for the same
+                index elements.
+            index_elements: The fields of the unique index rows conflict on.
+
+        Returns:
+            The inserted or updated model instances.
+
+        """
+        if not data:
+            return []
+
+        rows = {tuple(item[field] for field in index_elements): item for item in data}
+        statement = self._get_insert(session=session)(self.model).values(
+            list(rows.values())
+        )
+        statement = statement.on_conflict_do_update(
+            index_elements=index_elements,
+            set_={
+                field: statement.excluded[field]
+                for field in data[0]
+                if field not in index_elements
+            },
+        )
+
+        result = await session.execute(
+            statement=statement.returning(self.model),
+            execution_options={"populate_existing": True},
+        )
+        instances = list(result.scalars().all())
+        await session.commit()
+
+        return instances
+
     async def get_all(
         self,
         session: AsyncSession,
@@ -42,6 +155,9 @@ class BaseRepository(Generic[Model]):
     ) -> list[Model]:
         """Get all model instances with pagination and sorting.
 
+        Items are ordered by the primary key after the sort field, so pages are
+        stable.
+
         Args:
             session: The async session.
             offset: The offset of the first item to return.
@@ -54,21 +170,300 @@ class BaseRepository(Generic[Model]):
             The list of model instances.
 
         """
-        statement = select(self.model).filter_by(**filters)
+        statement = self._get_sorted_statement(
+            entities=[self.model],
+            sort_by=sort_by,
+            sort_direction=sort_direction,
+            **filters,
+        )
 
-        if sort_by and sort_direction:
-            statement = statement.order_by(
-                desc(getattr(self.model, sort_by))
-                if sort_direction == SortDirectionEnum.DESC
-                else asc(getattr(self.model, sort_by))
-            )
+        result = await session.execute(statement=statement.offset(offset).limit(limit))
+
+        return list(result.scalars().all())
+
+    async def get_all_rows(
+        self,
+        session: AsyncSession,
+        offset: int,
+        limit: int,
+        sort_by: str | None = None,
+        sort_direction: SortDirectionEnum | None = None,
+        **filters,
+    ) -> Sequence[Row]:
+        """Get the rows of all model instances with pagination and sorting.
+
+        Same as `get_all`, but only the columns are selected, so no model
+        instance is built nor tracked by the session.
+
+        Args:
+            session: The async session.
+            offset: The offset of the first row to return.
+            limit: The maximum number of rows to return.
+            sort_by: The field to sort by.
+            sort_direction: The direction to sort by.
+            **filters: The filters to apply to the query.
+
+        Returns:
+            The rows, with an attribute per column.
+
+        """
+        statement = self._get_sorted_statement(
+            entities=inspect(self.model).columns,
+            sort_by=sort_by,
+            sort_direction=sort_direction,
+            **filters,
+        )
+
+        result = await session.execute(statement=statement.offset(offset).limit(limit))
+
+        return result.all()
+
+    async def get_all_by_cursor(
+        self,
+        session: AsyncSession,
+        cursor: str,
+        limit: int,
+        sort_by: str | None = None,
+        sort_direction: SortDirectionEnum | None = None,
+        **filters,
+    ) -> list[Model]:
+        """Get the model instances following a cursor with keyset pagination.
+
+        The page starts right after the item the cursor was built from, so it is
+        read from the sort index instead of skipping all the previous rows.
+
+        Args:
+            session: The async session.
+            cursor: The cursor returned by `encode_cursor`.
+            limit: The maximum number of items to return.
+            sort_by: The field to sort by.
+            sort_direction: The direction to sort by.
+            **filters: The filters to apply to the query.
+
+        Returns:
+            The list of model instances.
 
-        statement = statement.offset(offset).limit(limit)
+        Raises:
+            InvalidCursorError: If the cursor does not match the sorting.
+
+        """
+        statement = self._get_keyset_statement(
+            entities=[self.model],
+            cursor=cursor,
+            sort_by=sort_by,
+            sort_direction=sort_direction,
+            **filters,
+        )
 
-        result = await session.execute(statement=statement)
+        result = await session.execute(statement=statement.limit(limit))
 
         return list(result.scalars().all())
 
+    async def get_all_rows_by_cursor(
+        self,
+        session: AsyncSession,
+        cursor: str,
+        limit: int,
+        sort_by: str | None = None,
+        sort_direction: SortDirectionEnum | None = None,
+        **filters,
+    ) -> Sequence[Row]:
+        """Get the rows following a cursor with keyset pagination.
+
+        Same as `get_all_by_cursor`, but only the columns are selected, so no
+        model instance is built nor tracked by the session.
+
+        Args:
+            session: The async session.
+            cursor: The cursor returned by `encode_cursor`.
+            limit: The maximum number of rows to return.
+            sort_by: The field to sort by.
+            sort_direction: The direction to sort by.
+            **filters: The filters to apply to the query.
+
+        Returns:
+            The rows, with an attribute per column.
+
+        Raises:
+            InvalidCursorError: If the cursor does not match the sorting.
+
+        """
+        statement = self._get_keyset_statement(
+            entities=inspect(self.model).columns,
+            cursor=cursor,
+            sort_by=sort_by,
+            sort_direction=sort_direction,
+            **filters,
+        )
+
+        result = await session.execute(statement=statement.limit(limit))
+
+        return result.all()
+
+    def encode_cursor(
+        self,
+        instance: Model | Row,
+        sort_by: str | None = None,
+        sort_direction: SortDirectionEnum | None = None,
+    ) -> str | None:
+        """Build the cursor of the page following a model instance.
+
+        Args:
+            instance: The last model instance or row of the page.
+            sort_by: The field the page is sorted by.
+            sort_direction: The direction the page is sorted by.
+
+        Returns:
+            The opaque cursor, or None if the sorting does not support cursors.
+
+        """
+        mapper = inspect(self.model)
+        columns = self._get_sort_columns(sort_by=sort_by if sort_direction else None)
+
+        if any(column.nullable for column in columns):
+            return None
+
+        payload = {
+            "keys": [column.key for column in columns],
+            "values": [
+                (
+                    instance._mapping[column]
+                    if isinstance(instance, Row)
+                    else getattr(instance, mapper.get_property_by_column(column).key)
+                )
+                for column in columns
+            ],
+        }
+
+        return urlsafe_b64encode(to_json(payload)).decode()
+
+    def _get_keyset_statement(
+        self,
+        entities: Sequence[Any],
+        cursor: str,
+        sort_by: str | None,
+        sort_direction: SortDirectionEnum | None,
+        **filters,
+    ) -> Select:
+        columns = self._get_sort_columns(sort_by=sort_by if sort_direction else None)
+        values = self._decode_cursor(cursor=cursor, columns=columns)
+        descending = sort_direction == SortDirectionEnum.DESC
+
+        if columns[0].key == self.partition_by:
+            # Row comparisons do not prune partitions, a bound on the key does.
+            bound = "lte" if descending else "gte"
+            filters = {**filters, f"{self.partition_by}__{bound}": values[0]}
+
+        keyset, cursor_values = tuple_(*columns), tuple_(*values)
+
+        return self._get_sorted_statement(
+            entities=entities,
+            sort_by=sort_by,
+            sort_direction=sort_direction,
+            **filters,
+        ).where(keyset < cursor_values if descending else keyset > cursor_values)
+
+    def _get_sorted_statement(
+        self,
+        entities: Sequence[Any],
+        sort_by: str | None,
+        sort_direction: SortDirectionEnum | None,
+        **filters,
+    ) -> Select:
+        columns = self._get_sort_columns(sort_by=sort_by if sort_direction else None)
+
+        return (
+            select(*entities)
+            .where(*self._get_conditions(**filters))
+            .order_by(
+                *(
+                    (
+                        desc(column)
+                        if sort_direction == SortDirectionEnum.DESC
+                        else asc(column)
+                    )
+                    for column in columns
+                )
+            )
+        )
+
+    def _get_conditions(self, **filters) -> list[ColumnElement[bool]]:
+        """Build the conditions of filters.
+
+        A filter is either a field name for equality, or a field name with one of
+        the `__gt`, `__gte`, `__lt`, `__lte` and `__in` suffixes.
+
+        Args:
+            **filters: The filters.
+
+        Returns:
+            The conditions.
+
+        """
+        conditions = []
+
+        for key, value in filters.items():
+            field, _, operator = key.partition("__")
+            column = inspect(self.model).columns[field]
+            conditions.append(FILTER_OPERATORS[operator or "eq"](column, value))
+
+        return conditions
+
+    def _get_sort_columns(self, sort_by: str | None) -> list[Column]:
+        mapper = inspect(self.model)
+        primary_key = [column for column in mapper.primary_key if column.key != sort_by]
+
+        if sort_by is None:
+            return primary_key
+
+        return [mapper.columns[sort_by], *primary_key]
+
+    @staticmethod
+    def _decode_cursor(cursor: str, columns: list[Column]) -> list[Any]:
+        if any(column.nullable for column in columns):
+            message = "Cursor pagination is not supported for nullable sort fields"
+            raise InvalidCursorError(message=message)
+
+        try:
+            payload = json.loads(urlsafe_b64decode(cursor.encode()))
+            if payload["keys"] != [column.key for column in columns]:
+                raise InvalidCursorError
+
+            return [
+                TypeAdapter(column.type.python_type).validate_python(value)
+                for column, value in zip(columns, payload["values"], strict=True)
+            ]
+        except (ValueError, TypeError, KeyError) as err:
+            raise InvalidCursorError from err
+
+    async def stream_all(
+        self, session: AsyncSession, batch_size: int, **filters
+    ) -> AsyncIterator[Sequence[Row]]:
+        """Stream the rows of model instances with a server-side cursor.
+
+        Rows are plain column tuples ordered by the primary key, so memory stays
+        constant and an interrupted stream can resume after the last key.
+
+        Args:
+            session: The async session.
+            batch_size: The number of rows fetched per round trip.
+            **filters: The filters to apply to the query.
+
+        Yields:
+            The batches of rows.
+
+        """
+        mapper = inspect(self.model)
+        result = await session.stream(
+            statement=select(*mapper.columns)
+            .where(*self._get_conditions(**filters))
+            .order_by(*mapper.primary_key)
+            .execution_options(yield_per=batch_size)
+        )
+
+        async for rows in result.partitions(batch_size):
+            yield rows
+
     async def get_by(self, session: AsyncSession, **filters) -> Model | None:
         """Get a model instance by filters.
 
@@ -81,7 +476,7 @@ class BaseRepository(Generic[Model]):
 
         """
         result = await session.execute(
-            statement=select(self.model).filter_by(**filters)
+            statement=select(self.model).where(*self._get_conditions(**filters))
         )
         return result.scalar_one_or_none()
 
@@ -90,6 +485,9 @@ class BaseRepository(Generic[Model]):
     ) -> Model | None:
         """Update a model instance by filters.
 
+        The instance is built from the updated row returned by the update, so
+        it is not read beforehand.
+
         Args:
             session: The async session.
             data: The data to update the model instance.
@@ -98,18 +496,51 @@ class BaseRepository(Generic[Model]):
         Returns:
             The updated model instance.
 
-        """
-        instance = await self.get_by(session=session, **filters)
+        Raises:
+            MultipleResultsFound: If the filters match more than one model
+                instance, none is updated then.
 
-        if instance:
-            for key, value in data.items():
-                setattr(instance, key, value)
+        """
+        result = await session.execute(
+            statement=update(self.model)
+            .where(*self._get_conditions(**filters))
+            .values(**data)
+            .returning(self.model),
+            execution_options={"populate_existing": True},
+        )
+        try:
+            instance = result.scalar_one_or_none()
+        except MultipleResultsFound:
+            await session.rollback()
+            raise
 
-            await session.commit()
-            await session.refresh(instance=instance)
+        await session.commit()
 
         return instance
 
+    async def update_where(
+        self, session: AsyncSession, data: dict[str, Any], **filters
+    ) -> int:
+        """Update all the model instances matching filters with one statement.
+
+        Args:
+            session: The async session.
+            data: The data to update the model instances.
+            **filters: The filters to apply to the query.
+
+        Returns:
+            The number of updated model instances.
+
+        """
+        result = await session.execute(
+            statement=update(self.model)
+            .where(*self._get_conditions(**filters))
+            .values(**data)
+        )
+        await session.commit()
+
+        return result.rowcount
+
     async def delete_by(self, session: AsyncSession, **filters) -> bool:
         """Delete a model instance by filters.
 
@@ -120,16 +551,68 @@ class BaseRepository(Generic[Model]):
         Returns:
             True if the model instance was deleted, False otherwise.
 
+        Raises:
+            MultipleResultsFound: If the filters match more than one model
+                instance, none is deleted then.
+
         """
-        instance = await self.get_by(session=session, **filters)
+        count = await self._delete(session=session, **filters)
 
-        if instance:
-            await session.delete(instance=instance)
-            await session.commit()
+        if count > 1:
+            await session.rollback()
+            message = "Multiple rows were found when one or none was required"
+            raise MultipleResultsFound(message)
 
-            return True
+        await session.commit()
+
+        return count == 1
 
-        return False
+    async def delete_where(self, session: AsyncSession, **filters) -> int:
+        """Delete all the model instances matching filters with one statement.
+
+        Args:
+            session: The async session.
+            **filters: The filters to apply to the query.
+
+        Returns:
+            The number of deleted model instances.
+
+        """
+        count = await self._delete(session=session, **filters)
+        await session.commit()
+
+        return count
+
+    async def _delete(self, session: AsyncSession, **filters) -> int:
+        """Delete the model instances matching filters, without committing.
+
+        With `deleted_columns`, the deleted rows are returned by the delete and
+        passed to `_on_deleted` in the same transaction.
+
+        Args:
+            session: The async session.
+            **filters: The filters to apply to the query.
+
+        Returns:
+            The number of deleted model instances.
+
+        """
+        statement = delete(self.model).where(*self._get_conditions(**filters))
+
+        if not self.deleted_columns:
+            result = await session.execute(statement=statement)
+            return result.rowcount
+
+        columns = inspect(self.model).columns
+        result = await session.execute(
+            statement=statement.returning(
+                *(columns[column] for column in self.deleted_columns)
+            )
+        )
+        rows = result.all()
+        await self._on_deleted(session=session, rows=rows)
+
+        return len(rows)
 
     async def get_count(self, session: AsyncSession, **filters) -> int:
         """Get the count of model instances by filters.
@@ -143,7 +626,123 @@ class BaseRepository(Generic[Model]):
 
         """
         result = await session.execute(
-            statement=select(func.count()).select_from(self.model).filter_by(**filters)
+            statement=select(func.count())
+            .select_from(self.model)
+            .where(*self._get_conditions(**filters))
         )
         count = result.scalar()
         return count or 0
+
+    async def get_total(
+        self, session: AsyncSession, strategy: CountStrategyEnum, **filters
+    ) -> tuple[int, bool]:
+        """Get the count of model instances with a counting strategy.
+
+        Strategies that cannot serve the filters fall back to an exact count.
+
+        Args:
+            session: The async session.
+            strategy: The counting strategy.
+            **filters: The filters to apply to the query.
+
+        Returns:
+            The count of model instances and whether it is exact.
+
+        """
+        if strategy == CountStrategyEnum.CACHED:
+            return await self._get_cached_count(session=session, **filters), False
+
+        if strategy == CountStrategyEnum.ESTIMATED:
+            count = await self._get_estimated_count(session=session, **filters)
+            if count is not None:
+                return count, False
+
+        if strategy == CountStrategyEnum.COUNTER:
+            count = await self._get_counter_count(session=session, **filters)
+            if count is not None:
+                return count, True
+
+        return await self.get_count(session=session, **filters), True
+
+    async def _get_cached_count(self, session: AsyncSession, **filters) -> int:
+        key = (self.model, *sorted(filters.items()))
+        expires_at, count = _count_cache.get(key, (0.0, 0))
+
+        if expires_at < time.monotonic():
+            count = await self.get_count(session=session, **filters)
+            _count_cache[key] = (time.monotonic() + db_settings.count_cache_ttl, count)
+
+        _count_cache.move_to_end(key)
+        while len(_count_cache) > db_settings.count_cache_size:
+            _count_cache.popitem(last=False)
+
+        return count
+
+    async def _get_estimated_count(
+        self, session: AsyncSession, **filters
+    ) -> int | None:
+        if filters or session.bind.dialect.name != "postgresql":
+            return None
+
+        # A partitioned table has no rows of its own, its partitions are summed.
+        result = await session.execute(
+            statement=text(
+                "SELECT sum(nullif(reltuples, -1))::bigint FROM pg_class "
+                "WHERE relkind = 'r' AND (oid = to_regclass(:table_name) OR oid IN "
+                "(SELECT inhrelid FROM pg_inherits "
+                "WHERE inhparent = to_regclass(:table_name)))"
+            ),
+            params={"table_name": inspect(self.model).local_table.name},
+        )
+        count = result.scalar()
+
+        return count if count is not None and count >= 0 else None
+
+    async def _get_counter_count(self, session: AsyncSession, **filters) -> int | None:
+        """Get the count from a maintained counter, if the repository keeps one.
+
+        Args:
+            session: The async session.
+            **filters: The filters to apply to the query.
+
+        Returns:
+            The count, or None if no counter serves the filters.
+
+        """
+        return None
+
+    async def _on_created(
+        self, session: AsyncSession, data: list[dict[str, Any]]
+    ) -> None:
+        """Run in the transaction creating model instances, before the commit.
+
+        Args:
+            session: The async session.
+            data: The data of the created model instances.
+
+        """
+
+    async def _on_deleted(self, session: AsyncSession, rows: Sequence[Row]) -> None:
+        """Run in the transaction deleting model instances, before the commit.
+
+        Args:
+            session: The async session.
+            rows: The `deleted_columns` of the deleted model instances.
+
+        """
+
+    @staticmethod
+    def _get_insert(session: AsyncSession) -> Callable[..., Any]:
+        """Get the insert construct of the session dialect, with upsert support.
+
+        Args:
+            session: The async session.
+
+        Returns:
+            The PostgreSQL or SQLite insert function.
+
+        """
+        if session.bind.dialect.name == "postgresql":
+            return postgresql.insert
+
+        return sqlite.insert
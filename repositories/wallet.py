@@ -1,7 +1,104 @@
+from collections import Counter
+from typing import Any, Sequence
+
+from sqlalchemy import Row, column, func, select, table
+from sqlalchemy.ext.asyncio import AsyncSession
+
 from db.models import Wallet
+from db.partitions import MonthlyPartitions
+from enums.count import CountStrategyEnum
 from repositories.base import BaseRepository
+from repositories.wallet_counter import WalletCounterRepository
+from repositories.wallet_latest import WalletLatestRepository
+from settings import api_settings
 
 
 class WalletRepository(BaseRepository[Wallet]):
+    partition_by = "created_at"
+    deleted_columns = ("network",)
+
     def __init__(self):
         super().__init__(Wallet)
+        self._counter_repository = WalletCounterRepository()
+        self._latest_repository = WalletLatestRepository()
+        self.partitions = MonthlyPartitions(
+            table=Wallet.__tablename__, key=self.partition_by
+        )
+
+    async def remove_expired_partitions(
+        self, session: AsyncSession, retention: int, detach: bool
+    ) -> list[str]:
+        """Remove the monthly partitions older than the retention.
+
+        When the counters are maintained, they are decreased by the rows of the
+        removed partitions in the same transaction.
+
+        Args:
+            session: The async session.
+            retention: The number of months kept before the current one.
+            detach: Whether to detach the partitions instead of dropping them.
+
+        Returns:
+            The removed partition names.
+
+        """
+        names = await self.partitions.get_expired(session=session, retention=retention)
+
+        for name in names:
+            if self._counts_maintained():
+                partition = table(name, column("network", Wallet.network.type))
+                result = await session.execute(
+                    statement=select(partition.c.network, func.count()).group_by(
+                        partition.c.network
+                    )
+                )
+                if counts := {network: -count for network, count in result.tuples()}:
+                    await self._counter_repository.increment(
+                        session=session, counts=counts
+                    )
+
+            await self.partitions.remove(session=session, name=name, detach=detach)
+
+        await session.commit()
+
+        return names
+
+    async def _get_counter_count(self, session: AsyncSession, **filters) -> int | None:
+        if filters.keys() - {"network"} or not self._counts_maintained():
+            return None
+
+        return await self._counter_repository.get_sum(
+            session=session, network=filters.get("network")
+        )
+
+    async def _on_created(
+        self, session: AsyncSession, data: list[dict[str, Any]]
+    ) -> None:
+        if self._counts_maintained():
+            await self._counter_repository.increment(
+                session=session, counts=Counter(item["network"] for item in data)
+            )
+        await self._latest_repository.upsert(session=session, data=data)
+
+    async def _on_deleted(self, session: AsyncSession, rows: Sequence[Row]) -> None:
+        # The latest states are kept, as when expired partitions are removed.
+        if rows and self._counts_maintained():
+            counts = Counter(row.network for row in rows)
+            await self._counter_repository.increment(
+                session=session,
+                counts={network: -count for network, count in counts.items()},
+            )
+
+    @staticmethod
+    def _counts_maintained() -> bool:
+        """Check whether the counters are kept up to date by the writes.
+
+        Every write updating the counter row of its network serializes the
+        writes of the network, so the counters are only maintained when the
+        history is counted with them.
+
+        Returns:
+            True with the counter count strategy.
+
+        """
+        return api_settings.history_count_strategy == CountStrategyEnum.COUNTER
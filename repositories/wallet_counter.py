@@ -0,0 +1,52 @@
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from db.models import WalletCounter
+from enums.network import NetworkEnum
+from repositories.base import BaseRepository
+
+
+class WalletCounterRepository(BaseRepository[WalletCounter]):
+    def __init__(self):
+        super().__init__(WalletCounter)
+
+    async def increment(
+        self, session: AsyncSession, counts: dict[NetworkEnum, int]
+    ) -> None:
+        """Increment the counters of networks in the current transaction.
+
+        Args:
+            session: The async session.
+            counts: The increments by network.
+
+        """
+        statement = self._get_insert(session=session)(WalletCounter).values(
+            [{"network": network, "count": count} for network, count in counts.items()]
+        )
+        await session.execute(
+            statement=statement.on_conflict_do_update(
+                index_elements=[WalletCounter.network],
+                set_={"count": WalletCounter.count + statement.excluded.count},
+            )
+        )
+
+    async def get_sum(
+        self, session: AsyncSession, network: NetworkEnum | None = None
+    ) -> int:
+        """Get the counter of a network, or the sum of all the counters.
+
+        Args:
+            session: The async session.
+            network: The network.
+
+        Returns:
+            The count.
+
+        """
+        statement = select(func.coalesce(func.sum(WalletCounter.count), 0))
+        if network is not None:
+            statement = statement.where(WalletCounter.network == network)
+
+        result = await session.execute(statement=statement)
+
+        return result.scalar_one()
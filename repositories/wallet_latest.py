@@ -0,0 +1,60 @@
+from datetime import UTC, datetime
+from typing import Any
+
+from sqlalchemy import func
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from db.models import WalletLatest
+from repositories.base import BaseRepository
+
+STATE_FIELDS = ("balance", "bandwidth", "energy")
+
+
+class WalletLatestRepository(BaseRepository[WalletLatest]):
+    def __init__(self):
+        super().__init__(WalletLatest)
+
+    async def upsert(self, session: AsyncSession, data: list[dict[str, Any]]) -> None:
+        """Upsert the latest state of wallets in the current transaction.
+
+        Fields missing from a snapshot keep their stored value, and a state is
+        never replaced by one observed earlier. A snapshot is dated by its
+        `created_at`, the time it was observed, or else by now.
+
+        Args:
+            session: The async session.
+            data: The wallet snapshots, the latest observed wins for the same
+                wallet.
+
+        """
+        now = datetime.now(UTC)
+        rows: dict[tuple, dict[str, Any]] = {}
+        for item in data:
+            row = {
+                "network": item["network"],
+                "address": item["address"],
+                **{field: item.get(field) for field in STATE_FIELDS},
+                "updated_at": item.get("created_at") or now,
+            }
+            key = (item["network"], item["address"])
+            if key not in rows or rows[key]["updated_at"] <= row["updated_at"]:
+                rows[key] = row
+
+        statement = self._get_insert(session=session)(WalletLatest).values(
+            list(rows.values())
+        )
+        await session.execute(
+            statement=statement.on_conflict_do_update(
+                index_elements=[WalletLatest.network, WalletLatest.address],
+                set_={
+                    **{
+                        field: func.coalesce(
+                            statement.excluded[field], getattr(WalletLatest, field)
+                        )
+                        for field in STATE_FIELDS
+                    },
+                    "updated_at": statement.excluded.updated_at,
+                },
+                where=WalletLatest.updated_at <= statement.excluded.updated_at,
+            )
+        )
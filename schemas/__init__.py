@@ -1,11 +1,30 @@
-from .common import PaginatedResponse, PaginationParams, SortingAndPaginationParams
-from .wallet import WalletInfo, WalletRequest, WalletResponse
+from .common import PaginatedResponse, PaginationParams
+from .wallet import (
+    WalletBatchItem,
+    WalletBatchRequest,
+    WalletBatchResponse,
+    WalletExportParams,
+    WalletFilterParams,
+    WalletHistoryParams,
+    WalletInfo,
+    WalletLatestParams,
+    WalletLatestResponse,
+    WalletRequest,
+    WalletResponse,
+)
 
 __all__ = [
     "PaginationParams",
-    "SortingAndPaginationParams",
     "PaginatedResponse",
     "WalletRequest",
+    "WalletBatchRequest",
+    "WalletBatchItem",
+    "WalletBatchResponse",
+    "WalletFilterParams",
+    "WalletHistoryParams",
+    "WalletExportParams",
+    "WalletLatestParams",
+    "WalletLatestResponse",
     "WalletResponse",
     "WalletInfo",
 ]
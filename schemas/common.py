@@ -3,40 +3,31 @@ from typing import Generic, TypeVar
 
 from pydantic import BaseModel, Field, computed_field
 
-from enums.sort import SortDirectionEnum
-
 ResponseT = TypeVar("ResponseT")
 
 
-class SortingParams(BaseModel):
-    sort_by: str | None = Field(
-        default=None,
-        description="Sorting field",
-    )
-    sort_direction: SortDirectionEnum | None = Field(
-        default=None,
-        description="Sorting direction",
-    )
-
-
 class PaginationParams(BaseModel):
     page: int = Field(default=1, description="Page number", ge=1)
     limit: int = Field(default=10, description="Items per page", ge=1, le=100)
+    cursor: str | None = Field(
+        default=None,
+        description="Cursor of the page to return, takes precedence over page",
+    )
 
     @property
     def offset(self) -> int:
         return (self.page - 1) * self.limit
 
 
-class SortingAndPaginationParams(SortingParams, PaginationParams):
-    pass
-
-
 class PaginatedResponse(BaseModel, Generic[ResponseT]):
     count: int = Field(description="Total number of items", ge=0)
+    count_exact: bool = Field(
+        default=True, description="Whether the total is exact or estimated"
+    )
     limit: int = Field(description="Number of items per page", gt=0)
     page: int = Field(description="Current page", ge=0)
     results: list[ResponseT] = Field(description="List of items")
+    next_cursor: str | None = Field(default=None, description="Cursor of the next page")
 
     @computed_field(description="Total number of pages")
     @property
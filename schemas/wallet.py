@@ -1,16 +1,83 @@
-from datetime import datetime
+from datetime import UTC, datetime
 from decimal import Decimal
+from typing import Any
 
 from pydantic import BaseModel, Field
 
+from enums.export import ExportFormatEnum
 from enums.network import NetworkEnum
+from enums.sort import SortDirectionEnum, WalletSortFieldEnum
+from schemas.common import PaginationParams
+from settings import api_settings
+from settings.explorer import explorer_settings
 
 
 class WalletRequest(BaseModel):
     address: str = Field(default=..., description="Wallet address")
 
 
-class WalletInfo(BaseModel):
+class WalletFilterParams(BaseModel):
+    network: NetworkEnum | None = Field(default=None, description="Network")
+    address: str | None = Field(default=None, description="Wallet address")
+    created_from: datetime | None = Field(
+        default=None, description="Requested at or after"
+    )
+    created_to: datetime | None = Field(default=None, description="Requested before")
+
+    @property
+    def filters(self) -> dict[str, Any]:
+        filters = {
+            "network": self.network,
+            "address": self.address,
+            "created_at__gte": self.created_from,
+            "created_at__lt": self.created_to,
+        }
+        return {key: value for key, value in filters.items() if value is not None}
+
+
+class WalletHistoryParams(WalletFilterParams, PaginationParams):
+    sort_by: WalletSortFieldEnum | None = Field(
+        default=None, description="Sorting field"
+    )
+    sort_direction: SortDirectionEnum | None = Field(
+        default=None, description="Sorting direction"
+    )
+
+
+class WalletExportParams(WalletFilterParams):
+    format: ExportFormatEnum = Field(
+        default=ExportFormatEnum.NDJSON, description="Export format"
+    )
+    after_id: int | None = Field(
+        default=None, description="Resume after the last exported ID", ge=0
+    )
+
+    @property
+    def filters(self) -> dict[str, Any]:
+        filters = super().filters
+        if self.after_id is not None:
+            filters["id__gt"] = self.after_id
+        return filters
+
+
+class WalletLatestParams(BaseModel):
+    max_age: int = Field(
+        default=api_settings.latest_max_age,
+        description="Seconds the stored state may be old before a new lookup",
+        ge=0,
+    )
+
+
+class WalletBatchRequest(BaseModel):
+    addresses: list[str] = Field(
+        default=...,
+        description="Wallet addresses",
+        min_length=1,
+        max_length=explorer_settings.batch_max_addresses,
+    )
+
+
+class WalletBase(BaseModel):
     network: NetworkEnum = Field(default=..., description="Network type")
     address: str = Field(default=..., description="Wallet address")
     balance: Decimal | None = Field(default=None, description="Balance", ge=0)
@@ -18,9 +85,39 @@ class WalletInfo(BaseModel):
     energy: int | None = Field(default=None, description="Energy", ge=0)
 
 
-class WalletResponse(WalletInfo):
+class WalletInfo(WalletBase):
+    missing_fields: list[str] = Field(
+        default_factory=list,
+        description="Fields the explorer could not obtain in time",
+    )
+    fetched_at: datetime = Field(
+        default_factory=lambda: datetime.now(UTC),
+        description="Time the state was observed on chain",
+    )
+
+
+class WalletBatchItem(BaseModel):
+    address: str = Field(default=..., description="Wallet address")
+    result: WalletInfo | None = Field(default=None, description="Wallet info")
+    error: str | None = Field(default=None, description="Lookup error")
+
+
+class WalletBatchResponse(BaseModel):
+    results: list[WalletBatchItem] = Field(
+        default=..., description="Lookup results in request order"
+    )
+
+
+class WalletResponse(WalletBase):
     id: int = Field(default=..., description="Request ID")
     created_at: datetime = Field(default=..., description="Request timestamp")
 
     class Config:
         from_attributes = True
+
+
+class WalletLatestResponse(WalletBase):
+    updated_at: datetime = Field(default=..., description="State timestamp")
+
+    class Config:
+        from_attributes = True
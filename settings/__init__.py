@@ -1,5 +1,19 @@
+from .api import api_settings
 from .broker import broker_settings
+from .cache import cache_settings
 from .db import db_settings
+from .metrics import metrics_settings
+from .profiling import profiling_settings
 from .redis import redis_settings
+from .worker import worker_settings
 
-__all__ = ["db_settings", "broker_settings", "redis_settings"]
+__all__ = [
+    "api_settings",
+    "db_settings",
+    "broker_settings",
+    "cache_settings",
+    "metrics_settings",
+    "profiling_settings",
+    "redis_settings",
+    "worker_settings",
+]
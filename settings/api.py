@@ -0,0 +1,46 @@
+from pydantic import Field
+from pydantic_settings import SettingsConfigDict
+
+from enums.count import CountStrategyEnum
+
+from .base import BaseSettings
+
+
+class ApiSettings(BaseSettings):
+    model_config = SettingsConfigDict(env_prefix="api_")
+
+    # The counters are only maintained with the counter strategy, so they must
+    # be reseeded, as in the counters migration, when switching to it.
+    history_count_strategy: CountStrategyEnum = Field(
+        default=CountStrategyEnum.EXACT, title="Count strategy of the wallet history"
+    )
+
+    export_batch_size: int = Field(
+        default=1000, title="Rows fetched per round trip of a history export", ge=1
+    )
+
+    write_buffer_size: int = Field(
+        default=10000, title="Snapshots buffered before requests wait", ge=1
+    )
+    write_batch_size: int = Field(
+        default=100, title="Snapshots published per task message", ge=1
+    )
+    write_max_delay_ms: int = Field(
+        default=100, title="Milliseconds a snapshot waits for its batch", ge=0
+    )
+    write_retry_attempts: int = Field(
+        default=3, title="Publish retries of a batch of snapshots", ge=0
+    )
+    write_retry_delay_ms: int = Field(
+        default=200, title="Milliseconds before the first publish retry", ge=0
+    )
+    write_close_timeout: float = Field(
+        default=10, title="Seconds to publish the buffered snapshots on shutdown", ge=0
+    )
+
+    latest_max_age: int = Field(
+        default=30, title="Default seconds a stored wallet state is served", ge=0
+    )
+
+
+api_settings = ApiSettings()
@@ -13,5 +13,21 @@ class BrokerSettings(BaseSettings):
     default_queue: str = Field(default="default", title="Default queue")
     api_token: str = Field(default="supersecret", title="API Token")
 
+    admin_timeout: float = Field(
+        default=5, title="Seconds to send a task event to the admin UI", gt=0
+    )
+    admin_queue_size: int = Field(
+        default=10000, title="Task events buffered before dropping", ge=1
+    )
+    admin_batch_size: int = Field(
+        default=50, title="Task events sent concurrently per batch", ge=1
+    )
+    admin_sample_threshold: float = Field(
+        default=0.8, title="Queue fill ratio from which events are sampled", ge=0, le=1
+    )
+    admin_sample_rate: float = Field(
+        default=0.1, title="Share of the events kept while sampling", ge=0, le=1
+    )
+
 
 broker_settings = BrokerSettings()
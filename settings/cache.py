@@ -0,0 +1,33 @@
+from pydantic import Field
+from pydantic_settings import SettingsConfigDict
+
+from .base import BaseSettings
+
+
+class CacheSettings(BaseSettings):
+    model_config = SettingsConfigDict(env_prefix="cache_")
+
+    enabled: bool = Field(default=False, title="Cache wallet lookups in Redis")
+    key_prefix: str = Field(default="wallet", title="Cache key prefix")
+    ttl: int = Field(default=30, title="Seconds a cached wallet is fresh", ge=1)
+    stale_ttl: int = Field(
+        default=300,
+        title="Seconds a cached wallet is served while being refreshed",
+        ge=0,
+    )
+    negative_ttl: int = Field(
+        default=60, title="Seconds a missing account is cached", ge=1
+    )
+
+    lock_enabled: bool = Field(
+        default=False, title="Coalesce lookups across workers with a Redis lock"
+    )
+    lock_timeout: float = Field(
+        default=10.0, title="Seconds a lookup lock is held at most", gt=0
+    )
+    lock_wait: float = Field(
+        default=5.0, title="Seconds to wait for another worker's lookup", ge=0
+    )
+
+
+cache_settings = CacheSettings()
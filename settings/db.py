@@ -12,6 +12,21 @@ class DbSettings(BaseSettings):
     login: str = Field(default="postgres", title="Database login")
     password: str = Field(default="postgres", title="Database password")
     name: str = Field(default="tronix", title="Database name")
+    count_cache_ttl: int = Field(
+        default=10, title="Seconds a cached count is reused", ge=1
+    )
+    count_cache_size: int = Field(
+        default=1024, title="Cached counts kept per process", ge=1
+    )
+    partition_months_ahead: int = Field(
+        default=3, title="Future monthly partitions kept created", ge=1
+    )
+    partition_retention_months: int = Field(
+        default=0, title="Past months of history kept, 0 keeps everything", ge=0
+    )
+    partition_detach: bool = Field(
+        default=False, title="Detach expired partitions instead of dropping them"
+    )
 
     @property
     def url(self) -> str:
@@ -5,6 +5,86 @@ from .base import BaseSettings
 
 class ExplorerSettings(BaseSettings):
     tron_api_key: str | None = Field(default=None, title="Tron API key")
+    tron_api_keys: list[str] = Field(
+        default_factory=list, title="Tron API keys, used along with the single key"
+    )
+    tron_key_rate: float = Field(
+        default=0, title="Requests per second per Tron API key, 0 for unlimited", ge=0
+    )
+    tron_key_burst: int = Field(
+        default=15, title="Requests a Tron API key may burst above its rate", ge=1
+    )
+    tron_key_wait: float = Field(
+        default=1.0, title="Seconds to wait for a Tron API key with capacity", ge=0
+    )
+    tron_key_cooldown: float = Field(
+        default=30.0, title="Seconds a rate limited Tron API key is skipped", ge=0
+    )
+    tron_key_prefix: str = Field(
+        default="tron-key", title="Redis key prefix of the Tron API key buckets"
+    )
+    tron_key_hosts: list[str] = Field(
+        default_factory=lambda: ["trongrid.io"],
+        title="Hosts, with their subdomains, the Tron API keys are sent to",
+    )
+    tron_endpoints: list[str] = Field(
+        default_factory=lambda: ["https://api.trongrid.io/"],
+        title="Tron HTTP API endpoints, in order of preference",
+        min_length=1,
+    )
+    tron_timeout: float = Field(default=10.0, title="Tron request timeout", gt=0)
+    tron_call_timeout: float = Field(
+        default=5.0, title="Timeout of a single Tron API call", gt=0
+    )
+    tron_deadline: float = Field(
+        default=8.0, title="Overall deadline of a Tron wallet lookup", gt=0
+    )
+
+    tron_breaker_failures: int = Field(
+        default=5, title="Consecutive failures opening a Tron endpoint breaker", ge=1
+    )
+    tron_breaker_recovery: float = Field(
+        default=30.0, title="Seconds before an open Tron endpoint is probed", ge=0
+    )
+    tron_hedge_enabled: bool = Field(
+        default=False, title="Call the next Tron endpoint when the first is slow"
+    )
+    tron_hedge_percentile: float = Field(
+        default=95,
+        title="Latency percentile after which a call is hedged",
+        gt=0,
+        le=100,
+    )
+    tron_hedge_min_delay: float = Field(
+        default=0.05, title="Minimum seconds before a call is hedged", ge=0
+    )
+    tron_hedge_window: int = Field(
+        default=100,
+        title="Latencies per Tron endpoint the percentile is taken of",
+        ge=1,
+    )
+
+    http_max_connections: int = Field(
+        default=100, title="Max HTTP connections per explorer", ge=1
+    )
+    http_max_keepalive_connections: int = Field(
+        default=20, title="Max keep-alive HTTP connections per explorer", ge=0
+    )
+    http_keepalive_expiry: float = Field(
+        default=30.0, title="Keep-alive connection expiry in seconds", ge=0
+    )
+
+    batch_max_addresses: int = Field(
+        default=500, title="Max addresses in a batch lookup", ge=1
+    )
+    batch_concurrency: int = Field(
+        default=20, title="Concurrent explorer calls of a batch lookup", ge=1
+    )
+
+    @property
+    def tron_keys(self) -> list[str]:
+        keys = [*self.tron_api_keys, self.tron_api_key]
+        return list(dict.fromkeys(key for key in keys if key))
 
 
 explorer_settings = ExplorerSettings()
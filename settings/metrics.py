@@ -0,0 +1,26 @@
+from pydantic import Field
+from pydantic_settings import SettingsConfigDict
+
+from .base import BaseSettings
+
+
+class MetricsSettings(BaseSettings):
+    model_config = SettingsConfigDict(env_prefix="metrics_")
+
+    enabled: bool = Field(default=True, title="Expose the Prometheus metrics")
+    worker_port: int = Field(
+        default=9100, title="Port of the worker metrics server, 0 to disable", ge=0
+    )
+
+    loop_monitor_enabled: bool = Field(
+        default=True, title="Measure the event loop lag and report the stalls"
+    )
+    loop_monitor_interval_ms: float = Field(
+        default=100, title="Milliseconds between two event loop lag measures", gt=0
+    )
+    loop_stall_threshold_ms: float = Field(
+        default=500, title="Milliseconds of lag logged with the blocking stack", gt=0
+    )
+
+
+metrics_settings = MetricsSettings()
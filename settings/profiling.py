@@ -0,0 +1,42 @@
+from pathlib import Path
+
+from pydantic import Field
+from pydantic_settings import SettingsConfigDict
+
+from .base import BaseSettings
+
+
+class ProfilingSettings(BaseSettings):
+    model_config = SettingsConfigDict(env_prefix="profiling_")
+
+    enabled: bool = Field(
+        default=False, title="Install the profiling middlewares, off costs nothing"
+    )
+    header: str = Field(
+        default="X-Profile", title="Request header triggering a profile"
+    )
+    header_secret: str | None = Field(
+        default=None, title="Value the profiling header must have, if any"
+    )
+    sample_rate: float = Field(
+        default=0, title="Share of the requests profiled", ge=0, le=1
+    )
+    task_names: list[str] = Field(
+        default_factory=lambda: ["save_wallets_info"],
+        title="Tasks that can be profiled",
+    )
+    task_sample_rate: float = Field(
+        default=0, title="Share of the task executions profiled", ge=0, le=1
+    )
+    interval_ms: float = Field(
+        default=5, title="Milliseconds between two stack samples", gt=0
+    )
+    min_duration_ms: float = Field(
+        default=0, title="Milliseconds below which a profile is not stored", ge=0
+    )
+    directory: Path = Field(
+        default=Path("profiles"), title="Directory of the stored profiles"
+    )
+
+
+profiling_settings = ProfilingSettings()
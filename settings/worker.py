@@ -0,0 +1,22 @@
+from pydantic import Field
+from pydantic_settings import SettingsConfigDict
+
+from .base import BaseSettings
+
+
+class WorkerSettings(BaseSettings):
+    model_config = SettingsConfigDict(env_prefix="worker_")
+
+    batch_enabled: bool = Field(
+        default=False,
+        title="Write the snapshots of many save messages in one transaction",
+    )
+    batch_max_size: int = Field(
+        default=1000, title="Snapshots written per transaction", ge=1
+    )
+    batch_max_delay_ms: int = Field(
+        default=50, title="Milliseconds a snapshot waits for its batch", ge=0
+    )
+
+
+worker_settings = WorkerSettings()
@@ -0,0 +1,81 @@
+import asyncio
+from typing import Awaitable, Callable, Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class MicroBatcher(Generic[T]):
+    def __init__(
+        self,
+        flush: Callable[[list[T]], Awaitable[None]],
+        max_size: int,
+        max_delay: float,
+    ):
+        self._flush = flush
+        self._max_size = max_size
+        self._max_delay = max_delay
+
+        self._pending: list[tuple[T, asyncio.Future[None]]] = []
+        self._timer: asyncio.Task | None = None
+        self._tasks: set[asyncio.Task] = set()
+
+    async def add(self, item: T) -> None:
+        """Add an item to the current batch and wait until the batch is flushed.
+
+        Args:
+            item: The item to add.
+
+        Raises:
+            Exception: The error the batch failed to flush with.
+
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((item, future))
+
+        if len(self._pending) >= self._max_size:
+            self._spawn(self._write(batch=self._take()))
+        elif self._timer is None:
+            self._timer = self._spawn(self._flush_later())
+
+        await asyncio.shield(future)
+
+    async def flush(self) -> None:
+        """Flush the current batch."""
+        await self._write(batch=self._take())
+
+    async def close(self) -> None:
+        """Flush the current batch and wait for the in-flight flushes."""
+        await self.flush()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(self._max_delay)
+        await self.flush()
+
+    def _take(self) -> list[tuple[T, asyncio.Future[None]]]:
+        batch, self._pending = self._pending, []
+
+        if self._timer is not None and self._timer is not asyncio.current_task():
+            self._timer.cancel()
+        self._timer = None
+
+        return batch
+
+    async def _write(self, batch: list[tuple[T, asyncio.Future[None]]]) -> None:
+        if not batch:
+            return
+
+        try:
+            await self._flush([item for item, _ in batch])
+        except Exception as err:
+            for _, future in batch:
+                future.set_exception(err)
+        else:
+            for _, future in batch:
+                future.set_result(None)
+
+    def _spawn(self, coroutine: Awaitable[None]) -> asyncio.Task:
+        task = asyncio.ensure_future(coroutine)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
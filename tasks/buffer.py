@@ -0,0 +1,111 @@
+import asyncio
+import logging
+from contextlib import suppress
+from typing import Awaitable, Callable, Generic, TypeVar
+
+from metrics.definitions import write_buffer_backpressure, write_buffer_items
+
+T = TypeVar("T")
+
+logger = logging.getLogger(__name__)
+
+
+class WriteBehindBuffer(Generic[T]):
+    def __init__(  # noqa: PLR0913
+        self,
+        publish: Callable[[list[T]], Awaitable[None]],
+        max_size: int,
+        batch_size: int,
+        *,
+        name: str,
+        max_delay: float,
+        retry_attempts: int,
+        retry_delay: float,
+    ):
+        self._publish = publish
+        self._name = name
+        self._batch_size = batch_size
+        self._max_delay = max_delay
+        self._retry_attempts = retry_attempts
+        self._retry_delay = retry_delay
+
+        self._queue: asyncio.Queue[T] = asyncio.Queue(maxsize=max_size)
+        self._task: asyncio.Task | None = None
+
+    async def add(self, item: T) -> None:
+        """Add an item to be published in the background.
+
+        Returns at once unless the buffer is full, then waits for room.
+
+        Args:
+            item: The item to add.
+
+        """
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._drain())
+
+        if self._queue.full():
+            write_buffer_backpressure.labels(buffer=self._name).inc()
+
+        await self._queue.put(item)
+
+    async def close(self, timeout: float) -> None:
+        """Publish the buffered items and stop the background task.
+
+        Args:
+            timeout: The seconds to wait for the buffer to be published.
+
+        """
+        if self._task is None:
+            return
+
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout=timeout)
+        except TimeoutError:
+            logger.warning("Dropped %d buffered items on close", self._queue.qsize())
+
+        self._task.cancel()
+        with suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+    async def _drain(self) -> None:
+        """Publish the buffered items in batches until cancelled."""
+        loop = asyncio.get_running_loop()
+
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self._max_delay
+
+            while len(batch) < self._batch_size:
+                try:
+                    batch.append(
+                        await asyncio.wait_for(
+                            self._queue.get(), timeout=deadline - loop.time()
+                        )
+                    )
+                except TimeoutError:
+                    break
+
+            await self._publish_with_retry(batch=batch)
+            for _ in batch:
+                self._queue.task_done()
+
+    async def _publish_with_retry(self, batch: list[T]) -> None:
+        for attempt in range(self._retry_attempts + 1):
+            try:
+                await self._publish(batch)
+            except Exception:
+                if attempt == self._retry_attempts:
+                    write_buffer_items.labels(buffer=self._name, outcome="dropped").inc(
+                        len(batch)
+                    )
+                    logger.exception("Failed to publish %d buffered items", len(batch))
+                    return
+
+                await asyncio.sleep(self._retry_delay * 2**attempt)
+            else:
+                write_buffer_items.labels(buffer=self._name, outcome="published").inc(
+                    len(batch)
+                )
+                return
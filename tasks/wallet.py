@@ -1,13 +1,70 @@
+import asyncio
+import logging
+
 from sqlalchemy.ext.asyncio import AsyncSession
 from taskiq import TaskiqDepends
 
 from broker import broker
+from db.sessions import async_session
 from enums.network import NetworkEnum
-from explorers.utils import get_explorer
+from explorers.registry import explorer_registry
+from repositories import WalletRepository
 from schemas.wallet import WalletInfo
+from settings import api_settings, db_settings, worker_settings
+from tasks.batcher import MicroBatcher
+from tasks.buffer import WriteBehindBuffer
 from tasks.dependencies import db
 from usecases import WalletUsecase
 
+logger = logging.getLogger(__name__)
+
+
+async def flush_wallets_info(wallets_info: list[WalletInfo]) -> None:
+    """Save a batch of wallets info to database in one transaction.
+
+    Args:
+        wallets_info: The wallets info.
+
+    """
+    async with async_session() as session:
+        await WalletUsecase(explorers=explorer_registry).save_wallets_info(
+            session=session, wallets_info=wallets_info
+        )
+
+
+wallets_info_batcher: MicroBatcher[WalletInfo] = MicroBatcher(
+    flush=flush_wallets_info,
+    max_size=worker_settings.batch_max_size,
+    max_delay=worker_settings.batch_max_delay_ms / 1000,
+)
+
+
+@broker.task(task_name="save_wallets_info")
+async def save_wallets_info(
+    wallets_info: list[dict],
+    session: AsyncSession = TaskiqDepends(db.get_session),  # noqa: B008
+) -> None:
+    """Save the info of many wallets to database.
+
+    In batch mode the snapshots of many messages are written in one
+    transaction, and the task completes only once its snapshots are written,
+    so the message is acknowledged after the flush.
+
+    Args:
+        wallets_info: The wallets info.
+        session: Database session.
+
+    """
+    items = [WalletInfo.model_validate(wallet_info) for wallet_info in wallets_info]
+
+    if worker_settings.batch_enabled:
+        await asyncio.gather(*(wallets_info_batcher.add(item=item) for item in items))
+        return
+
+    await WalletUsecase(explorers=explorer_registry).save_wallets_info(
+        session=session, wallets_info=items
+    )
+
 
 @broker.task(task_name="save_wallet_info")
 async def save_wallet_info(
@@ -17,12 +74,61 @@ async def save_wallet_info(
 ) -> None:
     """Save wallet info to database.
 
+    Deprecated, the API publishes `save_wallets_info`. Kept for one release so
+    the messages of API processes not upgraded yet are still saved.
+
     Args:
         network: The network enum.
         wallet_info: The wallet info.
         session: Database session.
 
     """
-    await WalletUsecase(explorer=get_explorer(network=network)).save_wallet_info(
-        session=session, wallet_info=WalletInfo.model_validate(wallet_info)
+    await save_wallets_info(wallets_info=[wallet_info], session=session)
+
+
+async def publish_wallets_info(wallets_info: list[dict]) -> None:
+    """Publish a batch of wallets info to be saved by the workers.
+
+    Args:
+        wallets_info: The wallets info.
+
+    """
+    await save_wallets_info.kiq(wallets_info=wallets_info)
+
+
+wallets_info_buffer: WriteBehindBuffer[dict] = WriteBehindBuffer(
+    publish=publish_wallets_info,
+    max_size=api_settings.write_buffer_size,
+    batch_size=api_settings.write_batch_size,
+    name="wallets_info",
+    max_delay=api_settings.write_max_delay_ms / 1000,
+    retry_attempts=api_settings.write_retry_attempts,
+    retry_delay=api_settings.write_retry_delay_ms / 1000,
+)
+
+
+@broker.task(task_name="maintain_wallet_partitions", schedule=[{"cron": "0 * * * *"}])
+async def maintain_wallet_partitions(
+    session: AsyncSession = TaskiqDepends(db.get_session),  # noqa: B008
+) -> None:
+    """Create the future monthly partitions of wallets and remove expired ones.
+
+    Args:
+        session: Database session.
+
+    """
+    repository = WalletRepository()
+
+    await repository.partitions.ensure(
+        session=session, months_ahead=db_settings.partition_months_ahead
     )
+    await session.commit()
+
+    if db_settings.partition_retention_months:
+        removed = await repository.remove_expired_partitions(
+            session=session,
+            retention=db_settings.partition_retention_months,
+            detach=db_settings.partition_detach,
+        )
+        if removed:
+            logger.info("Removed expired wallet partitions %s", removed)
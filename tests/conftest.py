@@ -35,11 +35,17 @@ async def test_session(test_engine: AsyncEngine) -> AsyncGenerator[AsyncSession,
 
 
 @pytest_asyncio.fixture(scope="function")
-async def test_client(test_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
+async def test_client(
+    test_engine: AsyncEngine, test_session: AsyncSession
+) -> AsyncGenerator[AsyncClient, None]:
     def override_get_session():
         return test_session
 
+    def override_get_session_maker():
+        return async_sessionmaker(bind=test_engine, expire_on_commit=False)
+
     app.dependency_overrides[db.get_session] = override_get_session
+    app.dependency_overrides[db.get_session_maker] = override_get_session_maker
 
     async with AsyncClient(
         transport=ASGITransport(app=app), base_url="http://test"
@@ -0,0 +1,45 @@
+from http import HTTPStatus
+
+import pytest
+from prometheus_client import REGISTRY
+
+from tests.test_api.base import BaseTestCase
+
+
+class TestGetMetrics(BaseTestCase):
+    url = "/metrics"
+    route = "/wallet/history"
+
+    @staticmethod
+    def get_requests_count(route: str) -> float:
+        return (
+            REGISTRY.get_sample_value(
+                "http_request_duration_seconds_count",
+                {"method": "GET", "route": route, "status": "200"},
+            )
+            or 0
+        )
+
+    @pytest.mark.asyncio
+    async def test_ok(self) -> None:
+        requests_count = self.get_requests_count(route=self.route)
+
+        await self.client.get(url=self.route)
+        response = await self.client.get(url=self.url)
+
+        assert response.status_code == HTTPStatus.OK
+        assert response.headers["content-type"].startswith("text/plain")
+        assert "http_request_duration_seconds" in response.text
+        assert self.get_requests_count(route=self.route) == requests_count + 1
+
+    @pytest.mark.asyncio
+    async def test_unmatched_route(self) -> None:
+        await self.client.get(url="/unknown/path")
+
+        assert (
+            REGISTRY.get_sample_value(
+                "http_request_duration_seconds_count",
+                {"method": "GET", "route": "unmatched", "status": "404"},
+            )
+            is not None
+        )
@@ -0,0 +1,103 @@
+from datetime import UTC, datetime
+from decimal import Decimal
+from unittest.mock import patch
+
+import fastapi.routing
+import httpx
+import pytest
+from fastapi import APIRouter, FastAPI
+from fastapi.routing import APIRoute
+
+from api.responses import ModelJSONResponse
+from api.routing import ModelResponseRoute
+from enums.network import NetworkEnum
+from schemas import (
+    PaginatedResponse,
+    WalletBatchItem,
+    WalletBatchResponse,
+    WalletInfo,
+    WalletResponse,
+)
+
+wallet_info = WalletInfo(
+    network=NetworkEnum.TRON,
+    address='T"é\\ü\n\x1f 😀',
+    balance=Decimal("100.123400"),
+    bandwidth=0,
+    missing_fields=["energy"],
+)
+page = PaginatedResponse[WalletResponse](
+    results=[
+        WalletResponse(
+            id=index,
+            network=NetworkEnum.TRON,
+            address=f"T{index:033d}",
+            balance=Decimal(index) / 7,
+            bandwidth=index,
+            energy=None,
+            created_at=datetime(2026, 1, 1, 12, 0, index % 60, index, tzinfo=UTC),
+        )
+        for index in range(100)
+    ],
+    count=1001,
+    count_exact=False,
+    page=3,
+    limit=100,
+    next_cursor="abc",
+)
+batch = WalletBatchResponse(
+    results=[
+        WalletBatchItem(address=wallet_info.address, result=wallet_info),
+        WalletBatchItem(address="invalid", error="Invalid address"),
+    ]
+)
+
+
+def make_app(route_class: type[APIRoute], **kwargs) -> FastAPI:
+    router = APIRouter(route_class=route_class)
+
+    @router.get(path="/wallet")
+    async def get_wallet() -> WalletInfo:
+        return wallet_info
+
+    @router.get(path="/page")
+    async def get_page() -> PaginatedResponse[WalletResponse]:
+        return page
+
+    @router.get(path="/batch", status_code=201)
+    async def get_batch() -> WalletBatchResponse:
+        return batch
+
+    app = FastAPI(**kwargs)
+    app.include_router(router=router)
+    return app
+
+
+async def get(app: FastAPI, url: str) -> httpx.Response:
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        return await client.get(url=url)
+
+
+class TestModelResponseRoute:
+    default_app = make_app(route_class=APIRoute)
+    fast_app = make_app(
+        route_class=ModelResponseRoute, default_response_class=ModelJSONResponse
+    )
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("url", ["/wallet", "/page", "/batch"])
+    async def test_same_bytes(self, url: str) -> None:
+        expected = await get(app=self.default_app, url=url)
+
+        with patch(
+            "fastapi.routing.serialize_response",
+            side_effect=fastapi.routing.serialize_response,
+        ) as mock_serialize_response:
+            response = await get(app=self.fast_app, url=url)
+
+        assert response.content == expected.content
+        assert response.status_code == expected.status_code
+        assert response.headers == expected.headers
+        mock_serialize_response.assert_not_called()
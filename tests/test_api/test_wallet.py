@@ -1,3 +1,6 @@
+import csv
+import io
+import json
 from decimal import Decimal
 from http import HTTPStatus
 from math import ceil
@@ -5,9 +8,12 @@ from typing import Generator
 from unittest.mock import MagicMock, patch
 
 import pytest
+import pytest_asyncio
 
 from enums.network import NetworkEnum
-from schemas import WalletInfo
+from exceptions.explorers import InvalidAddressError
+from repositories import WalletRepository
+from schemas import WalletInfo, WalletResponse
 from tests.factories import WalletFactory
 from tests.test_api.base import BaseTestCase
 
@@ -22,14 +28,9 @@ class TestGetWalletInfo(BaseTestCase):
 
     @pytest.fixture
     def _mock_explorer(self):
-        with (
-            patch(
-                "explorers.tron.TronExplorer.get_wallet_info"
-            ) as mock_get_wallet_info,
-            patch(
-                "explorers.tron.TronExplorer.check_is_valid_address"
-            ) as mock_check_is_valid_address,
-        ):
+        with patch(
+            "explorers.tron.TronExplorer.get_wallet_info"
+        ) as mock_get_wallet_info:
             mock_get_wallet_info.return_value = WalletInfo(
                 network=self.network,
                 address=self.address,
@@ -37,17 +38,16 @@ class TestGetWalletInfo(BaseTestCase):
                 bandwidth=self.bandwidth,
                 energy=self.energy,
             )
-            mock_check_is_valid_address.return_value = None
             yield
 
     @pytest.fixture
-    def mock_save_wallet_info_task(self) -> Generator[MagicMock, None, None]:
-        with patch("api.routers.wallet.save_wallet_info.kiq") as mock_kiq:
-            yield mock_kiq
+    def mock_buffer_add(self) -> Generator[MagicMock, None, None]:
+        with patch("api.routers.wallet.wallets_info_buffer.add") as mock_add:
+            yield mock_add
 
     @pytest.mark.asyncio
     @pytest.mark.usefixtures("_mock_explorer")
-    async def test_ok(self, mock_save_wallet_info_task: MagicMock) -> None:
+    async def test_ok(self, mock_buffer_add: MagicMock) -> None:
         response = await self.client.post(
             url=self.url,
             params={"network": self.network.value},
@@ -61,11 +61,13 @@ class TestGetWalletInfo(BaseTestCase):
         assert Decimal(data["balance"]) == self.balance
         assert data["bandwidth"] == self.bandwidth
         assert data["energy"] == self.energy
-        mock_save_wallet_info_task.assert_called_once()
+        mock_buffer_add.assert_called_once()
 
 
 class TestGetWalletHistory(BaseTestCase):
     url = "/wallet/history"
+    address = "TR7NHqjeKQxGTCi8q8ZY4pL8otSzgjLj6t"
+    hex_address = "41a614f803b6fd780986a42c78ec9c7f77e6ded13c"
 
     @pytest.mark.asyncio
     async def test_ok(self) -> None:
@@ -88,3 +90,251 @@ class TestGetWalletHistory(BaseTestCase):
         assert data["pages"] == pages
         assert data["next"] == pages
         assert data["previous"] is None
+
+    @pytest.mark.asyncio
+    async def test_cursor(self) -> None:
+        limit = 10
+        items_count = 15
+        await WalletFactory.create_batch_async(session=self.session, size=items_count)
+
+        first_page = (
+            await self.client.get(url=self.url, params={"limit": limit})
+        ).json()
+        response = await self.client.get(
+            url=self.url, params={"limit": limit, "cursor": first_page["next_cursor"]}
+        )
+
+        assert response.status_code == HTTPStatus.OK
+        data = response.json()
+        assert len(data["results"]) == items_count - limit
+        assert data["next_cursor"] is None
+        assert {item["id"] for item in data["results"]}.isdisjoint(
+            item["id"] for item in first_page["results"]
+        )
+
+    @pytest.mark.asyncio
+    async def test_invalid_cursor(self) -> None:
+        response = await self.client.get(url=self.url, params={"cursor": "invalid"})
+
+        assert response.status_code == HTTPStatus.BAD_REQUEST
+
+    @pytest.mark.asyncio
+    async def test_filters(self) -> None:
+        address = "TR7NHqjeKQxGTCi8q8ZY4pL8otSzgjLj6t"
+        items_count = 3
+        await WalletFactory.create_batch_async(session=self.session, size=items_count)
+        await WalletFactory.create_batch_async(
+            session=self.session, size=items_count, address=address
+        )
+
+        response = await self.client.get(
+            url=self.url,
+            params={
+                "network": NetworkEnum.TRON.value,
+                "address": address,
+                "sort_by": "created_at",
+                "sort_direction": "desc",
+            },
+        )
+
+        assert response.status_code == HTTPStatus.OK
+        data = response.json()
+        assert data["count"] == items_count
+        assert {item["address"] for item in data["results"]} == {address}
+
+    @pytest.mark.asyncio
+    async def test_hex_address(self) -> None:
+        items_count = 3
+        await WalletFactory.create_batch_async(session=self.session, size=items_count)
+        await WalletFactory.create_batch_async(
+            session=self.session, size=items_count, address=self.address
+        )
+
+        response = await self.client.get(
+            url=self.url, params={"address": self.hex_address}
+        )
+
+        assert response.status_code == HTTPStatus.OK
+        data = response.json()
+        assert data["count"] == items_count
+        assert {item["address"] for item in data["results"]} == {self.address}
+
+    @pytest.mark.asyncio
+    async def test_invalid_address(self) -> None:
+        response = await self.client.get(
+            url=self.url,
+            params={"network": NetworkEnum.TRON.value, "address": "invalid"},
+        )
+
+        assert response.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
+        assert response.json() == {"detail": InvalidAddressError().message}
+
+    @pytest.mark.asyncio
+    async def test_unsupported_sort_field(self) -> None:
+        response = await self.client.get(url=self.url, params={"sort_by": "energy"})
+
+        assert response.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
+
+
+class TestGetLatestWalletInfo(BaseTestCase):
+    network = NetworkEnum.TRON
+    address = "TR7NHqjeKQxGTCi8q8ZY4pL8otSzgjLj6t"
+    url = f"/wallet/{network.value}/{address}/latest"
+    balance = Decimal("100.123456")
+    stored_balance = Decimal("50.5")
+
+    @pytest.fixture
+    def mock_get_wallet_info(self) -> Generator[MagicMock, None, None]:
+        with (
+            patch(
+                "explorers.tron.TronExplorer.get_wallet_info",
+                return_value=WalletInfo(
+                    network=self.network, address=self.address, balance=self.balance
+                ),
+            ) as mock_get_wallet_info,
+            patch("api.routers.wallet.wallets_info_buffer.add"),
+        ):
+            yield mock_get_wallet_info
+
+    @pytest_asyncio.fixture
+    async def _stored_wallet(self) -> None:
+        await WalletRepository().create(
+            session=self.session,
+            data={
+                "network": self.network,
+                "address": self.address,
+                "balance": self.stored_balance,
+            },
+        )
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("_stored_wallet")
+    async def test_stored(self, mock_get_wallet_info: MagicMock) -> None:
+        response = await self.client.get(url=self.url)
+
+        assert response.status_code == HTTPStatus.OK
+        assert Decimal(response.json()["balance"]) == self.stored_balance
+        mock_get_wallet_info.assert_not_called()
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("_stored_wallet")
+    async def test_too_old(self, mock_get_wallet_info: MagicMock) -> None:
+        response = await self.client.get(url=self.url, params={"max_age": 0})
+
+        assert response.status_code == HTTPStatus.OK
+        assert Decimal(response.json()["balance"]) == self.balance
+        mock_get_wallet_info.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_missing(self, mock_get_wallet_info: MagicMock) -> None:
+        response = await self.client.get(url=self.url)
+
+        assert response.status_code == HTTPStatus.OK
+        assert Decimal(response.json()["balance"]) == self.balance
+        mock_get_wallet_info.assert_called_once()
+
+
+class TestExportWalletHistory(BaseTestCase):
+    url = "/wallet/history/export"
+    items_count = 5
+
+    @pytest.mark.asyncio
+    async def test_ndjson(self) -> None:
+        wallets = await WalletFactory.create_batch_async(
+            session=self.session, size=self.items_count
+        )
+
+        response = await self.client.get(url=self.url)
+
+        assert response.status_code == HTTPStatus.OK
+        assert response.headers["content-type"] == "application/x-ndjson"
+        items = [json.loads(line) for line in response.text.splitlines()]
+        assert [item["id"] for item in items] == [wallet.id for wallet in wallets]
+
+    @pytest.mark.asyncio
+    async def test_csv(self) -> None:
+        await WalletFactory.create_batch_async(
+            session=self.session, size=self.items_count
+        )
+
+        response = await self.client.get(url=self.url, params={"format": "csv"})
+
+        assert response.status_code == HTTPStatus.OK
+        assert response.headers["content-type"].startswith("text/csv")
+        rows = list(csv.DictReader(io.StringIO(response.text)))
+        assert len(rows) == self.items_count
+        assert list(rows[0]) == list(WalletResponse.model_fields)
+
+    @pytest.mark.asyncio
+    async def test_invalid_address(self) -> None:
+        response = await self.client.get(url=self.url, params={"address": "invalid"})
+
+        assert response.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
+
+    @pytest.mark.asyncio
+    async def test_after_id(self) -> None:
+        wallets = await WalletFactory.create_batch_async(
+            session=self.session, size=self.items_count
+        )
+
+        response = await self.client.get(
+            url=self.url, params={"after_id": wallets[1].id}
+        )
+
+        assert response.status_code == HTTPStatus.OK
+        items = [json.loads(line) for line in response.text.splitlines()]
+        assert [item["id"] for item in items] == [wallet.id for wallet in wallets[2:]]
+
+
+class TestGetWalletsInfo(BaseTestCase):
+    url = "/wallet/batch"
+    network = NetworkEnum.TRON
+    addresses = [
+        "TR7NHqjeKQxGTCi8q8ZY4pL8otSzgjLj6t",
+        "TN3W4H6rK2ce4vX9YnFQHwKENnHjoxb3m9",
+    ]
+    hex_address = "41a614f803b6fd780986a42c78ec9c7f77e6ded13c"
+    invalid_address = "invalid"
+
+    @pytest.fixture
+    def _mock_explorer(self):
+        async def get_wallet_info(address: str) -> WalletInfo:
+            return WalletInfo(network=self.network, address=address)
+
+        with patch(
+            "explorers.tron.TronExplorer.get_wallet_info",
+            side_effect=get_wallet_info,
+        ):
+            yield
+
+    @pytest.fixture
+    def mock_buffer_add(self) -> Generator[MagicMock, None, None]:
+        with patch("api.routers.wallet.wallets_info_buffer.add") as mock_add:
+            yield mock_add
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("_mock_explorer")
+    async def test_ok(self, mock_buffer_add: MagicMock) -> None:
+        response = await self.client.post(
+            url=self.url,
+            params={"network": self.network.value},
+            json={
+                "addresses": [
+                    *self.addresses,
+                    self.invalid_address,
+                    self.hex_address,
+                    *self.addresses,
+                ]
+            },
+        )
+
+        assert response.status_code == HTTPStatus.OK
+        results = response.json()["results"]
+        assert [item["address"] for item in results] == [
+            *self.addresses,
+            self.invalid_address,
+        ]
+        assert all(item["result"] is not None for item in results[:-1])
+        assert results[-1]["result"] is None
+        assert results[-1]["error"] == InvalidAddressError().message
+        assert mock_buffer_add.call_count == len(self.addresses)
@@ -0,0 +1,106 @@
+from http import HTTPStatus
+
+import httpx
+import pytest
+
+from benchmarks.load.driver import (
+    DROPPED,
+    Scenario,
+    drive,
+    make_scenarios,
+    summarize,
+)
+from benchmarks.load.fake_tron_server import app, fake_tron_settings
+
+
+class TestFakeTronServer:
+    address = "TR7NHqjeKQxGTCi8q8ZY4pL8otSzgjLj6t"
+
+    async def call(self) -> httpx.Response:
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://fake"
+        ) as client:
+            return await client.post(
+                url="/wallet/getaccount", json={"address": self.address}
+            )
+
+    @pytest.fixture(autouse=True)
+    def _no_latency(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(fake_tron_settings, "latency_median_ms", 0)
+
+    @pytest.mark.asyncio
+    async def test_ok(self) -> None:
+        response = await self.call()
+
+        assert response.status_code == HTTPStatus.OK
+        assert response.json()["address"] == self.address
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("setting", "status_code"),
+        [
+            ("error_rate", HTTPStatus.SERVICE_UNAVAILABLE),
+            ("rate_limit_rate", HTTPStatus.TOO_MANY_REQUESTS),
+        ],
+    )
+    async def test_failures(
+        self, monkeypatch: pytest.MonkeyPatch, setting: str, status_code: int
+    ) -> None:
+        monkeypatch.setattr(fake_tron_settings, setting, 1)
+
+        assert (await self.call()).status_code == status_code
+
+
+class TestMakeScenarios:
+    address = "41a614f803b6fd780986a42c78ec9c7f77e6ded13c"
+    base58_address = "TR7NHqjeKQxGTCi8q8ZY4pL8otSzgjLj6t"
+
+    @pytest.mark.asyncio
+    async def test_history_uses_base58_addresses(self) -> None:
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(status_code=HTTPStatus.OK)
+
+        _, history = make_scenarios(addresses=[self.address], history_ratio=1)
+        async with httpx.AsyncClient(
+            transport=httpx.MockTransport(handler), base_url="http://app"
+        ) as client:
+            await history.send(client)
+
+        assert requests[0].url.params["address"] == self.base58_address
+
+
+class TestDrive:
+    rps = 200
+    duration = 0.1
+    requests_count = 20
+
+    @staticmethod
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/fail":
+            return httpx.Response(status_code=HTTPStatus.INTERNAL_SERVER_ERROR)
+        return httpx.Response(status_code=HTTPStatus.OK)
+
+    @pytest.mark.asyncio
+    async def test_summary(self) -> None:
+        async def fail(client: httpx.AsyncClient) -> httpx.Response:
+            return await client.get(url="/fail")
+
+        async with httpx.AsyncClient(
+            transport=httpx.MockTransport(self.handler), base_url="http://app"
+        ) as client:
+            samples = await drive(
+                client=client,
+                scenarios=[Scenario(name="fail", weight=1, send=fail)],
+                rps=self.rps,
+                duration=self.duration,
+                max_in_flight=self.requests_count,
+            )
+
+        summary = summarize(samples=samples, duration=self.duration)["fail"]
+        assert summary["requests"] == self.requests_count
+        assert summary["error_rate"] == 1
+        assert summary["outcomes"] == {"500": self.requests_count}
+        assert DROPPED not in summary["outcomes"]
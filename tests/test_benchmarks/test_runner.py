@@ -0,0 +1,44 @@
+import pytest
+
+from benchmarks.runner import Result, compare, measure
+
+
+def make_result(name: str, median: float) -> Result:
+    return Result(name=name, median=median, best=median, number=1)
+
+
+class TestCompare:
+    baselines = {"fast": 1.0, "slow": 1.0}
+    threshold = 0.25
+
+    def test_regressions(self) -> None:
+        results = [
+            make_result(name="fast", median=1.2),
+            make_result(name="slow", median=1.3),
+            make_result(name="new", median=10.0),
+        ]
+
+        assert compare(
+            results=results, baselines=self.baselines, threshold=self.threshold
+        ) == ["slow"]
+
+
+class TestMeasure:
+    min_time = 0.01
+    rounds = 3
+
+    @pytest.mark.asyncio
+    async def test_calibrates_rounds(self) -> None:
+        calls = 0
+
+        async def call() -> None:
+            nonlocal calls
+            calls += 1
+
+        result = await measure(
+            name="noop", call=call, rounds=self.rounds, min_time=self.min_time
+        )
+
+        assert result.number > 1
+        assert calls >= result.number * (self.rounds + 1)
+        assert result.best <= result.median
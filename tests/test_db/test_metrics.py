@@ -0,0 +1,45 @@
+import pytest
+from prometheus_client import REGISTRY
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from metrics import instrument_engine
+from metrics.db import get_operation
+
+
+def get_sample_value(name: str, labels: dict[str, str] | None = None) -> float:
+    return REGISTRY.get_sample_value(name, labels or {}) or 0
+
+
+class TestInstrumentEngine:
+    @pytest.mark.parametrize(
+        ("statement", "operation"),
+        [
+            ("SELECT 1", "SELECT"),
+            ("\n  insert into wallets", "INSERT"),
+            ("WITH rows AS (SELECT 1) SELECT * FROM rows", "WITH"),
+            ("CREATE TABLE wallets_p202601", "OTHER"),
+            ("", "OTHER"),
+        ],
+    )
+    def test_get_operation(self, statement: str, operation: str) -> None:
+        assert get_operation(statement=statement) == operation
+
+    @pytest.mark.asyncio
+    async def test_records_queries_and_pool(self) -> None:
+        engine = create_async_engine(url="sqlite+aiosqlite:///:memory:")
+        instrument_engine(engine=engine)
+        labels = {"operation": "SELECT"}
+        count = get_sample_value("db_query_duration_seconds_count", labels)
+        checked_out = get_sample_value("db_pool_checked_out_connections")
+
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+            assert (
+                get_sample_value("db_pool_checked_out_connections") == checked_out + 1
+            )
+
+        await engine.dispose()
+
+        assert get_sample_value("db_query_duration_seconds_count", labels) == count + 1
+        assert get_sample_value("db_pool_checked_out_connections") == checked_out
@@ -0,0 +1,25 @@
+from datetime import date
+
+import pytest
+
+from db.partitions import MonthlyPartitions, add_months
+
+
+@pytest.mark.parametrize(
+    ("month", "months", "expected"),
+    [
+        (date(2026, 10, 18), 0, date(2026, 10, 1)),
+        (date(2026, 10, 1), 3, date(2027, 1, 1)),
+        (date(2026, 1, 1), -1, date(2025, 12, 1)),
+        (date(2026, 10, 1), -22, date(2024, 12, 1)),
+    ],
+)
+def test_add_months(month: date, months: int, expected: date) -> None:
+    assert add_months(month=month, months=months) == expected
+
+
+def test_get_name() -> None:
+    partitions = MonthlyPartitions(table="wallets", key="created_at")
+
+    assert partitions.get_name(month=date(2026, 1, 1)) == "wallets_p202601"
+    assert partitions.default == "wallets_default"
@@ -0,0 +1,161 @@
+import asyncio
+import json
+import time
+from decimal import Decimal
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from prometheus_client import REGISTRY
+
+from enums.network import NetworkEnum
+from exceptions.explorers import AccountNotFoundError
+from explorers.cache import LOCK_POLL_INTERVAL, CachedExplorer
+from schemas import WalletInfo
+from settings import cache_settings
+
+
+def get_events_count(network: NetworkEnum, outcome: str) -> float:
+    return (
+        REGISTRY.get_sample_value(
+            "explorer_cache_events_total", {"network": network, "outcome": outcome}
+        )
+        or 0
+    )
+
+
+class FakeRedis:
+    def __init__(self) -> None:
+        self.data: dict[str, str] = {}
+
+    async def get(self, key: str) -> str | None:
+        return self.data.get(key)
+
+    async def set(self, key: str, value: str, ex: int) -> None:
+        self.data[key] = value
+
+    async def mget(self, *keys: str) -> list[str | None]:
+        return [self.data.get(key) for key in keys]
+
+    def lock(self, name: str, **kwargs: Any) -> MagicMock:
+        return MagicMock(
+            acquire=AsyncMock(return_value=name not in self.data),
+            release=AsyncMock(),
+        )
+
+
+class TestGetWalletInfo:
+    network = NetworkEnum.TRON
+    address = "TR7NHqjeKQxGTCi8q8ZY4pL8otSzgjLj6t"
+    wallet_info = WalletInfo(
+        network=NetworkEnum.TRON,
+        address="TR7NHqjeKQxGTCi8q8ZY4pL8otSzgjLj6t",
+        balance=Decimal("100.123456"),
+        bandwidth=1000,
+        energy=2000,
+    )
+
+    @pytest.fixture
+    def inner(self) -> MagicMock:
+        return MagicMock(get_wallet_info=AsyncMock(return_value=self.wallet_info))
+
+    @pytest.fixture
+    def redis(self) -> FakeRedis:
+        return FakeRedis()
+
+    @pytest.fixture
+    def explorer(self, inner: MagicMock, redis: FakeRedis) -> CachedExplorer:
+        return CachedExplorer(
+            explorer=inner,
+            network=self.network,
+            redis=redis,  # type: ignore[arg-type]
+        )
+
+    @pytest.mark.asyncio
+    async def test_hit_after_miss(
+        self, explorer: CachedExplorer, inner: MagicMock
+    ) -> None:
+        misses = get_events_count(network=self.network, outcome="miss")
+        hits = get_events_count(network=self.network, outcome="hit")
+
+        first = await explorer.get_wallet_info(address=self.address)
+        second = await explorer.get_wallet_info(address=self.address)
+
+        assert first == second == self.wallet_info
+        inner.get_wallet_info.assert_awaited_once()
+        assert get_events_count(network=self.network, outcome="miss") - misses == 1
+        assert get_events_count(network=self.network, outcome="hit") - hits == 1
+
+    @pytest.mark.asyncio
+    async def test_stale_while_revalidate(
+        self, explorer: CachedExplorer, inner: MagicMock, redis: FakeRedis
+    ) -> None:
+        stale_hits = get_events_count(network=self.network, outcome="stale_hit")
+        key = f"{cache_settings.key_prefix}:{self.network}:{self.address}"
+        fetched_at = time.time() - cache_settings.ttl - 1
+        redis.data[key] = json.dumps(
+            {
+                "fetched_at": fetched_at,
+                "value": self.wallet_info.model_dump(mode="json"),
+            }
+        )
+
+        wallet_info = await explorer.get_wallet_info(address=self.address)
+        await asyncio.gather(*explorer._tasks)
+
+        assert (
+            wallet_info.model_copy(update={"fetched_at": self.wallet_info.fetched_at})
+            == self.wallet_info
+        )
+        assert wallet_info.fetched_at.timestamp() == pytest.approx(fetched_at)
+        assert (
+            get_events_count(network=self.network, outcome="stale_hit") - stale_hits
+            == 1
+        )
+        inner.get_wallet_info.assert_awaited_once()
+        assert json.loads(redis.data[key])["fetched_at"] == pytest.approx(
+            self.wallet_info.fetched_at.timestamp()
+        )
+
+    @pytest.mark.asyncio
+    async def test_negative_caching(
+        self, explorer: CachedExplorer, inner: MagicMock
+    ) -> None:
+        negative_hits = get_events_count(network=self.network, outcome="negative_hit")
+        inner.get_wallet_info.side_effect = AccountNotFoundError
+
+        for _ in range(2):
+            with pytest.raises(AccountNotFoundError):
+                await explorer.get_wallet_info(address=self.address)
+
+        inner.get_wallet_info.assert_awaited_once()
+        assert (
+            get_events_count(network=self.network, outcome="negative_hit")
+            - negative_hits
+            == 1
+        )
+
+    @pytest.mark.asyncio
+    async def test_wait_ends_when_lock_released(
+        self,
+        explorer: CachedExplorer,
+        inner: MagicMock,
+        redis: FakeRedis,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setattr(cache_settings, "lock_enabled", True)
+        key = f"{cache_settings.key_prefix}:{self.network}:{self.address}"
+        redis.data[f"{key}:lock"] = "token"
+
+        async def release() -> None:
+            await asyncio.sleep(LOCK_POLL_INTERVAL)
+            del redis.data[f"{key}:lock"]
+
+        started_at = time.monotonic()
+        wallet_info, _ = await asyncio.gather(
+            explorer.get_wallet_info(address=self.address), release()
+        )
+
+        assert wallet_info == self.wallet_info
+        assert time.monotonic() - started_at < cache_settings.lock_wait
+        inner.get_wallet_info.assert_awaited_once()
@@ -0,0 +1,55 @@
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from enums.network import NetworkEnum
+from explorers.coalescing import CoalescingExplorer
+from schemas import WalletInfo
+
+
+class TestGetWalletInfo:
+    address = "TR7NHqjeKQxGTCi8q8ZY4pL8otSzgjLj6t"
+    concurrency = 10
+
+    @pytest.mark.asyncio
+    async def test_concurrent_lookups_share_one_call(self) -> None:
+        calls = 0
+
+        async def get_wallet_info(address: str) -> WalletInfo:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return WalletInfo(network=NetworkEnum.TRON, address=address)
+
+        explorer = CoalescingExplorer(
+            explorer=MagicMock(get_wallet_info=get_wallet_info)
+        )
+
+        results = await asyncio.gather(
+            *(
+                explorer.get_wallet_info(address=self.address)
+                for _ in range(self.concurrency)
+            )
+        )
+
+        assert calls == 1
+        assert len(results) == self.concurrency
+        assert all(result is results[0] for result in results)
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_others(self) -> None:
+        async def get_wallet_info(address: str) -> WalletInfo:
+            await asyncio.sleep(0.01)
+            return WalletInfo(network=NetworkEnum.TRON, address=address)
+
+        explorer = CoalescingExplorer(
+            explorer=MagicMock(get_wallet_info=get_wallet_info)
+        )
+
+        cancelled = asyncio.create_task(explorer.get_wallet_info(address=self.address))
+        other = asyncio.create_task(explorer.get_wallet_info(address=self.address))
+        await asyncio.sleep(0)
+        cancelled.cancel()
+
+        assert (await other).address == self.address
@@ -0,0 +1,93 @@
+import httpx
+import pytest
+from prometheus_client import REGISTRY
+
+from exceptions.explorers import ExplorerRateLimitedError
+from explorers.keys import ApiKeyPool, mask_key
+from explorers.providers import KeyPoolHTTPProvider
+from settings.explorer import explorer_settings
+
+
+def get_rate_limits_count(key: str) -> float:
+    return (
+        REGISTRY.get_sample_value(
+            "explorer_api_key_rate_limits_total", {"key": mask_key(key=key)}
+        )
+        or 0
+    )
+
+
+class TestMaskKey:
+    key = "0123456789abcdef"
+
+    def test_keeps_last_characters(self) -> None:
+        assert mask_key(key=self.key) == "***cdef"
+
+
+class TestApiKeyPool:
+    keys = ["first", "second"]
+
+    @pytest.mark.asyncio
+    async def test_least_loaded_key(self) -> None:
+        pool = ApiKeyPool(keys=self.keys)
+
+        first = await pool.acquire()
+        second = await pool.acquire()
+        pool.release(key=first)
+        third = await pool.acquire()
+
+        assert [first, second, third] == [*self.keys, first]
+
+    @pytest.mark.asyncio
+    async def test_skips_cooling_key(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(explorer_settings, "tron_key_wait", 0)
+        rate_limits = get_rate_limits_count(key=self.keys[0])
+        pool = ApiKeyPool(keys=self.keys)
+
+        await pool.cool_down(key=self.keys[0])
+        assert await pool.acquire() == self.keys[1]
+
+        await pool.cool_down(key=self.keys[1])
+        with pytest.raises(ExplorerRateLimitedError):
+            await pool.acquire()
+
+        assert get_rate_limits_count(key=self.keys[0]) - rate_limits == 1
+
+
+class TestKeyPoolHTTPProvider:
+    keys = ["first", "second"]
+
+    @pytest.mark.asyncio
+    async def test_retries_rate_limited_key(self) -> None:
+        used_keys: list[str] = []
+        rate_limits = get_rate_limits_count(key=self.keys[0])
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            used_keys.append(request.headers["Tron-Pro-Api-Key"])
+            if request.headers["Tron-Pro-Api-Key"] == self.keys[0]:
+                return httpx.Response(status_code=429)
+            return httpx.Response(status_code=200, json={"balance": 1})
+
+        pool = ApiKeyPool(keys=self.keys)
+        provider = KeyPoolHTTPProvider(
+            keys=pool,
+            timeout=1,
+            client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        )
+
+        assert await provider.make_request(method="wallet/getaccount") == {"balance": 1}
+        assert used_keys == self.keys
+        assert get_rate_limits_count(key=self.keys[0]) - rate_limits == 1
+
+    @pytest.mark.asyncio
+    async def test_all_keys_rate_limited(self) -> None:
+        provider = KeyPoolHTTPProvider(
+            keys=ApiKeyPool(keys=self.keys),
+            timeout=1,
+            client=httpx.AsyncClient(
+                transport=httpx.MockTransport(lambda _: httpx.Response(429))
+            ),
+        )
+
+        with pytest.raises(ExplorerRateLimitedError):
+            await provider.make_request(method="wallet/getaccount")
@@ -0,0 +1,180 @@
+import asyncio
+
+import httpx
+import pytest
+from prometheus_client import REGISTRY
+
+from exceptions.explorers import ExplorerRateLimitedError, ExplorerUnavailableError
+from explorers.circuit_breaker import CircuitBreaker
+from explorers.keys import ApiKeyPool
+from explorers.providers import (
+    BREAKER_STATES,
+    MIN_HEDGE_SAMPLES,
+    FailoverHTTPProvider,
+)
+from settings.explorer import explorer_settings
+
+
+def get_sample_value(name: str, labels: dict[str, str]) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0
+
+
+class TestCircuitBreaker:
+    failure_threshold = 2
+
+    def test_opens_after_failures(self) -> None:
+        breaker = CircuitBreaker(
+            failure_threshold=self.failure_threshold, recovery_time=60
+        )
+
+        breaker.record_failure()
+        assert breaker.allow()
+
+        breaker.record_failure()
+        assert breaker.state == "open"
+        assert not breaker.allow()
+
+    def test_probes_once_when_half_open(self) -> None:
+        breaker = CircuitBreaker(failure_threshold=1, recovery_time=0)
+
+        breaker.record_failure()
+        assert breaker.state == "half_open"
+        assert breaker.allow()
+        assert not breaker.allow()
+
+        breaker.record_success()
+        assert breaker.state == "closed"
+
+    def test_reports_state_changes(self) -> None:
+        states: list[str] = []
+        breaker = CircuitBreaker(
+            failure_threshold=1, recovery_time=0, on_change=states.append
+        )
+
+        breaker.record_failure()
+        breaker.allow()
+        breaker.record_success()
+        breaker.record_success()
+
+        assert states == ["closed", "half_open", "closed"]
+
+
+class TestFailoverHTTPProvider:
+    endpoints = ["http://primary/", "http://secondary/"]
+
+    keyed_endpoints = ["https://api.trongrid.io/", "http://node/"]
+
+    def make_provider(
+        self, handler, endpoints: list[str] | None = None
+    ) -> FailoverHTTPProvider:
+        return FailoverHTTPProvider(
+            keys=ApiKeyPool(keys=["key"]),
+            timeout=1,
+            client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+            endpoints=endpoints or self.endpoints,
+        )
+
+    @pytest.mark.asyncio
+    async def test_fails_over(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(explorer_settings, "tron_breaker_failures", 1)
+        hosts: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            hosts.append(request.url.host)
+            if request.url.host == "primary":
+                return httpx.Response(status_code=503)
+            return httpx.Response(status_code=200, json={"host": request.url.host})
+
+        provider = self.make_provider(handler=handler)
+
+        assert await provider.make_request(method="wallet/getaccount") == {
+            "host": "secondary"
+        }
+        assert await provider.make_request(method="wallet/getaccount") == {
+            "host": "secondary"
+        }
+        assert hosts == ["primary", "secondary", "secondary"]
+        assert provider.upstreams[0].breaker.state == "open"
+        assert (
+            get_sample_value(
+                "explorer_upstream_breaker_state", {"endpoint": self.endpoints[0]}
+            )
+            == BREAKER_STATES["open"]
+        )
+
+    @pytest.mark.asyncio
+    async def test_all_endpoints_down(self) -> None:
+        provider = self.make_provider(handler=lambda _: httpx.Response(status_code=500))
+
+        with pytest.raises(ExplorerUnavailableError):
+            await provider.make_request(method="wallet/getaccount")
+
+    @pytest.mark.asyncio
+    async def test_hedges_slow_endpoint(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(explorer_settings, "tron_hedge_enabled", True)
+        monkeypatch.setattr(explorer_settings, "tron_hedge_min_delay", 0)
+        labels = {"endpoint": self.endpoints[1]}
+        hedged = get_sample_value("explorer_upstream_hedged_total", labels)
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.host == "primary":
+                await asyncio.sleep(10)
+            return httpx.Response(status_code=200, json={"host": request.url.host})
+
+        provider = self.make_provider(handler=handler)
+        provider.upstreams[0].latencies.extend([0.01] * MIN_HEDGE_SAMPLES)
+
+        result = await asyncio.wait_for(
+            provider.make_request(method="wallet/getaccount"), timeout=1
+        )
+
+        assert result == {"host": "secondary"}
+        assert get_sample_value("explorer_upstream_hedged_total", labels) - hedged == 1
+
+    @pytest.mark.asyncio
+    async def test_keys_only_sent_to_key_hosts(self) -> None:
+        keys: dict[str, str | None] = {}
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            keys[request.url.host] = request.headers.get("Tron-Pro-Api-Key")
+            if request.url.host == "api.trongrid.io":
+                return httpx.Response(status_code=503)
+            return httpx.Response(status_code=200, json={})
+
+        provider = self.make_provider(handler=handler, endpoints=self.keyed_endpoints)
+        await provider.make_request(method="wallet/getaccount")
+
+        assert keys == {"api.trongrid.io": "key", "node": None}
+
+    @pytest.mark.asyncio
+    async def test_fails_over_when_rate_limited(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(explorer_settings, "tron_breaker_failures", 1)
+        labels = {
+            "endpoint": self.keyed_endpoints[0],
+            "method": "wallet/getaccount",
+            "outcome": "rate_limited",
+        }
+        name = "explorer_upstream_request_duration_seconds_count"
+        rate_limited = get_sample_value(name, labels)
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.host == "api.trongrid.io":
+                return httpx.Response(status_code=429)
+            return httpx.Response(status_code=200, json={"host": request.url.host})
+
+        provider = self.make_provider(handler=handler, endpoints=self.keyed_endpoints)
+
+        assert await provider.make_request(method="wallet/getaccount") == {
+            "host": "node"
+        }
+        assert provider.upstreams[0].breaker.state == "closed"
+        assert get_sample_value(name, labels) - rate_limited == 1
+
+    @pytest.mark.asyncio
+    async def test_all_endpoints_rate_limited(self) -> None:
+        provider = self.make_provider(handler=lambda _: httpx.Response(status_code=429))
+
+        with pytest.raises(ExplorerRateLimitedError):
+            await provider.make_request(method="wallet/getaccount")
@@ -0,0 +1,31 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from enums.network import NetworkEnum
+from explorers.registry import ExplorerRegistry
+
+
+class TestGet:
+    def test_returns_shared_instance(self) -> None:
+        factory = MagicMock()
+        registry = ExplorerRegistry(factory=factory)
+
+        first = registry.get(network=NetworkEnum.TRON)
+        second = registry.get(network=NetworkEnum.TRON)
+
+        assert first is second
+        factory.assert_called_once_with(NetworkEnum.TRON)
+
+
+class TestClose:
+    @pytest.mark.asyncio
+    async def test_closes_created_explorers(self) -> None:
+        explorer = MagicMock(close=AsyncMock())
+        registry = ExplorerRegistry(factory=MagicMock(return_value=explorer))
+        registry.get(network=NetworkEnum.TRON)
+
+        await registry.close()
+
+        explorer.close.assert_awaited_once()
+        assert registry.get(network=NetworkEnum.TRON) is explorer
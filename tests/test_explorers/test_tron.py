@@ -0,0 +1,81 @@
+import asyncio
+from decimal import Decimal
+from typing import AsyncGenerator
+
+import pytest
+import pytest_asyncio
+
+from exceptions.explorers import ExplorerTimeoutError
+from explorers.tron import TronExplorer
+from settings.explorer import explorer_settings
+
+
+async def get_account(addr: str) -> dict:
+    return {"balance": 1_500_000}
+
+
+async def get_account_resource(addr: str) -> dict:
+    return {"freeNetLimit": 600, "freeNetUsed": 100, "EnergyLimit": 50}
+
+
+async def hang(addr: str) -> dict:
+    await asyncio.sleep(10)
+    return {}
+
+
+@pytest_asyncio.fixture
+async def explorer(
+    monkeypatch: pytest.MonkeyPatch,
+) -> AsyncGenerator[TronExplorer, None]:
+    monkeypatch.setattr(explorer_settings, "tron_call_timeout", 0.05)
+    monkeypatch.setattr(explorer_settings, "tron_deadline", 0.1)
+
+    explorer = TronExplorer()
+    yield explorer
+    await explorer.close()
+
+
+class TestGetWalletInfo:
+    address = "TR7NHqjeKQxGTCi8q8ZY4pL8otSzgjLj6t"
+    bandwidth = 500
+    energy = 50
+
+    @pytest.mark.asyncio
+    async def test_ok(
+        self, explorer: TronExplorer, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(explorer._client, "get_account", get_account)
+        monkeypatch.setattr(
+            explorer._client, "get_account_resource", get_account_resource
+        )
+
+        wallet_info = await explorer.get_wallet_info(address=self.address)
+
+        assert wallet_info.balance == Decimal("1.5")
+        assert wallet_info.bandwidth == self.bandwidth
+        assert wallet_info.energy == self.energy
+        assert wallet_info.missing_fields == []
+
+    @pytest.mark.asyncio
+    async def test_partial_on_timeout(
+        self, explorer: TronExplorer, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(explorer._client, "get_account", get_account)
+        monkeypatch.setattr(explorer._client, "get_account_resource", hang)
+
+        wallet_info = await explorer.get_wallet_info(address=self.address)
+
+        assert wallet_info.balance == Decimal("1.5")
+        assert wallet_info.bandwidth is None
+        assert wallet_info.energy is None
+        assert wallet_info.missing_fields == ["bandwidth", "energy"]
+
+    @pytest.mark.asyncio
+    async def test_all_timed_out(
+        self, explorer: TronExplorer, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(explorer._client, "get_account", hang)
+        monkeypatch.setattr(explorer._client, "get_account_resource", hang)
+
+        with pytest.raises(ExplorerTimeoutError):
+            await explorer.get_wallet_info(address=self.address)
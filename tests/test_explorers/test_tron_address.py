@@ -0,0 +1,41 @@
+import pytest
+
+from exceptions.explorers import InvalidAddressError
+from explorers.tron_address import normalize_tron_address, normalize_tron_addresses
+
+
+class TestNormalizeTronAddress:
+    address = "TR7NHqjeKQxGTCi8q8ZY4pL8otSzgjLj6t"
+    hex_address = "41a614f803b6fd780986a42c78ec9c7f77e6ded13c"
+
+    @pytest.mark.parametrize(
+        "value",
+        [address, hex_address, hex_address.upper(), f"0x{hex_address}"],
+    )
+    def test_canonical(self, value: str) -> None:
+        assert normalize_tron_address(address=value) == self.address
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            "",
+            "invalid",
+            address[:-1] + "u",
+            address.lower(),
+            "0" * 42,
+            hex_address + "00",
+            "41 a614f803b6fd780986a42c78ec9c7f77e6de d1",
+        ],
+    )
+    def test_invalid(self, value: str) -> None:
+        with pytest.raises(InvalidAddressError):
+            normalize_tron_address(address=value)
+
+    def test_many(self) -> None:
+        assert normalize_tron_addresses(
+            addresses=[self.address, self.hex_address, "invalid"]
+        ) == {
+            self.address: self.address,
+            self.hex_address: self.address,
+            "invalid": None,
+        }
@@ -0,0 +1,51 @@
+import asyncio
+import logging
+import time
+
+import pytest
+from prometheus_client import REGISTRY
+
+from metrics import LoopLagMonitor
+
+
+def get_sample_value(name: str) -> float:
+    return REGISTRY.get_sample_value(name) or 0
+
+
+class TestLoopLagMonitor:
+    interval = 0.01
+    threshold = 0.05
+    stall = 0.2
+
+    def block(self) -> None:
+        time.sleep(self.stall)
+
+    @pytest.mark.asyncio
+    async def test_reports_stall(self, caplog: pytest.LogCaptureFixture) -> None:
+        stalls = get_sample_value("event_loop_stalls_total")
+        lags = get_sample_value("event_loop_lag_seconds_count")
+        monitor = LoopLagMonitor(interval=self.interval, threshold=self.threshold)
+
+        with caplog.at_level(logging.WARNING, logger="metrics.loop"):
+            await monitor.start()
+            await asyncio.sleep(self.interval * 3)
+            self.block()
+            await asyncio.sleep(self.interval * 3)
+            await monitor.stop()
+
+        assert get_sample_value("event_loop_stalls_total") == stalls + 1
+        assert get_sample_value("event_loop_lag_seconds_count") > lags
+        assert get_sample_value("event_loop_lag_seconds_sum") >= self.stall * 0.5
+        (record,) = caplog.records
+        assert "in block" in record.getMessage()
+
+    @pytest.mark.asyncio
+    async def test_no_stall(self, caplog: pytest.LogCaptureFixture) -> None:
+        monitor = LoopLagMonitor(interval=self.interval, threshold=self.threshold)
+
+        with caplog.at_level(logging.WARNING, logger="metrics.loop"):
+            await monitor.start()
+            await asyncio.sleep(self.interval * 5)
+            await monitor.stop()
+
+        assert caplog.records == []
@@ -0,0 +1,53 @@
+import time
+
+from prometheus_client import REGISTRY
+from taskiq import TaskiqMessage, TaskiqResult
+
+from middlewares import TaskiqMetricsMiddleware
+from middlewares.metrics import ENQUEUED_AT_LABEL
+
+
+def make_message(task_name: str) -> TaskiqMessage:
+    return TaskiqMessage(
+        task_id="task_id", task_name=task_name, labels={}, args=[], kwargs={}
+    )
+
+
+def get_sample_value(name: str, labels: dict[str, str]) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0
+
+
+class TestTaskiqMetricsMiddleware:
+    task_name = "metered_task"
+    lag = 5
+    execution_time = 0.5
+
+    def test_queue_lag(self) -> None:
+        middleware = TaskiqMetricsMiddleware()
+        message = middleware.pre_send(message=make_message(task_name=self.task_name))
+        message.labels[ENQUEUED_AT_LABEL] = time.time() - self.lag
+
+        middleware.pre_execute(message=message)
+
+        assert (
+            get_sample_value(
+                "task_queue_lag_seconds_sum", {"task_name": self.task_name}
+            )
+            >= self.lag
+        )
+
+    def test_duration(self) -> None:
+        labels = {"task_name": self.task_name, "status": "error"}
+        count = get_sample_value("task_duration_seconds_count", labels)
+
+        TaskiqMetricsMiddleware().post_execute(
+            message=make_message(task_name=self.task_name),
+            result=TaskiqResult(
+                is_err=True,
+                return_value=None,
+                execution_time=self.execution_time,
+                error=ValueError(),
+            ),
+        )
+
+        assert get_sample_value("task_duration_seconds_count", labels) == count + 1
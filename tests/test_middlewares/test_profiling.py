@@ -0,0 +1,103 @@
+import asyncio
+import time
+from pathlib import Path
+
+import httpx
+import pytest
+from starlette.types import Receive, Scope, Send
+from taskiq import TaskiqMessage, TaskiqResult
+
+from middlewares import ProfilingMiddleware, TaskiqProfilingMiddleware
+from middlewares.profiling import PROFILE_LABEL
+from profiling.sampler import WAITING_FRAME
+from settings import profiling_settings
+
+
+def busy(duration: float) -> None:
+    deadline = time.perf_counter() + duration
+    while time.perf_counter() < deadline:
+        pass
+
+
+async def app(scope: Scope, receive: Receive, send: Send) -> None:
+    busy(duration=0.05)
+    await asyncio.sleep(0.05)
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b""})
+
+
+@pytest.fixture(autouse=True)
+def profiles_directory(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    monkeypatch.setattr(profiling_settings, "directory", tmp_path)
+    monkeypatch.setattr(profiling_settings, "interval_ms", 1)
+    return tmp_path
+
+
+class TestProfilingMiddleware:
+    url = "/wallet"
+
+    async def call(self, headers: dict[str, str] | None = None) -> None:
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=ProfilingMiddleware(app=app)),
+            base_url="http://test",
+        ) as client:
+            await client.get(url=self.url, headers=headers)
+
+    @pytest.mark.asyncio
+    async def test_header(self, profiles_directory: Path) -> None:
+        await self.call(headers={profiling_settings.header: "1"})
+
+        (path,) = profiles_directory.iterdir()
+        assert path.name.startswith("request-GET_wallet-")
+        stacks = path.read_text()
+        assert f"{__name__}.busy" in stacks
+        assert WAITING_FRAME in stacks
+
+    @pytest.mark.asyncio
+    async def test_not_triggered(
+        self, profiles_directory: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(profiling_settings, "header_secret", "secret")
+
+        await self.call()
+        await self.call(headers={profiling_settings.header: "1"})
+
+        assert list(profiles_directory.iterdir()) == []
+
+
+class TestTaskiqProfilingMiddleware:
+    @staticmethod
+    def make_message(task_name: str, labels: dict) -> TaskiqMessage:
+        return TaskiqMessage(
+            task_id="task_id", task_name=task_name, labels=labels, args=[], kwargs={}
+        )
+
+    async def execute(self, message: TaskiqMessage) -> None:
+        middleware = TaskiqProfilingMiddleware()
+        middleware.pre_execute(message=message)
+        busy(duration=0.05)
+        await middleware.post_execute(
+            message=message,
+            result=TaskiqResult(is_err=False, return_value=None, execution_time=0),
+        )
+
+    @pytest.mark.asyncio
+    async def test_label(self, profiles_directory: Path) -> None:
+        await self.execute(
+            message=self.make_message(
+                task_name="save_wallets_info", labels={PROFILE_LABEL: True}
+            )
+        )
+
+        (path,) = profiles_directory.iterdir()
+        assert path.name.startswith("task-save_wallets_info-")
+        assert path.name.endswith("-task_id.folded")
+        assert f"{__name__}.busy" in path.read_text()
+
+    @pytest.mark.asyncio
+    async def test_other_task(self, profiles_directory: Path) -> None:
+        await self.execute(
+            message=self.make_message(task_name="other", labels={PROFILE_LABEL: True})
+        )
+
+        assert list(profiles_directory.iterdir()) == []
@@ -0,0 +1,106 @@
+import asyncio
+from functools import partial
+from unittest.mock import patch
+
+import httpx
+import pytest
+from prometheus_client import REGISTRY
+from taskiq import TaskiqMessage
+
+from middlewares import TaskiqAdminMiddleware
+from settings import broker_settings
+
+
+def get_events_count(outcome: str) -> float:
+    return (
+        REGISTRY.get_sample_value("taskiq_admin_events_total", {"outcome": outcome})
+        or 0
+    )
+
+
+def make_message(task_id: str) -> TaskiqMessage:
+    return TaskiqMessage(
+        task_id=task_id, task_name="task", labels={}, args=[], kwargs={}
+    )
+
+
+class TestTaskiqAdminMiddleware:
+    url = "http://admin"
+    events_count = 5
+    join_timeout = 1
+
+    @pytest.mark.asyncio
+    async def test_sends_events_in_background(self) -> None:
+        paths: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            paths.append(request.url.path)
+            return httpx.Response(status_code=200)
+
+        sent = get_events_count(outcome="sent")
+        middleware = TaskiqAdminMiddleware(
+            url=self.url, api_token=broker_settings.api_token
+        )
+        with patch(
+            "middlewares.taskiq_admin.httpx.AsyncClient",
+            partial(httpx.AsyncClient, transport=httpx.MockTransport(handler)),
+        ):
+            await middleware.startup()
+
+        for index in range(self.events_count):
+            await middleware.post_send(message=make_message(task_id=str(index)))
+        await middleware.shutdown()
+
+        assert sorted(paths) == [
+            f"/api/tasks/{index}/queued" for index in range(self.events_count)
+        ]
+        assert get_events_count(outcome="sent") - sent == self.events_count
+
+    @pytest.mark.asyncio
+    async def test_drops_events_when_full(self) -> None:
+        queue_size = 2
+        queued = get_events_count(outcome="queued")
+        dropped = get_events_count(outcome="dropped")
+
+        with (
+            patch.object(broker_settings, "admin_queue_size", queue_size),
+            patch.object(broker_settings, "admin_sample_rate", 1),
+        ):
+            middleware = TaskiqAdminMiddleware(
+                url=self.url, api_token=broker_settings.api_token
+            )
+            for index in range(self.events_count):
+                await middleware.post_send(message=make_message(task_id=str(index)))
+
+        assert get_events_count(outcome="queued") - queued == queue_size
+        assert (
+            get_events_count(outcome="dropped") - dropped
+            == self.events_count - queue_size
+        )
+
+    @pytest.mark.asyncio
+    async def test_keeps_draining_after_unexpected_error(self) -> None:
+        failed = get_events_count(outcome="failed")
+        sent = get_events_count(outcome="sent")
+        middleware = TaskiqAdminMiddleware(
+            url=self.url, api_token=broker_settings.api_token
+        )
+        with patch(
+            "middlewares.taskiq_admin.httpx.AsyncClient",
+            partial(
+                httpx.AsyncClient,
+                transport=httpx.MockTransport(lambda _: httpx.Response(200)),
+            ),
+        ):
+            await middleware.startup()
+
+        message = make_message(task_id="unserializable")
+        message.kwargs = {"value": object()}
+        await middleware.post_send(message=message)
+        await asyncio.wait_for(middleware._queue.join(), timeout=self.join_timeout)
+        for index in range(self.events_count):
+            await middleware.post_send(message=make_message(task_id=str(index)))
+        await middleware.shutdown()
+
+        assert get_events_count(outcome="failed") - failed == 1
+        assert get_events_count(outcome="sent") - sent == self.events_count
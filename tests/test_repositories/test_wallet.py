@@ -1,10 +1,22 @@
+from datetime import UTC, datetime, timedelta
 from decimal import Decimal
 
 import pytest
+from sqlalchemy.exc import MultipleResultsFound
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from db.models import Wallet
+from enums.count import CountStrategyEnum
 from enums.network import NetworkEnum
-from repositories import WalletRepository
+from enums.sort import SortDirectionEnum
+from exceptions.pagination import InvalidCursorError
+from repositories import (
+    WalletCounterRepository,
+    WalletLatestRepository,
+    WalletRepository,
+)
+from repositories.base import _count_cache
+from settings import api_settings, db_settings
 from tests.factories import WalletFactory
 
 
@@ -68,3 +80,461 @@ class TestGetAll:
         )
 
         assert len(items) == expected_items_count
+
+
+class TestBulkCreate:
+    items_count = 5
+
+    @pytest.mark.asyncio
+    async def test_success(
+        self, test_session: AsyncSession, repository: WalletRepository
+    ) -> None:
+        await repository.bulk_create(
+            session=test_session,
+            data=[
+                {
+                    "network": NetworkEnum.TRON,
+                    "address": f"address-{index}",
+                    "balance": Decimal(index),
+                }
+                for index in range(self.items_count)
+            ],
+        )
+
+        assert await repository.get_count(session=test_session) == self.items_count
+
+
+class TestUpdate:
+    items_count = 3
+    energy = 3000
+
+    @pytest.mark.asyncio
+    async def test_update_by(
+        self, test_session: AsyncSession, repository: WalletRepository
+    ) -> None:
+        wallet = await WalletFactory.create_async(session=test_session)
+
+        updated = await repository.update_by(
+            session=test_session, data={"energy": self.energy}, id=wallet.id
+        )
+
+        assert updated is not None
+        assert updated.energy == self.energy
+        assert updated.address == wallet.address
+
+    @pytest.mark.asyncio
+    async def test_update_by_missing(
+        self, test_session: AsyncSession, repository: WalletRepository
+    ) -> None:
+        updated = await repository.update_by(
+            session=test_session, data={"energy": self.energy}, id=1
+        )
+
+        assert updated is None
+
+    @pytest.mark.asyncio
+    async def test_update_where(
+        self, test_session: AsyncSession, repository: WalletRepository
+    ) -> None:
+        wallets = await WalletFactory.create_batch_async(
+            session=test_session, size=self.items_count
+        )
+
+        count = await repository.update_where(
+            session=test_session,
+            data={"energy": self.energy},
+            id__in=[wallet.id for wallet in wallets[1:]],
+        )
+
+        assert count == self.items_count - 1
+        assert (
+            await repository.get_count(session=test_session, energy=self.energy)
+            == self.items_count - 1
+        )
+
+
+class TestDelete:
+    items_count = 3
+
+    @pytest.mark.asyncio
+    async def test_delete_by(
+        self, test_session: AsyncSession, repository: WalletRepository
+    ) -> None:
+        wallet = await WalletFactory.create_async(session=test_session)
+
+        assert await repository.delete_by(session=test_session, id=wallet.id)
+        assert not await repository.delete_by(session=test_session, id=wallet.id)
+
+    @pytest.mark.asyncio
+    async def test_delete_where(
+        self, test_session: AsyncSession, repository: WalletRepository
+    ) -> None:
+        wallets = await WalletFactory.create_batch_async(
+            session=test_session, size=self.items_count
+        )
+
+        count = await repository.delete_where(
+            session=test_session, id__gt=wallets[0].id
+        )
+
+        assert count == self.items_count - 1
+        assert await repository.get_count(session=test_session) == 1
+
+    @pytest.mark.asyncio
+    async def test_delete_by_multiple(
+        self, test_session: AsyncSession, repository: WalletRepository
+    ) -> None:
+        await WalletFactory.create_batch_async(
+            session=test_session, size=self.items_count
+        )
+
+        with pytest.raises(MultipleResultsFound):
+            await repository.delete_by(session=test_session, network=NetworkEnum.TRON)
+
+        assert await repository.get_count(session=test_session) == self.items_count
+
+    @pytest.mark.asyncio
+    async def test_counters_decremented(
+        self,
+        test_session: AsyncSession,
+        repository: WalletRepository,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setattr(
+            api_settings, "history_count_strategy", CountStrategyEnum.COUNTER
+        )
+        await repository.bulk_create(
+            session=test_session,
+            data=[
+                {"network": NetworkEnum.TRON, "address": f"address-{index}"}
+                for index in range(self.items_count)
+            ],
+        )
+
+        count = await repository.delete_where(
+            session=test_session, network=NetworkEnum.TRON
+        )
+        total = await repository.get_total(
+            session=test_session,
+            strategy=CountStrategyEnum.COUNTER,
+            network=NetworkEnum.TRON,
+        )
+
+        assert count == self.items_count
+        assert total == (0, True)
+        assert await repository.delete_where(session=test_session) == 0
+
+
+class TestBulkUpsert:
+    network = NetworkEnum.TRON
+    address = "TR7NHqjeKQxGTCi8q8ZY4pL8otSzgjLj6t"
+    other_address = "TLa2f6VPqDgRE67v1736s7bJ8Ray5wYjU7"
+    energy = 2000
+    updated_at = datetime(2026, 1, 1, tzinfo=UTC)
+
+    @pytest.mark.asyncio
+    async def test_success(self, test_session: AsyncSession) -> None:
+        repository = WalletLatestRepository()
+        await repository.create(
+            session=test_session,
+            data={
+                "network": self.network,
+                "address": self.address,
+                "energy": 1,
+                "updated_at": self.updated_at,
+            },
+        )
+
+        instances = await repository.bulk_upsert(
+            session=test_session,
+            data=[
+                {
+                    "network": self.network,
+                    "address": address,
+                    "energy": self.energy,
+                    "updated_at": self.updated_at,
+                }
+                for address in (self.address, self.other_address, self.address)
+            ],
+            index_elements=["network", "address"],
+        )
+
+        assert sorted(instance.address for instance in instances) == sorted(
+            [self.address, self.other_address]
+        )
+        assert all(instance.energy == self.energy for instance in instances)
+        assert await repository.get_count(session=test_session) == len(instances)
+
+
+class TestLatestState:
+    network = NetworkEnum.TRON
+    address = "TR7NHqjeKQxGTCi8q8ZY4pL8otSzgjLj6t"
+    balance = Decimal("100.123456")
+    energy = 2000
+
+    @pytest.mark.asyncio
+    async def test_upserted_on_create(
+        self, test_session: AsyncSession, repository: WalletRepository
+    ) -> None:
+        await repository.create(
+            session=test_session,
+            data={"network": self.network, "address": self.address, "energy": 1},
+        )
+        await repository.bulk_create(
+            session=test_session,
+            data=[
+                {"network": self.network, "address": self.address, "energy": 2},
+                {
+                    "network": self.network,
+                    "address": self.address,
+                    "balance": self.balance,
+                    "energy": self.energy,
+                },
+            ],
+        )
+        await repository.create(
+            session=test_session,
+            data={"network": self.network, "address": self.address, "balance": None},
+        )
+
+        latest = await WalletLatestRepository().get_by(
+            session=test_session, network=self.network, address=self.address
+        )
+
+        assert latest is not None
+        assert latest.balance == self.balance
+        assert latest.energy == self.energy
+
+    @pytest.mark.asyncio
+    async def test_not_replaced_by_earlier_observation(
+        self, test_session: AsyncSession, repository: WalletRepository
+    ) -> None:
+        observed_at = datetime.now(UTC)
+
+        for created_at, energy in (
+            (observed_at, self.energy),
+            (observed_at - timedelta(minutes=5), 1),
+        ):
+            await repository.create(
+                session=test_session,
+                data={
+                    "network": self.network,
+                    "address": self.address,
+                    "energy": energy,
+                    "created_at": created_at,
+                },
+            )
+
+        latest = await WalletLatestRepository().get_by(
+            session=test_session, network=self.network, address=self.address
+        )
+
+        assert latest is not None
+        assert latest.energy == self.energy
+        assert latest.updated_at.replace(tzinfo=UTC) == observed_at
+
+
+class TestGetAllByCursor:
+    items_count = 5
+    limit = 2
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("sort_direction", list(SortDirectionEnum))
+    async def test_pages_follow_each_other(
+        self,
+        test_session: AsyncSession,
+        repository: WalletRepository,
+        sort_direction: SortDirectionEnum,
+    ) -> None:
+        await WalletFactory.create_batch_async(
+            session=test_session, size=self.items_count
+        )
+
+        items = await repository.get_all(
+            session=test_session,
+            offset=0,
+            limit=self.limit,
+            sort_by="id",
+            sort_direction=sort_direction,
+        )
+        while (
+            cursor := repository.encode_cursor(
+                instance=items[-1], sort_by="id", sort_direction=sort_direction
+            )
+        ) and len(items) < self.items_count:
+            items += await repository.get_all_by_cursor(
+                session=test_session,
+                cursor=cursor,
+                limit=self.limit,
+                sort_by="id",
+                sort_direction=sort_direction,
+            )
+
+        ids = [item.id for item in items]
+        assert ids == sorted(ids, reverse=sort_direction == SortDirectionEnum.DESC)
+        assert len(set(ids)) == self.items_count
+
+    @pytest.mark.asyncio
+    async def test_invalid_cursor(
+        self, test_session: AsyncSession, repository: WalletRepository
+    ) -> None:
+        with pytest.raises(InvalidCursorError):
+            await repository.get_all_by_cursor(
+                session=test_session, cursor="invalid", limit=self.limit
+            )
+
+
+class TestGetTotal:
+    items_count = 3
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("strategy", "expected_exact"),
+        [
+            (CountStrategyEnum.EXACT, True),
+            (CountStrategyEnum.CACHED, False),
+            (CountStrategyEnum.ESTIMATED, True),
+            (CountStrategyEnum.COUNTER, True),
+        ],
+    )
+    async def test_get_total(
+        self,
+        test_session: AsyncSession,
+        repository: WalletRepository,
+        strategy: CountStrategyEnum,
+        expected_exact: bool,
+    ) -> None:
+        await repository.bulk_create(
+            session=test_session,
+            data=[
+                {"network": NetworkEnum.TRON, "address": f"address-{index}"}
+                for index in range(self.items_count - 1)
+            ],
+        )
+        await repository.create(
+            session=test_session,
+            data={"network": NetworkEnum.TRON, "address": "address"},
+        )
+
+        count, exact = await repository.get_total(
+            session=test_session, strategy=strategy, network=NetworkEnum.TRON
+        )
+
+        assert count == self.items_count
+        assert exact is expected_exact
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("strategy", "expected_counter"),
+        [(CountStrategyEnum.COUNTER, items_count), (CountStrategyEnum.EXACT, 0)],
+    )
+    async def test_counters_maintained_with_counter_strategy(
+        self,
+        test_session: AsyncSession,
+        repository: WalletRepository,
+        monkeypatch: pytest.MonkeyPatch,
+        strategy: CountStrategyEnum,
+        expected_counter: int,
+    ) -> None:
+        monkeypatch.setattr(api_settings, "history_count_strategy", strategy)
+
+        await repository.bulk_create(
+            session=test_session,
+            data=[
+                {"network": NetworkEnum.TRON, "address": f"address-{index}"}
+                for index in range(self.items_count)
+            ],
+        )
+
+        counter = await WalletCounterRepository().get_sum(session=test_session)
+
+        assert counter == expected_counter
+
+    @pytest.mark.asyncio
+    async def test_cached_counts_bounded(
+        self,
+        test_session: AsyncSession,
+        repository: WalletRepository,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setattr(db_settings, "count_cache_size", 1)
+        _count_cache.clear()
+
+        for address in ("address-0", "address-1"):
+            await repository.get_total(
+                session=test_session,
+                strategy=CountStrategyEnum.CACHED,
+                address=address,
+            )
+
+        assert list(_count_cache) == [(Wallet, ("address", "address-1"))]
+
+
+class TestGetAllRows:
+    items_count = 5
+    limit = 2
+
+    @pytest.mark.asyncio
+    async def test_same_as_instances(
+        self, test_session: AsyncSession, repository: WalletRepository
+    ) -> None:
+        await WalletFactory.create_batch_async(
+            session=test_session, size=self.items_count
+        )
+
+        instances = await repository.get_all(
+            session=test_session, offset=0, limit=self.items_count
+        )
+        rows = await repository.get_all_rows(
+            session=test_session, offset=0, limit=self.items_count
+        )
+
+        assert [row._asdict() for row in rows] == [
+            {column: getattr(instance, column) for column in row._fields}
+            for instance, row in zip(instances, rows, strict=True)
+        ]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("sort_direction", list(SortDirectionEnum))
+    async def test_pages_follow_each_other(
+        self,
+        test_session: AsyncSession,
+        repository: WalletRepository,
+        sort_direction: SortDirectionEnum,
+    ) -> None:
+        await WalletFactory.create_batch_async(
+            session=test_session, size=self.items_count
+        )
+
+        rows = list(
+            await repository.get_all_rows(
+                session=test_session,
+                offset=0,
+                limit=self.limit,
+                sort_by="id",
+                sort_direction=sort_direction,
+            )
+        )
+        instance = await repository.get_by(session=test_session, id=rows[-1].id)
+        assert repository.encode_cursor(
+            instance=rows[-1], sort_by="id", sort_direction=sort_direction
+        ) == repository.encode_cursor(
+            instance=instance, sort_by="id", sort_direction=sort_direction
+        )
+
+        while (
+            cursor := repository.encode_cursor(
+                instance=rows[-1], sort_by="id", sort_direction=sort_direction
+            )
+        ) and len(rows) < self.items_count:
+            rows += await repository.get_all_rows_by_cursor(
+                session=test_session,
+                cursor=cursor,
+                limit=self.limit,
+                sort_by="id",
+                sort_direction=sort_direction,
+            )
+
+        ids = [row.id for row in rows]
+        assert ids == sorted(ids, reverse=sort_direction == SortDirectionEnum.DESC)
+        assert len(set(ids)) == self.items_count
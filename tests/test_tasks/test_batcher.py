@@ -0,0 +1,48 @@
+import asyncio
+
+import pytest
+
+from tasks.batcher import MicroBatcher
+
+
+class TestAdd:
+    max_size = 3
+
+    @pytest.mark.asyncio
+    async def test_flushes_when_full(self) -> None:
+        batches: list[list[int]] = []
+
+        async def flush(items: list[int]) -> None:
+            batches.append(items)
+
+        batcher = MicroBatcher(flush=flush, max_size=self.max_size, max_delay=10)
+
+        await asyncio.gather(*(batcher.add(item=item) for item in range(6)))
+
+        assert batches == [[0, 1, 2], [3, 4, 5]]
+
+    @pytest.mark.asyncio
+    async def test_flushes_after_delay(self) -> None:
+        batches: list[list[int]] = []
+
+        async def flush(items: list[int]) -> None:
+            batches.append(items)
+
+        batcher = MicroBatcher(flush=flush, max_size=self.max_size, max_delay=0.01)
+
+        await asyncio.gather(batcher.add(item=1), batcher.add(item=2))
+
+        assert batches == [[1, 2]]
+
+    @pytest.mark.asyncio
+    async def test_propagates_flush_error(self) -> None:
+        async def flush(items: list[int]) -> None:
+            raise RuntimeError
+
+        batcher = MicroBatcher(flush=flush, max_size=self.max_size, max_delay=0.01)
+
+        results = await asyncio.gather(
+            batcher.add(item=1), batcher.add(item=2), return_exceptions=True
+        )
+
+        assert all(isinstance(result, RuntimeError) for result in results)
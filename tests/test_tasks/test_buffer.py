@@ -0,0 +1,122 @@
+import asyncio
+
+import pytest
+from prometheus_client import REGISTRY
+
+from tasks.buffer import WriteBehindBuffer
+
+
+def get_sample_value(name: str, labels: dict[str, str]) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0
+
+
+class TestWriteBehindBuffer:
+    name = "test"
+    published_labels = {"buffer": "test", "outcome": "published"}
+    batch_size = 3
+    items_count = 7
+    full_items_count = 3
+
+    @pytest.mark.asyncio
+    async def test_publishes_in_batches(self) -> None:
+        published = get_sample_value("write_buffer_items_total", self.published_labels)
+        batches: list[list[int]] = []
+
+        async def publish(items: list[int]) -> None:
+            batches.append(items)
+
+        buffer = WriteBehindBuffer(
+            publish=publish,
+            max_size=self.items_count,
+            batch_size=self.batch_size,
+            name=self.name,
+            max_delay=0.01,
+            retry_attempts=0,
+            retry_delay=0,
+        )
+
+        for item in range(self.items_count):
+            await buffer.add(item=item)
+        assert batches == []
+
+        await buffer.close(timeout=1)
+
+        assert batches == [[0, 1, 2], [3, 4, 5], [6]]
+        assert (
+            get_sample_value("write_buffer_items_total", self.published_labels)
+            - published
+            == self.items_count
+        )
+
+    @pytest.mark.asyncio
+    async def test_retries_failed_publish(self) -> None:
+        published = get_sample_value("write_buffer_items_total", self.published_labels)
+        attempts: list[list[int]] = []
+
+        async def publish(items: list[int]) -> None:
+            attempts.append(items)
+            if len(attempts) == 1:
+                raise ConnectionError
+
+        buffer = WriteBehindBuffer(
+            publish=publish,
+            max_size=1,
+            batch_size=1,
+            name=self.name,
+            max_delay=0,
+            retry_attempts=1,
+            retry_delay=0,
+        )
+
+        await buffer.add(item=1)
+        await buffer.close(timeout=1)
+
+        assert attempts == [[1], [1]]
+        assert (
+            get_sample_value("write_buffer_items_total", self.published_labels)
+            - published
+            == 1
+        )
+
+    @pytest.mark.asyncio
+    async def test_waits_when_full(self) -> None:
+        published = get_sample_value("write_buffer_items_total", self.published_labels)
+        backpressure = get_sample_value(
+            "write_buffer_backpressure_total", {"buffer": self.name}
+        )
+        released = asyncio.Event()
+
+        async def publish(items: list[int]) -> None:
+            await released.wait()
+
+        buffer = WriteBehindBuffer(
+            publish=publish,
+            max_size=1,
+            batch_size=1,
+            name=self.name,
+            max_delay=0,
+            retry_attempts=0,
+            retry_delay=0,
+        )
+
+        await buffer.add(item=1)
+        await asyncio.sleep(0.01)
+        await buffer.add(item=2)
+        adding = asyncio.create_task(buffer.add(item=3))
+        await asyncio.sleep(0.01)
+        assert not adding.done()
+
+        released.set()
+        await adding
+        await buffer.close(timeout=1)
+
+        assert (
+            get_sample_value("write_buffer_backpressure_total", {"buffer": self.name})
+            - backpressure
+            == 1
+        )
+        assert (
+            get_sample_value("write_buffer_items_total", self.published_labels)
+            - published
+            == self.full_items_count
+        )
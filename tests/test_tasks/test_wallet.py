@@ -0,0 +1,29 @@
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from enums.network import NetworkEnum
+from repositories import WalletRepository
+from schemas import WalletInfo
+from tasks.wallet import save_wallet_info
+
+
+class TestSaveWalletInfo:
+    network = NetworkEnum.TRON
+    address = "TR7NHqjeKQxGTCi8q8ZY4pL8otSzgjLj6t"
+
+    @pytest.mark.asyncio
+    async def test_forwards_to_batch_save(self, test_session: AsyncSession) -> None:
+        await save_wallet_info(
+            network=self.network,
+            wallet_info=WalletInfo(
+                network=self.network, address=self.address
+            ).model_dump(mode="json"),
+            session=test_session,
+        )
+
+        assert (
+            await WalletRepository().get_count(
+                session=test_session, address=self.address
+            )
+            == 1
+        )
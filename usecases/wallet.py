@@ -1,75 +1,331 @@
-from sqlalchemy.ext.asyncio import AsyncSession
+import asyncio
+import csv
+import io
+import logging
+from contextlib import suppress
+from datetime import UTC, datetime, timedelta
+from http import HTTPStatus
+from typing import Any, AsyncIterator, TypeVar
 
-from explorers.base import BaseExplorer
-from repositories import WalletRepository
+from pydantic import TypeAdapter
+from pydantic_core import to_json, to_jsonable_python
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from enums.count import CountStrategyEnum
+from enums.export import ExportFormatEnum
+from enums.network import NetworkEnum
+from exceptions.explorers import ExplorerError, InvalidAddressError
+from explorers.registry import ExplorerRegistry
+from repositories import WalletLatestRepository, WalletRepository
 from schemas import (
     PaginatedResponse,
-    SortingAndPaginationParams,
+    WalletBatchItem,
+    WalletBatchResponse,
+    WalletExportParams,
+    WalletFilterParams,
+    WalletHistoryParams,
     WalletInfo,
+    WalletLatestResponse,
     WalletResponse,
 )
+from settings import api_settings
+from settings.explorer import explorer_settings
+
+logger = logging.getLogger(__name__)
+
+EXPORT_FIELDS = list(WalletResponse.model_fields)
+
+WALLET_RESPONSES_ADAPTER = TypeAdapter(list[WalletResponse])
+
+FilterParams = TypeVar("FilterParams", bound=WalletFilterParams)
 
 
 class WalletUsecase:
-    def __init__(self, explorer: BaseExplorer):
+    def __init__(self, explorers: ExplorerRegistry):
         self._wallet_repository = WalletRepository()
-        self._explorer = explorer
+        self._wallet_latest_repository = WalletLatestRepository()
+        self._explorers = explorers
 
-    async def get_wallet_info(self, address: str) -> WalletInfo:
+    async def get_wallet_info(self, network: NetworkEnum, address: str) -> WalletInfo:
         """Get wallet info from explorer.
 
         Args:
+            network: The network of the wallet.
             address: The address of the wallet.
 
         Returns:
             The wallet info.
 
         Raises:
-            InvalidAddressException: If the address is invalid.
+            InvalidAddressError: If the address is invalid.
 
         """
-        self._explorer.check_is_valid_address(address=address)
-        return await self._explorer.get_wallet_info(address=address)
+        explorer = self._explorers.get(network=network)
+        address = explorer.normalize_address(address=address)
+        return await explorer.get_wallet_info(address=address)
+
+    async def get_wallets_info(
+        self, network: NetworkEnum, addresses: list[str]
+    ) -> WalletBatchResponse:
+        """Get the info of many wallets from explorer.
+
+        All the addresses are normalized before any lookup, so different forms
+        of an address are looked up once, and lookups run with bounded
+        concurrency. Failures are reported per address.
+
+        Args:
+            network: The network of the wallets.
+            addresses: The addresses of the wallets.
+
+        Returns:
+            The lookup result of each distinct address, in request order.
 
-    async def save_wallet_info(
-        self, session: AsyncSession, wallet_info: WalletInfo
+        """
+        explorer = self._explorers.get(network=network)
+        semaphore = asyncio.Semaphore(explorer_settings.batch_concurrency)
+        normalized = explorer.normalize_addresses(addresses=addresses)
+        unique_addresses = list(
+            dict.fromkeys(normalized[address] or address for address in addresses)
+        )
+        items: dict[str, WalletBatchItem] = {
+            address: WalletBatchItem(
+                address=address, error=InvalidAddressError().message
+            )
+            for address, canonical in normalized.items()
+            if canonical is None
+        }
+
+        async def fetch(address: str) -> WalletBatchItem:
+            async with semaphore:
+                try:
+                    result = await explorer.get_wallet_info(address=address)
+                except ExplorerError as err:
+                    return WalletBatchItem(address=address, error=err.message)
+                except Exception:
+                    logger.exception("Failed to get wallet info of %s", address)
+                    return WalletBatchItem(
+                        address=address, error=ExplorerError().message
+                    )
+
+            return WalletBatchItem(address=address, result=result)
+
+        for item in await asyncio.gather(
+            *(fetch(address) for address in unique_addresses if address not in items)
+        ):
+            items[item.address] = item
+
+        return WalletBatchResponse(
+            results=[items[address] for address in unique_addresses]
+        )
+
+    async def get_latest_wallet_info(
+        self, session: AsyncSession, network: NetworkEnum, address: str, max_age: int
+    ) -> WalletLatestResponse | None:
+        """Get the latest stored state of a wallet from database.
+
+        Args:
+            session: The database session.
+            network: The network of the wallet.
+            address: The address of the wallet.
+            max_age: The maximum age of the state in seconds.
+
+        Returns:
+            The latest state, or None if it is missing or older than max age.
+
+        Raises:
+            InvalidAddressError: If the address is invalid.
+
+        """
+        address = self._explorers.get(network=network).normalize_address(
+            address=address
+        )
+        latest = await self._wallet_latest_repository.get_by(
+            session=session,
+            network=network,
+            address=address,
+            updated_at__gte=datetime.now(UTC) - timedelta(seconds=max_age),
+        )
+
+        return None if latest is None else WalletLatestResponse.model_validate(latest)
+
+    async def save_wallets_info(
+        self, session: AsyncSession, wallets_info: list[WalletInfo]
     ) -> None:
-        """Save wallet info to database.
+        """Save the info of many wallets to database in one insert.
 
         Args:
             session: The database session.
-            wallet_info: The wallet info.
+            wallets_info: The wallets info.
 
         """
-        await self._wallet_repository.create(
-            session=session, data=wallet_info.model_dump()
+        await self._wallet_repository.bulk_create(
+            session=session,
+            data=[
+                self._get_snapshot(wallet_info=wallet_info)
+                for wallet_info in wallets_info
+            ],
         )
 
+    @staticmethod
+    def _get_snapshot(wallet_info: WalletInfo) -> dict[str, Any]:
+        """Get the stored snapshot of wallet info.
+
+        The snapshot is dated by the time the state was observed, not by the
+        time it is written, which can be much later when it was cached or
+        buffered.
+
+        Args:
+            wallet_info: The wallet info.
+
+        Returns:
+            The snapshot data.
+
+        """
+        return {
+            **wallet_info.model_dump(exclude={"missing_fields", "fetched_at"}),
+            "created_at": wallet_info.fetched_at,
+        }
+
     async def get_history(
-        self, session: AsyncSession, data: SortingAndPaginationParams
+        self,
+        session: AsyncSession,
+        data: WalletHistoryParams,
+        count_strategy: CountStrategyEnum = CountStrategyEnum.EXACT,
     ) -> PaginatedResponse[WalletResponse]:
         """Get wallet history from database.
 
         Args:
             session: The database session.
-            data: The sorting and pagination params.
+            data: The filtering, sorting and pagination params, a cursor
+                switches to keyset pagination.
+            count_strategy: The strategy used to count the wallet history.
 
         Returns:
             The wallet history.
 
+        Raises:
+            InvalidAddressError: If the address filter is invalid.
+            InvalidCursorError: If the cursor does not match the sorting.
+
         """
-        return PaginatedResponse(
-            results=[
-                WalletResponse.model_validate(item)
-                for item in await self._wallet_repository.get_all(
-                    session=session,
-                    offset=data.offset,
-                    limit=data.limit,
+        data = self._normalize_filter_address(data=data)
+
+        # Plain rows are validated as a whole, no model instance is built.
+        if data.cursor is None:
+            rows = await self._wallet_repository.get_all_rows(
+                session=session,
+                offset=data.offset,
+                limit=data.limit,
+                sort_by=data.sort_by,
+                sort_direction=data.sort_direction,
+                **data.filters,
+            )
+        else:
+            rows = await self._wallet_repository.get_all_rows_by_cursor(
+                session=session,
+                cursor=data.cursor,
+                limit=data.limit,
+                sort_by=data.sort_by,
+                sort_direction=data.sort_direction,
+                **data.filters,
+            )
+
+        count, count_exact = await self._wallet_repository.get_total(
+            session=session, strategy=count_strategy, **data.filters
+        )
+
+        return PaginatedResponse[WalletResponse](
+            results=WALLET_RESPONSES_ADAPTER.validate_python(
+                [row._asdict() for row in rows]
+            ),
+            count=count,
+            count_exact=count_exact,
+            page=data.page,
+            limit=data.limit,
+            next_cursor=(
+                self._wallet_repository.encode_cursor(
+                    instance=rows[-1],
                     sort_by=data.sort_by,
                     sort_direction=data.sort_direction,
                 )
-            ],
-            count=await self._wallet_repository.get_count(session=session),
-            page=data.page,
-            limit=data.limit,
+                if len(rows) == data.limit
+                else None
+            ),
         )
+
+    def export_history(
+        self,
+        session_maker: async_sessionmaker[AsyncSession],
+        data: WalletExportParams,
+    ) -> AsyncIterator[str]:
+        """Export wallet history from database as NDJSON or CSV.
+
+        The params are checked before the stream starts, while the session is
+        opened by the stream itself, so it lives as long as the response body.
+
+        Args:
+            session_maker: The database session maker.
+            data: The filtering and format params.
+
+        Returns:
+            The chunks of the export.
+
+        Raises:
+            InvalidAddressError: If the address filter is invalid.
+
+        """
+        return self._export_history(
+            session_maker=session_maker,
+            data=self._normalize_filter_address(data=data),
+        )
+
+    def _normalize_filter_address(self, data: FilterParams) -> FilterParams:
+        """Get the filter params with the address in its stored form.
+
+        Without a network filter, the address is normalized by the first
+        explorer accepting it.
+
+        Args:
+            data: The filter params.
+
+        Returns:
+            The filter params with the normalized address.
+
+        Raises:
+            InvalidAddressError: If no explorer accepts the address.
+
+        """
+        if data.address is None:
+            return data
+
+        for network in [data.network] if data.network else NetworkEnum:
+            with suppress(InvalidAddressError):
+                address = self._explorers.get(network=network).normalize_address(
+                    address=data.address
+                )
+                return data.model_copy(update={"address": address})
+
+        raise InvalidAddressError(status_code=HTTPStatus.UNPROCESSABLE_ENTITY)
+
+    async def _export_history(
+        self,
+        session_maker: async_sessionmaker[AsyncSession],
+        data: WalletExportParams,
+    ) -> AsyncIterator[str]:
+        async with session_maker() as session:
+            if data.format == ExportFormatEnum.CSV:
+                yield ",".join(EXPORT_FIELDS) + "\r\n"
+
+            async for rows in self._wallet_repository.stream_all(
+                session=session,
+                batch_size=api_settings.export_batch_size,
+                **data.filters,
+            ):
+                items = to_jsonable_python([row._asdict() for row in rows])
+
+                if data.format == ExportFormatEnum.CSV:
+                    buffer = io.StringIO()
+                    csv.DictWriter(buffer, fieldnames=EXPORT_FIELDS).writerows(items)
+                    yield buffer.getvalue()
+                else:
+                    yield "".join(to_json(item).decode() + "\n" for item in items)